@@ -17,6 +17,23 @@ load_dotenv()
 class NotionV3Setup:
     """Helper class for setting up Notion v3 schema"""
     
+    # Required v3 fields and their Notion property types
+    REQUIRED_FIELDS = {
+        "Title": "title",
+        "Signal": "select",
+        "Confidence": "number",
+        "ETFs": "multi_select",
+        "Sector": "select",
+        "Timestamp": "date",
+        "Reasoning": "rich_text",
+        "Status": "select",
+        "If-Then Scenario": "rich_text",
+        "Contradictory Signals": "rich_text",
+        "Uncertainty Metric": "rich_text",
+        "Position Risk Bracket": "rich_text",
+        "Price Anchors": "rich_text",
+    }
+    
     def __init__(self):
         self.notion_token = os.getenv("NOTION_TOKEN")
         self.signals_db_id = os.getenv("SIGNALS_DATABASE_ID")
@@ -94,27 +111,10 @@ class NotionV3Setup:
             database = response.json()
             properties = database.get("properties", {})
             
-            # Required v3 fields
-            required_fields = {
-                "Title": "title",
-                "Signal": "select",
-                "Confidence": "number",
-                "ETFs": "multi_select",
-                "Sector": "select",
-                "Timestamp": "date",
-                "Reasoning": "rich_text",
-                "Status": "select",
-                "If-Then Scenario": "rich_text",
-                "Contradictory Signals": "rich_text",
-                "Uncertainty Metric": "rich_text",
-                "Position Risk Bracket": "rich_text",
-                "Price Anchors": "rich_text",
-            }
-            
             missing_fields = []
             incorrect_types = []
             
-            for field_name, expected_type in required_fields.items():
+            for field_name, expected_type in self.REQUIRED_FIELDS.items():
                 if field_name not in properties:
                     missing_fields.append(field_name)
                 elif properties[field_name]["type"] != expected_type:
@@ -208,8 +208,8 @@ class NotionV3Setup:
             print(f"❌ Error testing signal creation: {e}")
             return False
 
-def main():
-    """Main function"""
+def main(argv=None):
+    """Main function; returns a non-zero exit status when validation or the test fails"""
     import argparse
     
     parser = argparse.ArgumentParser(description="MarketMan Notion v3 Schema Setup")
@@ -217,19 +217,18 @@ def main():
     parser.add_argument("--test", action="store_true", help="Test signal creation")
     parser.add_argument("--setup", action="store_true", help="Show setup instructions")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     setup = NotionV3Setup()
     
-    if args.validate:
-        if setup.validate_database_schema():
-            if args.test:
-                setup.test_signal_creation()
-    elif args.test:
-        if setup.validate_database_schema():
-            setup.test_signal_creation()
+    if args.validate or args.test:
+        if not setup.validate_database_schema():
+            return 1
+        if args.test and not setup.test_signal_creation():
+            return 1
     else:
         setup.print_setup_instructions()
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
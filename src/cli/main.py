@@ -162,8 +162,8 @@ def handle_signals(args: argparse.Namespace) -> int:
     try:
         if args.action == "run":
             print("Running signal processing...")
-            analyzer = NewsAnalyzer()
-            analyzer.process_alerts()
+            with NewsAnalyzer() as analyzer:
+                analyzer.process_alerts()
             print("✅ Signal processing completed")
             return 0
         elif args.action == "status":
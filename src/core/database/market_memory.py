@@ -111,7 +111,12 @@ class MarketMemory:
 
     def detect_patterns(self, etf_symbol: str = None) -> List[Dict]:
         """Detect patterns like consecutive bearish/bullish signals"""
+        return self.detect_patterns_bulk([etf_symbol] if etf_symbol else None)
+
+    def detect_patterns_bulk(self, etf_symbols: Optional[List[str]] = None) -> List[Dict]:
+        """Detect patterns for several ETFs from a single read of recent signals"""
         patterns = []
+        wanted = set(etf_symbols) if etf_symbols is not None else None
 
         try:
             recent_signals = self.get_recent_signals(days=14)  # Look back 2 weeks
@@ -120,7 +125,7 @@ class MarketMemory:
             etf_signals = {}
             for signal in recent_signals:
                 for etf in signal["etfs"]:
-                    if etf_symbol and etf != etf_symbol:
+                    if wanted is not None and etf not in wanted:
                         continue
                     if etf not in etf_signals:
                         etf_signals[etf] = []
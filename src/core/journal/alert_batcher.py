@@ -394,7 +394,8 @@ class AlertBatcher:
         best_alert = max(alerts, key=lambda a: a.confidence)
         notion_url = best_alert.article_url if best_alert.article_url else None
 
-        # Send notification with retry logic
+        # Send notification with retry logic. The batch is already a digest, so it is not handed
+        # to Pushover's throttle digest: alerts stay pending unless this send really succeeds
         max_retries = 3
         retry_delay = 2  # seconds
         for attempt in range(1, max_retries + 1):
@@ -404,6 +405,7 @@ class AlertBatcher:
                 priority=priority,
                 url=notion_url,
                 url_title="View Analysis" if notion_url else None,
+                queue_if_throttled=False,
             )
             if success:
                 break
@@ -13,11 +13,12 @@ from .etf_signal_engine import (
     generate_tactical_explanation,
     categorize_etfs_by_sector,
 )
-from .news_signal_orchestrator import NewsAnalyzer
+from .news_signal_orchestrator import NewsAnalyzer, BROAD_TECH_ETFS
 
 __all__ = [
     "analyze_thematic_etf_news",
     "generate_tactical_explanation",
     "categorize_etfs_by_sector",
     "NewsAnalyzer",
+    "BROAD_TECH_ETFS",
 ]
@@ -4,10 +4,17 @@ Analyzes Google Alerts for thematic ETF opportunities and creates consolidated r
 """
 import os
 import sys
+import json
+import tempfile
+import time
+import itertools
 import logging
 from datetime import datetime
+from pathlib import Path
 import pprint
 
+import numpy as np
+
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -18,17 +25,15 @@ from core.journal.alert_batcher import queue_alert, process_alert_queue, BatchSt
 # Import refactored modules
 from core.signals.etf_signal_engine import (
     analyze_thematic_etf_news,
-    generate_tactical_explanation,
     categorize_etfs_by_sector,
 )
 from src.core.ingestion.market_data import get_market_snapshot, get_etf_prices, adjust_price_anchors_for_splits
 from integrations.gmail_poller import GmailPoller
 from integrations.notion_reporter import NotionReporter
 from core.journal.report_consolidator import create_consolidated_signal_report
-from src.core.utils.config_loader import get_config
+from src.core.utils.config_loader import get_config, get_settings
 from core.ingestion.technicals import get_batch_technicals
 from core.signals.pattern_recognizer import create_pattern_recognizer
-# from src.core.ingestion.news_orchestrator import create_news_orchestrator
 
 # Set up logging with debug control
 DEBUG_MODE = os.getenv("DEBUG", "false").lower() == "true"
@@ -45,73 +50,205 @@ BATCH_STRATEGY_MAP = {
 }
 CURRENT_BATCH_STRATEGY = BATCH_STRATEGY_MAP.get(ALERT_STRATEGY, BatchStrategy.SMART_BATCH)
 
+
+def _dbg(msg, *objects):
+    """Log a pretty-printed debug dump, skipping pformat entirely unless DEBUG_MODE is on"""
+    if DEBUG_MODE and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *(pprint.pformat(obj) for obj in objects))
+
+
+# Broad-market funds only used when no specialized ETF qualifies
+BROAD_TECH_ETFS = frozenset({"XLK", "QQQ", "VGT", "FTEC", "IYW", "VTI", "SPY"})
+_BROAD_TECH_ETFS_ARRAY = np.array(sorted(BROAD_TECH_ETFS), dtype=object)
+
+# Structured (SoA) layout for per-ETF aggregate scores
+ETF_SCORE_DTYPE = np.dtype(
+    [
+        ("etf", object),
+        ("mentions", np.int64),
+        ("cumulative_confidence", np.float64),
+        ("avg_confidence", np.float64),
+        ("first_seen", np.int64),
+    ]
+)
+
 # Initialize MarketMemory for contextual tracking
 memory = MarketMemory()
 
+# Technicals/pattern cache - technicals move slowly relative to the polling cadence,
+# so reuse results for the same ETF universe until the TTL expires (MM_TECH_TTL seconds)
+TECH_CACHE_TTL = int(os.getenv("MM_TECH_TTL", "900"))
+# Relative paths resolve against the project root so the cache is shared regardless of CWD
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+TECH_CACHE_FILE = PROJECT_ROOT / os.getenv("MM_TECH_CACHE_FILE", "data/cache/technicals_cache.json")
+_tech_cache = {}
 
-def filter_high_conviction_etfs(session_analyses, min_mentions=2):
-    """Filter ETFs that appear in multiple analyses and rank by cumulative confidence"""
-    etf_scores = {}
 
-    # Calculate cumulative scores for each ETF
+def _load_tech_cache_entry(key):
+    """Load a cached (timestamp, technicals, pattern_results) entry from disk"""
+    try:
+        with open(TECH_CACHE_FILE, "r") as f:
+            entry = json.load(f).get(",".join(key))
+    except (OSError, ValueError):
+        return None
+    return tuple(entry) if entry else None
+
+
+def _save_tech_cache_entry(key, entry):
+    """Persist a cache entry so short-lived (cron) runs can share it"""
+    try:
+        TECH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(TECH_CACHE_FILE, "r") as f:
+                cache_data = json.load(f)
+        except (OSError, ValueError):
+            cache_data = {}
+        now = time.time()
+        cache_data = {k: v for k, v in cache_data.items() if now - v[0] < TECH_CACHE_TTL}
+        cache_data[",".join(key)] = list(entry)
+        # Write a sibling temp file and swap it in so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=TECH_CACHE_FILE.parent, prefix=TECH_CACHE_FILE.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache_data, f)
+            os.replace(tmp_path, TECH_CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not persist technicals cache: {e}")
+
+
+def get_cached_technicals(etf_symbols, config):
+    """Return (technicals, pattern_results) for the ETF universe, using a TTL cache"""
+    key = tuple(sorted(etf_symbols))
+    now = time.time()
+
+    entry = _tech_cache.get(key) or _load_tech_cache_entry(key)
+    if entry and now - entry[0] < TECH_CACHE_TTL:
+        _tech_cache[key] = entry
+        logger.debug(f"Using cached technicals for {len(key)} ETFs")
+        return entry[1], entry[2]
+
+    technicals = get_batch_technicals(etf_symbols)
+    pattern_recognizer = create_pattern_recognizer(config)
+    pattern_results = pattern_recognizer.detect_patterns(etf_symbols, technicals)
+
+    # Store (and return) the JSON shape read back from disk - a plain dict with lists - so
+    # cold and warm calls hand back the same types
+    pattern_results = {
+        k: list(v) if isinstance(v, tuple) else v for k, v in pattern_results.items()
+    }
+    entry = (now, technicals, pattern_results)
+    _tech_cache[key] = entry
+    _save_tech_cache_entry(key, entry)
+    return entry[1], entry[2]
+
+
+def aggregate_etf_scores(session_analyses):
+    """Aggregate ETF mentions and confidence across analyses into a structured array
+
+    Returns: NumPy structured array with one row per ETF (fields: etf, mentions,
+    cumulative_confidence, avg_confidence, first_seen), in symbol order
+    """
+    # Flatten (etf, confidence) pairs so aggregation runs as vectorized groupby
+    etfs_flat = []
+    confs_flat = []
     for analysis in session_analyses:
         confidence = analysis.get("confidence", 0)
-        for etf in analysis.get("affected_etfs", []):
-            if etf not in etf_scores:
-                etf_scores[etf] = {
-                    "mentions": 0,
-                    "cumulative_confidence": 0,
-                    "analyses": [],
-                    "avg_confidence": 0,
-                }
-
-            etf_scores[etf]["mentions"] += 1
-            etf_scores[etf]["cumulative_confidence"] += confidence
-            etf_scores[etf]["analyses"].append(analysis)
-
-    # Calculate average confidence for each ETF
-    for etf, data in etf_scores.items():
-        data["avg_confidence"] = data["cumulative_confidence"] / data["mentions"]
+        affected_etfs = analysis.get("affected_etfs", [])
+        etfs_flat.extend(affected_etfs)
+        confs_flat.extend([confidence] * len(affected_etfs))
+
+    if not etfs_flat:
+        return np.empty(0, dtype=ETF_SCORE_DTYPE)
+
+    uniq, first_idx, inv = np.unique(
+        np.array(etfs_flat, dtype=object), return_index=True, return_inverse=True
+    )
+    inv = inv.ravel()
+    mentions = np.bincount(inv)
+
+    scores = np.empty(len(uniq), dtype=ETF_SCORE_DTYPE)
+    scores["etf"] = uniq
+    scores["mentions"] = mentions
+    scores["cumulative_confidence"] = np.bincount(
+        inv, weights=np.array(confs_flat, dtype=np.float64)
+    )
+    scores["avg_confidence"] = scores["cumulative_confidence"] / mentions
+    scores["first_seen"] = first_idx
+    return scores
+
+
+def filter_high_conviction_etfs(session_analyses, min_mentions=2):
+    """Filter ETFs that appear in multiple analyses and rank by cumulative confidence"""
+    scores = aggregate_etf_scores(session_analyses)
+    if not len(scores):
+        logger.info("[TARGET] Filtered to 0 high-conviction ETFs from 0 total")
+        return []
+
+    uniq = scores["etf"]
+    mentions = scores["mentions"]
+    cumulative = scores["cumulative_confidence"]
+    first_idx = scores["first_seen"]
 
     # Filter ETFs with minimum mentions and exclude broad-tech unless no alternatives
-    qualified_etfs = {}
-    broad_tech_etfs = {"XLK", "QQQ", "VGT", "FTEC", "IYW", "VTI", "SPY"}
+    has_mentions = mentions >= min_mentions
+    is_broad = np.isin(uniq, _BROAD_TECH_ETFS_ARRAY, assume_unique=True)
 
     # First pass: Include specialized ETFs with sufficient mentions
-    for etf, data in etf_scores.items():
-        if data["mentions"] >= min_mentions and etf not in broad_tech_etfs:
-            qualified_etfs[etf] = data
+    mask = has_mentions & ~is_broad
 
     # Second pass: Include broad-tech only if no specialized alternatives qualify
-    if not qualified_etfs:
-        logger.info("⚠️ No specialized ETFs qualify, falling back to broad-market funds")
-        for etf, data in etf_scores.items():
-            if data["mentions"] >= min_mentions and etf in broad_tech_etfs:
-                qualified_etfs[etf] = data
-
-    # Sort by cumulative confidence (highest first)
-    sorted_etfs = sorted(
-        qualified_etfs.items(), key=lambda x: x[1]["cumulative_confidence"], reverse=True
-    )
+    if not mask.any():
+        logger.info("[WARN] No specialized ETFs qualify, falling back to broad-market funds")
+        mask = has_mentions & is_broad
+
+    # Sort by cumulative confidence (highest first), ties keep first-mention order
+    candidates = np.flatnonzero(mask)
+    order = np.lexsort((first_idx[candidates], -cumulative[candidates]))
+    top = candidates[order[:3]]  # Return top 3 only
+
+    # Only materialize the per-ETF analyses lists for the survivors
+    sorted_etfs = []
+    top_etfs = {}
+    for row in scores[top]:
+        etf = row["etf"]
+        data = {
+            "mentions": int(row["mentions"]),
+            "cumulative_confidence": float(row["cumulative_confidence"]),
+            "analyses": [],
+            "avg_confidence": float(row["avg_confidence"]),
+        }
+        top_etfs[etf] = data
+        sorted_etfs.append((etf, data))
+
+    for analysis in session_analyses:
+        for etf in analysis.get("affected_etfs", []):
+            if etf in top_etfs:
+                top_etfs[etf]["analyses"].append(analysis)
 
     logger.info(
-        f"🎯 Filtered to {len(sorted_etfs)} high-conviction ETFs from {len(etf_scores)} total"
+        f"[TARGET] Filtered to {len(candidates)} high-conviction ETFs from {len(uniq)} total"
     )
-    return sorted_etfs[:3]  # Return top 3 only
+    return sorted_etfs
 
 
 def check_technical_support(etf, market_data, support_threshold=0.03):
     """Check if ETF has acceptable technical support (not overextended)"""
-    if not market_data or etf not in market_data:
-        logger.warning(f"⚠️ No market data for {etf}, skipping technical filter")
+    etf_data = market_data.get(etf) if market_data else None
+    if etf_data is None:
+        logger.warning(f"[WARN] No market data for {etf}, skipping technical filter")
         return True, 0.0  # Allow through if no data available
 
-    etf_data = market_data[etf]
-    current_price = etf_data.get("price", 0)
-    daily_change = etf_data.get("change_pct", 0) / 100  # Convert percentage to decimal
+    get = etf_data.get
+    current_price = get("price", 0)
+    daily_change = get("change_pct", 0) / 100  # Convert percentage to decimal
 
     if current_price <= 0:
-        logger.warning(f"⚠️ Invalid price for {etf}, skipping technical filter")
+        logger.warning(f"[WARN] Invalid price for {etf}, skipping technical filter")
         return True, 0.0  # Allow through if invalid price
 
     # Estimate support as recent low (conservative approach)
@@ -124,28 +261,67 @@ def check_technical_support(etf, market_data, support_threshold=0.03):
 
     is_acceptable = support_gap < support_threshold
 
-    logger.debug(
-        f"📊 {etf}: Price ${current_price:.2f}, Support gap {support_gap:.1%}, Acceptable: {is_acceptable}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"[INFO] {etf}: Price ${current_price:.2f}, Support gap {support_gap:.1%}, "
+            f"Acceptable: {is_acceptable}"
+        )
 
     return is_acceptable, support_gap
 
 
+def precompute_support_mask(etf_prices, support_threshold=0.03):
+    """Vectorized check_technical_support over the full ETF snapshot
+
+    Returns: dict mapping ETF symbol -> (is_acceptable, support_gap)
+    """
+    if not etf_prices:
+        return {}
+
+    symbols = list(etf_prices.keys())
+    prices = np.array([etf_prices[s].get("price", 0) for s in symbols], dtype=np.float64)
+    changes = np.array([etf_prices[s].get("change_pct", 0) for s in symbols], dtype=np.float64)
+
+    # Same support proxy as check_technical_support: 2x daily move below price
+    support = prices * (1 - np.abs(changes / 100) * 2)
+    valid = prices > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        support_gap = np.where(valid & (support > 0), (prices - support) / support, 0.0)
+
+    # Invalid prices are allowed through, matching the scalar check
+    is_acceptable = ~valid | (support_gap < support_threshold)
+    for i in np.flatnonzero(~valid):
+        logger.warning(f"[WARN] Invalid price for {symbols[i]}, skipping technical filter")
+
+    return dict(zip(symbols, zip(is_acceptable.tolist(), support_gap.tolist())))
+
+
 class NewsAnalyzer:
     def __init__(self):
         self.gmail_poller = GmailPoller()
         self.notion_reporter = NotionReporter()
 
+    # The Gmail connection is kept open between process_alerts() calls; leaving the
+    # analyzer's context logs it out
+    def __enter__(self):
+        self.gmail_poller.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.gmail_poller.__exit__(exc_type, exc_value, traceback)
+
     def process_alerts(self):
         """Main function to process Google Alerts - creates consolidated reports"""
         logger.info("Starting to process Google Alerts...")
 
-        # Fetch alerts from Gmail
-        alerts = self.gmail_poller.get_google_alerts()
+        # Stream alerts from Gmail, peeking at the first so empty polls exit early
+        alerts = self.gmail_poller.iter_google_alerts()
+        first_alert = next(alerts, None)
 
-        if not alerts:
+        if first_alert is None:
             logger.info("No new alerts found")
             return
+        alerts = itertools.chain((first_alert,), alerts)
 
         # Collect all analyses for consolidated reporting
         session_analyses = []
@@ -153,30 +329,35 @@ class NewsAnalyzer:
         all_mentioned_etfs = set()
 
         # Before batch analysis
-        logger.info(f"[DEBUG] Fetching ETF prices for batch analysis...")
+        logger.debug("Fetching ETF prices for batch analysis...")
         etf_prices, used_fallback, fallback_reason = get_etf_prices()
-        logger.info(f"[DEBUG] ETF prices fetched: {pprint.pformat(etf_prices)}")
+        _dbg("ETF prices fetched: %s", etf_prices)
         self.market_data_fallback = used_fallback
         self.market_data_fallback_reason = fallback_reason
 
         # Fetch technicals and pattern results for all ETFs in the snapshot
-        config = get_config().load_settings()
+        config = get_settings()
         risk_config = config.get('risk', {})
         etf_symbols = list(etf_prices.keys())
-        technicals = get_batch_technicals(etf_symbols)
-        pattern_recognizer = create_pattern_recognizer()
-        pattern_results = pattern_recognizer.detect_patterns(etf_symbols, technicals)
+        technicals, pattern_results = get_cached_technicals(etf_symbols, config)
+
+        # Split factors are fixed for the cycle, so resolve them once up front
+        split_adjustments = {
+            symbol: data["split_factor"]
+            for symbol, data in etf_prices.items()
+            if data.get("split_factor", 1.0) != 1.0
+        }
+
+        # Contextual insight uses the same neutral query for every article, so fetch it once
+        contextual_insight = memory.get_contextual_insight(
+            {"signal": "Neutral", "affected_etfs": []}, []
+        )
 
         for alert in alerts:
             logger.info(f"Processing alert for: {alert['search_term']}")
 
             for article in alert["articles"]:
                 try:
-                    # Get contextual insights from memory
-                    contextual_insight = memory.get_contextual_insight(
-                        {"signal": "Neutral", "affected_etfs": []}, []
-                    )
-
                     # Analyze the article
                     analysis = analyze_thematic_etf_news(
                         headline=article["title"],
@@ -197,18 +378,15 @@ class NewsAnalyzer:
                     analysis["market_snapshot"] = etf_prices
 
                     # Apply split adjustments to price anchors if needed
-                    if etf_prices and any(etf_data.get('split_factor', 1.0) != 1.0 for etf_data in etf_prices.values()):
-                        split_adjustments = {
-                            symbol: data.get('split_factor', 1.0) 
-                            for symbol, data in etf_prices.items() 
-                            if data.get('split_factor', 1.0) != 1.0
-                        }
-                        if split_adjustments:
-                            analysis["price_anchors"] = adjust_price_anchors_for_splits(
-                                analysis.get("price_anchors", {}), 
-                                split_adjustments
-                            )
-                            logger.info(f"🔄 Applied split adjustments to price anchors: {split_adjustments}")
+                    if split_adjustments:
+                        analysis["price_anchors"] = adjust_price_anchors_for_splits(
+                            analysis.get("price_anchors", {}),
+                            split_adjustments
+                        )
+                        logger.info(
+                            "[SPLIT] Applied split adjustments to price anchors: %s",
+                            split_adjustments,
+                        )
 
                     # Add metadata for consolidated reporting
                     analysis["source_article"] = {
@@ -235,7 +413,11 @@ class NewsAnalyzer:
                     confidence = analysis.get("confidence", 0)
 
                     logger.info(
-                        f"📊 {signal} signal ({confidence}/10) - {primary_sector or 'Mixed'} - {article['title'][:60]}..."
+                        "[INFO] %s signal (%s/10) - %s - %.60s...",
+                        signal,
+                        confidence,
+                        primary_sector or "Mixed",
+                        article["title"],
                     )
 
                 except Exception as e:
@@ -244,16 +426,20 @@ class NewsAnalyzer:
 
         # Create consolidated signal report if we have analyses
         if session_analyses:
-            logger.info(f"📊 Creating consolidated report from {len(session_analyses)} analyses...")
+            logger.info(
+                f"[INFO] Creating consolidated report from {len(session_analyses)} analyses..."
+            )
 
             # Filter for high-conviction ETFs before creating consolidated report
             high_conviction_etfs = filter_high_conviction_etfs(session_analyses, min_mentions=2)
 
             if high_conviction_etfs:
-                logger.info(f"🎯 High-conviction ETFs identified:")
+                logger.info(f"[TARGET] High-conviction ETFs identified:")
                 for etf, data in high_conviction_etfs:
                     logger.info(
-                        f"   • {etf}: {data['mentions']} mentions, {data['cumulative_confidence']:.1f} total confidence, {data['avg_confidence']:.1f} avg"
+                        f"   - {etf}: {data['mentions']} mentions, "
+                        f"{data['cumulative_confidence']:.1f} total confidence, "
+                        f"{data['avg_confidence']:.1f} avg"
                     )
 
                 # Update session analyses to focus only on high-conviction ETFs
@@ -265,7 +451,7 @@ class NewsAnalyzer:
                     analysis["affected_etfs"] = filtered_etfs
                     analysis["high_conviction_etfs"] = filtered_etfs
             else:
-                logger.info("⚠️ No ETFs meet high-conviction criteria (≥2 mentions)")
+                logger.info("[WARN] No ETFs meet high-conviction criteria (>=2 mentions)")
 
             consolidated_report = create_consolidated_signal_report(
                 session_analyses, session_timestamp
@@ -285,29 +471,39 @@ class NewsAnalyzer:
 
             if high_conviction_signals:
                 logger.info(
-                    f"📋 Filtering {len(high_conviction_signals)} high-conviction signals for technical criteria..."
+                    f"[INFO] Filtering {len(high_conviction_signals)} high-conviction signals "
+                    "for technical criteria..."
                 )
 
                 technically_sound_signals = []
+                log_info = logger.isEnabledFor(logging.INFO)
 
-                for analysis in high_conviction_signals:
-                    analysis_etfs = analysis.get(
-                        "high_conviction_etfs", analysis.get("affected_etfs", [])
-                    )
+                # Support gaps only depend on the ETF, so compute the whole snapshot at once
+                signal_etfs = [
+                    analysis.get("high_conviction_etfs", analysis.get("affected_etfs", []))
+                    for analysis in high_conviction_signals
+                ]
+                support_checks = precompute_support_mask(etf_prices)
+
+                for analysis, analysis_etfs in zip(high_conviction_signals, signal_etfs):
                     qualified_etfs = []
 
                     for etf in analysis_etfs:
-                        is_acceptable, support_gap = check_technical_support(
-                            etf, etf_prices
-                        )
+                        support_check = support_checks.get(etf)
+                        if support_check is None:
+                            support_check = check_technical_support(etf, etf_prices)
+                        is_acceptable, support_gap = support_check
                         if is_acceptable:
                             qualified_etfs.append(etf)
+                            if log_info:
+                                logger.info(
+                                    f"[OK] {etf}: Passes technical filter "
+                                    f"(support gap: {support_gap:.1%})"
+                                )
+                        elif log_info:
                             logger.info(
-                                f"✅ {etf}: Passes technical filter (support gap: {support_gap:.1%})"
-                            )
-                        else:
-                            logger.info(
-                                f"❌ {etf}: Rejected - overextended (support gap: {support_gap:.1%})"
+                                f"[FAIL] {etf}: Rejected - overextended "
+                                f"(support gap: {support_gap:.1%})"
                             )
 
                     if qualified_etfs:
@@ -317,32 +513,37 @@ class NewsAnalyzer:
 
                 if technically_sound_signals:
                     logger.info(
-                        f"🎯 Queueing {len(technically_sound_signals)} technically sound signals..."
+                        f"[TARGET] Queueing {len(technically_sound_signals)} "
+                        "technically sound signals..."
                     )
 
                     for analysis in technically_sound_signals:
-                        logger.info(f"[DEBUG] Price anchors for alert: {pprint.pformat(analysis.get('price_anchors', {}))}")
+                        get = analysis.get
+                        primary_sector = get("primary_sector", "Mixed")
+                        price_anchors = get("price_anchors", {})
+                        _dbg("Price anchors for alert: %s", price_anchors)
                         alert_id = queue_alert(
-                            signal=analysis.get("signal", "Neutral"),
-                            confidence=analysis.get("confidence", 0),
-                            title=f"High Conviction: {analysis.get('primary_sector', 'Mixed')} Signal",
-                            reasoning=analysis.get("reasoning", ""),
-                            etfs=analysis.get("filtered_etfs", []),
-                            sector=analysis.get("primary_sector", "Mixed"),
+                            signal=get("signal", "Neutral"),
+                            confidence=get("confidence", 0),
+                            title=f"High Conviction: {primary_sector} Signal",
+                            reasoning=get("reasoning", ""),
+                            etfs=get("filtered_etfs", []),
+                            sector=primary_sector,
                             article_url=notion_url,
                             search_term="filtered_high_conviction",
                             strategy=CURRENT_BATCH_STRATEGY,
-                            if_then_scenario=analysis.get("if_then_scenario", ""),
-                            contradictory_signals=analysis.get("contradictory_signals", ""),
-                            uncertainty_metric=analysis.get("uncertainty_metric", ""),
-                            price_anchors=analysis.get("price_anchors", {}),
-                            position_risk_bracket=analysis.get("position_risk_bracket", ""),
+                            if_then_scenario=get("if_then_scenario", ""),
+                            contradictory_signals=get("contradictory_signals", ""),
+                            uncertainty_metric=get("uncertainty_metric", ""),
+                            price_anchors=price_anchors,
+                            position_risk_bracket=get("position_risk_bracket", ""),
                         )
-                        logger.info(f"✅ Alert queued: {alert_id[:8]}")
+                        if log_info:
+                            logger.info(f"[OK] Alert queued: {alert_id[:8]}")
                 else:
-                    logger.info("📉 No signals pass technical filtering criteria")
+                    logger.info("[INFO] No signals pass technical filtering criteria")
             else:
-                logger.info("⏭️ No high-conviction signals to queue")
+                logger.info("[SKIP] No high-conviction signals to queue")
 
         # After processing all alerts, check for significant new patterns
         if all_mentioned_etfs:
@@ -353,261 +554,32 @@ class NewsAnalyzer:
 
     def _analyze_memory_patterns(self, all_mentioned_etfs):
         """Analyze patterns for mentioned ETFs"""
-        logger.info("🧠 Analyzing patterns for mentioned ETFs...")
+        logger.info("[MEMORY] Analyzing patterns for mentioned ETFs...")
         significant_patterns = []
 
-        for etf in all_mentioned_etfs:
-            patterns = memory.detect_patterns(etf_symbol=etf)
-            # Only include patterns with high confidence or long streaks
-            for pattern in patterns:
-                if (
-                    pattern.get("consecutive_days", 0) >= 3
-                    or pattern.get("average_confidence", 0) >= 7
-                ):
-                    significant_patterns.append(pattern)
+        # One pass over recent signals covers every mentioned ETF
+        patterns = memory.detect_patterns_bulk(list(all_mentioned_etfs))
+        # Only include patterns with high confidence or long streaks
+        for pattern in patterns:
+            if (
+                pattern.get("consecutive_days", 0) >= 3
+                or pattern.get("average_confidence", 0) >= 7
+            ):
+                significant_patterns.append(pattern)
 
         if significant_patterns:
-            logger.info(f"📊 Found {len(significant_patterns)} significant patterns")
+            logger.info(f"[INFO] Found {len(significant_patterns)} significant patterns")
             # TODO: Log significant patterns to Notion (requires separate patterns database)
 
     def _process_alert_batches(self):
         """Process any pending alert batches, passing fallback warning if present"""
-        logger.info("📱 Processing alert queue...")
+        logger.info("[ALERTS] Processing alert queue...")
         fallback_warning = self.market_data_fallback_reason if getattr(self, 'market_data_fallback', False) else None
         batch_results = process_alert_queue(fallback_warning=fallback_warning)
 
         if batch_results:
             for strategy, success in batch_results.items():
-                status = "✅" if success else "❌"
+                status = "[OK]" if success else "[FAIL]"
                 logger.info(f"{status} Batch sent via {strategy} strategy")
         else:
-            logger.info("📭 No batches ready to send")
-
-
-def test_tactical_explanation():
-    """Test the tactical explanation generation"""
-    test_analysis = {
-        "signal": "Bullish",
-        "confidence": 8,
-        "affected_etfs": ["QQQ", "TQQQ", "VTI"],
-        "reasoning": "Strong earnings beats from tech giants driving sector momentum",
-        "sector": "Technology",
-    }
-
-    test_title = "Tech Giants Report Blowout Earnings, AI Revenue Surges"
-
-    print("\\n🧪 Testing tactical explanation generation...")
-    explanation = generate_tactical_explanation(test_analysis, test_title)
-
-    if explanation:
-        print(f"✅ Generated tactical explanation ({len(explanation)} characters):")
-        print("=" * 60)
-        print(explanation)
-        print("=" * 60)
-    else:
-        print("❌ Failed to generate tactical explanation")
-
-    return explanation is not None
-
-
-def test_consolidated_reporting():
-    """Test the consolidated reporting with multiple mock analyses"""
-    print("\\n🧪 Testing consolidated signal reporting...")
-
-    # Mock multiple analyses
-    mock_analyses = [
-        {
-            "signal": "Bullish",
-            "confidence": 9,
-            "affected_etfs": ["BOTZ", "ROBO", "ARKQ"],
-            "reasoning": "Strong AI sector momentum with institutional inflows",
-            "sector": "AI",
-            "market_snapshot": {
-                "BOTZ": {"price": 31.42, "volume": 359773},
-                "ROBO": {"price": 57.93, "volume": 32891},
-                "ARKQ": {"price": 85.74, "volume": 103217},
-            },
-            "source_article": {"title": "AI ETFs See Record Inflows", "search_term": "AI ETF"},
-        },
-        {
-            "signal": "Bullish",
-            "confidence": 8,
-            "affected_etfs": ["ITA", "XAR", "DFEN"],
-            "reasoning": "Defense spending increases drive sector optimism",
-            "sector": "Defense",
-            "market_snapshot": {
-                "ITA": {"price": 181.76, "volume": 726277},
-                "XAR": {"price": 200.79, "volume": 111597},
-                "DFEN": {"price": 46.63, "volume": 528594},
-            },
-            "source_article": {"title": "Defense Budget Increases", "search_term": "defense ETF"},
-        },
-    ]
-
-    # Test consolidated report creation
-    consolidated_report = create_consolidated_signal_report(
-        mock_analyses, datetime.now().isoformat()
-    )
-
-    if consolidated_report:
-        print("✅ Successfully created consolidated report!")
-        print("\\n" + "=" * 60)
-        print("📊 CONSOLIDATED SIGNAL REPORT:")
-        print("=" * 60)
-
-        print(f"📋 Executive Summary:")
-        print(f"   {consolidated_report['executive_summary']}")
-
-        print(f"\\n💼 Market Sentiment: {consolidated_report['market_sentiment']}")
-        print(f"⚡ Conviction Level: {consolidated_report['conviction_level']}")
-        print("=" * 60)
-        return True
-    else:
-        print("❌ Failed to create consolidated report")
-        return False
-
-
-def test_etf_filtering():
-    """Test the new ETF filtering and ranking system"""
-    print("\\n🧪 Testing enhanced ETF filtering system...")
-
-    # Mock analyses that demonstrate the filtering logic
-    mock_analyses = [
-        {
-            "confidence": 8,
-            "signal": "Bullish",
-            "affected_etfs": ["BOTZ", "XLK"],  # BOTZ is specialized, XLK is broad
-            "sector": "AI",
-        },
-        {
-            "confidence": 7,
-            "signal": "Bullish",
-            "affected_etfs": ["BOTZ", "ROBO"],  # BOTZ mentioned again (frequency)
-            "sector": "AI",
-        },
-        {
-            "confidence": 6,
-            "signal": "Bullish",
-            "affected_etfs": ["BOTZ"],  # BOTZ mentioned third time
-            "sector": "AI",
-        },
-        {
-            "confidence": 8,
-            "signal": "Bullish",
-            "affected_etfs": ["XLK"],  # XLK mentioned second time but still broad
-            "sector": "Technology",
-        },
-    ]
-
-    # Test filtering
-    filtered_etfs = filter_high_conviction_etfs(mock_analyses, min_mentions=2)
-
-    print(f"\\n📊 ETF Filtering Results:")
-    print(f"   Input: 4 analyses mentioning BOTZ(3x), XLK(2x), ROBO(1x)")
-    print(f"   Filtered: {len(filtered_etfs)} ETFs")
-
-    for etf, data in filtered_etfs:
-        print(
-            f"   • {etf}: {data['mentions']} mentions, {data['cumulative_confidence']:.1f} total confidence"
-        )
-
-    # Should prioritize BOTZ (specialized, 3 mentions, 21 total confidence) over XLK (broad, 2 mentions, 14 total confidence)
-    if filtered_etfs and filtered_etfs[0][0] == "BOTZ":
-        print("   ✅ Correctly prioritized specialized ETF (BOTZ) over broad ETF (XLK)")
-        return True
-    else:
-        print("   ❌ Failed to prioritize specialized ETF")
-        return False
-
-
-def test_technical_filtering():
-    """Test technical support filtering"""
-    print("\\n🧪 Testing technical support filtering...")
-
-    # Mock market data with different support scenarios
-    mock_market_data = {
-        "GOOD_ETF": {"price": 100.0, "change_percent": 1.0},  # 2% support gap - acceptable
-        "BAD_ETF": {"price": 100.0, "change_percent": 5.0},  # 10% support gap - overextended
-        "NO_DATA": {},  # No price data
-    }
-
-    test_results = []
-    for etf, data in mock_market_data.items():
-        acceptable, gap = check_technical_support(etf, {etf: data})
-        test_results.append((etf, acceptable, gap))
-        print(f"   • {etf}: Support gap {gap:.1%}, Acceptable: {acceptable}")
-
-    # Should accept GOOD_ETF, reject BAD_ETF and NO_DATA
-    expected = [("GOOD_ETF", True), ("BAD_ETF", False), ("NO_DATA", False)]
-    actual = [(etf, acceptable) for etf, acceptable, _ in test_results]
-
-    if all(exp in actual for exp in expected):
-        print("   ✅ Technical filtering working correctly")
-        return True
-    else:
-        print("   ❌ Technical filtering failed")
-        return False
-
-
-# MAIN EXECUTION
-if __name__ == "__main__":
-    import sys
-    import logging
-    from src.core.utils.config_loader import get_config
-
-    # Setup logging
-    logger = logging.getLogger(__name__)
-
-    logger.info("🚀 Starting MarketMan News Analysis System...")
-
-    try:
-        # Load configuration
-        config_loader = get_config()
-        config = config_loader.load_settings()
-        
-        # Create the proper news orchestrator with multiple sources
-        orchestrator = create_news_orchestrator(config)
-        
-        # Get tracked tickers from config
-        tracked_tickers = config.get('news_ingestion', {}).get('tracked_tickers', [])
-        
-        logger.info(f"📰 Using multiple news sources: Finnhub, NewsAPI, NewData")
-        logger.info(f"🎯 Tracking {len(tracked_tickers)} ETFs: {', '.join(tracked_tickers[:5])}{'...' if len(tracked_tickers) > 5 else ''}")
-        
-        # Run the proper news processing cycle with signal generation
-        results = orchestrator.process_signals(
-            tickers=tracked_tickers,
-            hours_back=24  # Last 24 hours for comprehensive coverage
-        )
-        
-        logger.info(f"📊 News Processing Results:")
-        logger.info(f"  📰 Raw news items: {results['raw_news_count']}")
-        logger.info(f"  ✅ Filtered items: {results['filtered_news_count']}")
-        logger.info(f"  📦 Batches created: {results['batches_created']}")
-        logger.info(f"  🤖 AI processed: {results['ai_processed_batches']}")
-        
-        # Show source statistics
-        source_stats = results.get('source_stats', {})
-        if source_stats:
-            logger.info(f"📰 News Sources Used:")
-            for source in source_stats.get('sources', []):
-                logger.info(f"  • {source['source']}: {source['daily_requests']}/{source['daily_limit']} calls")
-        
-        # Show cost impact
-        cost_stats = results.get('cost_stats', {})
-        if cost_stats:
-            logger.info(f"💰 Cost Impact:")
-            logger.info(f"  • AI calls used: {cost_stats.get('daily_ai_calls', 0)}")
-            logger.info(f"  • Cost incurred: ${cost_stats.get('monthly_ai_cost', 0.0):.2f}")
-        
-        if results['ai_processed_batches'] > 0:
-            logger.info("🎯 Signals generated successfully!")
-        else:
-            logger.info("📭 No signals generated - this is normal if no relevant news found")
-            logger.info("✅ Pipeline is working correctly (filtering out irrelevant content)")
-        
-        logger.info("✅ MarketMan analysis cycle complete")
-        
-    except Exception as e:
-        logger.error(f"❌ Error in news analysis cycle: {e}")
-        sys.exit(1)
+            logger.info("[INFO] No batches ready to send")
@@ -3,20 +3,30 @@ Pattern Recognition Module - Placeholder for future pattern detection
 Currently returns minimal results, designed for easy expansion
 """
 import logging
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
 
 class PatternRecognizer:
     """Placeholder for pattern recognition functionality"""
+
+    # Shared read-only results so the no-op paths don't allocate per call
+    _DISABLED_RESULT = MappingProxyType({"patterns_detected": 0, "patterns": ()})
+    _EMPTY_RESULT = MappingProxyType({
+        "patterns_detected": 0,
+        "patterns": (),
+        "analysis_timestamp": "2024-01-01T00:00:00Z",
+        "status": "no_patterns_detected"
+    })
     
     def __init__(self, config: Dict):
         self.config = config
         self.enabled = config.get('pattern_recognition', {}).get('enabled', False)
         logger.info(f"🔍 PatternRecognizer initialized: {'enabled' if self.enabled else 'disabled'}")
     
-    def detect_patterns(self, tickers: List[str], technicals: Dict = None) -> Dict:
+    def detect_patterns(self, tickers: List[str], technicals: Dict = None) -> Mapping:
         """
         Detect patterns in technical data for given tickers
         
@@ -25,10 +35,10 @@ class PatternRecognizer:
             technicals: Optional dict of technical indicators
             
         Returns:
-            Dict with pattern detection results
+            Read-only mapping with pattern detection results
         """
         if not self.enabled:
-            return {"patterns_detected": 0, "patterns": []}
+            return self._DISABLED_RESULT
         
         # Placeholder implementation - always returns no patterns
         # In production, this would analyze technicals for patterns like:
@@ -38,14 +48,10 @@ class PatternRecognizer:
         # - Support/resistance levels
         # - Volume patterns
         
-        logger.debug(f"🔍 Pattern detection requested for {len(tickers)} tickers")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Pattern detection requested for {len(tickers)} tickers")
         
-        return {
-            "patterns_detected": 0,
-            "patterns": [],
-            "analysis_timestamp": "2024-01-01T00:00:00Z",
-            "status": "no_patterns_detected"
-        }
+        return self._EMPTY_RESULT
     
     def get_pattern_stats(self) -> Dict:
         """Get pattern recognition statistics"""
@@ -56,6 +62,12 @@ class PatternRecognizer:
         }
 
 
+_cached_recognizer: Optional[PatternRecognizer] = None
+
+
 def create_pattern_recognizer(config: Dict) -> PatternRecognizer:
-    """Factory function to create PatternRecognizer"""
-    return PatternRecognizer(config) 
\ No newline at end of file
+    """Factory function to create PatternRecognizer (reused while the config is unchanged)"""
+    global _cached_recognizer
+    if _cached_recognizer is None or _cached_recognizer.config is not config:
+        _cached_recognizer = PatternRecognizer(config)
+    return _cached_recognizer 
\ No newline at end of file
@@ -8,41 +8,57 @@ This module contains all shared helper functions and utilities including:
 - Shared constants and configurations
 """
 
-from .config_loader import ConfigLoader, get_config, get_setting, is_feature_enabled
-from .formatting import (
-    format_price_context,
-    format_volume_with_liquidity,
-    format_conviction_tier,
-    format_signal_summary,
-    format_percentage,
-    format_currency,
-    format_timestamp,
-    truncate_text,
-    clean_text,
-    format_list,
-    format_table,
-)
-from .validation import (
-    validate_email,
-    validate_symbol,
-    validate_percentage,
-    validate_confidence_score,
-    validate_date_format,
-    validate_required_fields,
-    validate_numeric_range,
-    validate_list_length,
-    validate_url,
-    validate_json_string,
-    sanitize_filename,
-    validate_config_section,
-    validate_signal_data,
-    validate_alert_data,
-)
+import importlib
+
+# Names are resolved from their submodule on first access (PEP 562)
+_LAZY_IMPORTS = {
+    # Compatibility switches
+    "DATACLASS_SLOTS": ".compat",
+    # Config utilities
+    "ConfigLoader": ".config_loader",
+    "get_config": ".config_loader",
+    "get_settings": ".config_loader",
+    "get_setting": ".config_loader",
+    "is_feature_enabled": ".config_loader",
+    # Formatting utilities
+    "format_price_context": ".formatting",
+    "format_volume_with_liquidity": ".formatting",
+    "format_conviction_tier": ".formatting",
+    "format_signal_summary": ".formatting",
+    "format_percentage": ".formatting",
+    "format_currency": ".formatting",
+    "format_timestamp": ".formatting",
+    "truncate_text": ".formatting",
+    "clean_text": ".formatting",
+    "format_list": ".formatting",
+    "format_table": ".formatting",
+    # HTTP utilities
+    "api_retry": ".http_utils",
+    "json_body": ".http_utils",
+    # Validation utilities
+    "validate_email": ".validation",
+    "validate_symbol": ".validation",
+    "validate_percentage": ".validation",
+    "validate_confidence_score": ".validation",
+    "validate_date_format": ".validation",
+    "validate_required_fields": ".validation",
+    "validate_numeric_range": ".validation",
+    "validate_list_length": ".validation",
+    "validate_url": ".validation",
+    "validate_json_string": ".validation",
+    "sanitize_filename": ".validation",
+    "validate_config_section": ".validation",
+    "validate_signal_data": ".validation",
+    "validate_alert_data": ".validation",
+}
 
 __all__ = [
+    # Compatibility switches
+    "DATACLASS_SLOTS",
     # Config utilities
     "ConfigLoader",
     "get_config",
+    "get_settings",
     "get_setting",
     "is_feature_enabled",
     # Formatting utilities
@@ -57,6 +73,9 @@ __all__ = [
     "clean_text",
     "format_list",
     "format_table",
+    # HTTP utilities
+    "api_retry",
+    "json_body",
     # Validation utilities
     "validate_email",
     "validate_symbol",
@@ -73,3 +92,16 @@ __all__ = [
     "validate_signal_data",
     "validate_alert_data",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,12 @@
+"""
+Python version compatibility helpers for MarketMan.
+
+This module contains the shared switches for language features that are only
+available on newer Python versions than the minimum the project supports.
+"""
+
+import sys
+
+# dataclass(slots=True) drops the per-instance __dict__ but needs Python 3.10+;
+# use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -6,9 +6,11 @@ files including settings, strategies, and broker configurations.
 """
 
 import os
+import copy
+import functools
 import yaml  # type: ignore
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 # Load .env if present
@@ -20,6 +22,35 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when available (much faster than pure Python)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML shared across loader instances: resolved path -> ((mtime_ns, size), data)
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Sentinel returned by _lookup when a key path is missing
+_MISSING = object()
+
+
+def _lookup(settings: Dict[str, Any], key_path: str) -> Any:
+    """
+    Resolve a dot-separated key path in a nested settings dict.
+
+    Args:
+        settings: Parsed settings dictionary
+        key_path: Dot-separated path to the setting (e.g., "app.debug")
+
+    Returns:
+        The setting value or ``_MISSING``
+    """
+    value = settings
+    try:
+        for key in key_path.split("."):
+            value = value[key]
+    except (KeyError, TypeError):
+        return _MISSING
+    return value
+
 
 class ConfigLoader:
     """Centralized configuration loader for MarketMan."""
@@ -35,6 +66,8 @@ class ConfigLoader:
         self._settings: Optional[Dict[str, Any]] = None
         self._strategies: Optional[Dict[str, Any]] = None
         self._brokers: Optional[Dict[str, Any]] = None
+        # Looked-up get_setting values (or ``_MISSING``) keyed on key_path; cleared on reload
+        self._setting_cache: Dict[str, Any] = {}
 
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -97,17 +130,16 @@ class ConfigLoader:
         if key_path == "min_confidence_threshold" and default is None:
             default = 5
 
-        settings = self.load_settings()
-        keys = key_path.split(".")
-        value = settings
-
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
+        # Only the looked-up value is cached (``_MISSING`` for absent keys); the default is
+        # applied per call so e.g. False, 0 and 0.0 defaults never share an entry
+        value = self._setting_cache.get(key_path, _MISSING)
+        if value is _MISSING and key_path not in self._setting_cache:
+            value = _lookup(self.load_settings(), key_path)
+            self._setting_cache[key_path] = value
+        if value is _MISSING:
             logger.warning(f"Setting '{key_path}' not found, using default: {default}")
             return default
+        return value
 
     def get_strategy_config(self, strategy_name: str) -> Dict[str, Any]:
         """
@@ -161,15 +193,27 @@ class ConfigLoader:
             FileNotFoundError: If the configuration file doesn't exist
             yaml.YAMLError: If the YAML file is malformed
         """
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             logger.error(f"Configuration file not found: {file_path}")
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
+        # Unchanged files (same mtime and size) are served from the parse cache. Each loader
+        # gets its own copy so a caller mutating its settings can't affect other loaders.
+        cache_key = str(file_path.resolve())
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None and cached[0] == file_version:
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
+            # Hand raw bytes to the parser so libyaml does the UTF-8 decode in C
+            with open(file_path, "rb") as file:
+                config = yaml.load(file, Loader=_YAML_LOADER) or {}
                 logger.info(f"Loaded configuration from {file_path}")
-                return config or {}
+                _YAML_CACHE[cache_key] = (file_version, config)
+                return copy.deepcopy(config)
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML file {file_path}: {e}")
             raise
@@ -178,25 +222,57 @@ class ConfigLoader:
             raise
 
     def reload_configs(self) -> None:
-        """Reload all configuration files from disk."""
+        """
+        Reload all configuration files from disk.
+
+        Files whose mtime and size are unchanged are served from the shared parse cache.
+        """
         self._settings = None
         self._strategies = None
         self._brokers = None
+        self._setting_cache.clear()
         logger.info("Configuration files reloaded")
 
 
+@functools.lru_cache(maxsize=8)
+def _get_loader(config_dir: str) -> ConfigLoader:
+    """
+    Return the shared ConfigLoader for a configuration directory.
+
+    Instances (and their warm settings caches) are process-global, so a
+    ``reload_configs()`` on one caller's loader is seen by every other caller.
+    """
+    return ConfigLoader(config_dir)
+
+
 # Global configuration loader instance
-config_loader = ConfigLoader()
+config_loader = _get_loader("config")
+
 
+def get_config(config_dir: str = "config") -> ConfigLoader:
+    """
+    Get the shared configuration loader instance.
+
+    Args:
+        config_dir: Directory containing configuration files
+
+    Returns:
+        ConfigLoader shared by all callers using the same directory
+    """
+    return _get_loader(config_dir)
 
-def get_config() -> ConfigLoader:
+
+def get_settings() -> Dict[str, Any]:
     """
-    Get the global configuration loader instance.
+    Convenience function to get the cached main settings.
+
+    Settings are parsed once per process; call ``get_config().reload_configs()``
+    to force a re-read from disk.
 
     Returns:
-        Global ConfigLoader instance
+        Dictionary containing all settings
     """
-    return config_loader
+    return config_loader.load_settings()
 
 
 def get_setting(key_path: str, default: Any = None) -> Any:
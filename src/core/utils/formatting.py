@@ -6,9 +6,48 @@ to ensure consistent formatting of data, prices, volumes, and other values.
 """
 
 import re
-from typing import Dict, List, Any, Optional
+from bisect import bisect_right
+from itertools import islice
+from typing import Dict, Iterable, List, Any, Optional
 from datetime import datetime
 
+# Precompiled patterns for clean_text
+_WHITESPACE_RE = re.compile(r"\s+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Default truncate_text suffix and its precomputed length
+_DEFAULT_SUFFIX = "..."
+_DEFAULT_SUFFIX_LEN = len(_DEFAULT_SUFFIX)
+
+# Threshold tables for the tiered formatters: bisect_right(thresholds, value) indexes the
+# matching (format, divisor) entry, so each tier starts at its threshold (inclusive)
+_VOLUME_THRESHOLDS = (1_000_000, 10_000_000, 100_000_000, 1_000_000_000)
+_VOLUME_FORMATS = (
+    ("${:,.0f} (Low)", 1),
+    ("${:.2f}M (Medium)", 1_000_000),
+    ("${:.1f}M (Medium)", 1_000_000),
+    ("${:.0f}M (High)", 1_000_000),
+    ("${:.1f}B (High)", 1_000_000_000),
+)
+
+_CURRENCY_THRESHOLDS = (1_000, 1_000_000)
+_CURRENCY_FORMATS = (
+    ("{}{:.2f}", 1),
+    ("{}{:.1f}K", 1_000),
+    ("{}{:.1f}M", 1_000_000),
+)
+
+_CONVICTION_THRESHOLDS = (5, 7, 9)
+_CONVICTION_TIERS = (
+    "⚠️ WEAK SIGNAL",
+    "📊 MODERATE SIGNAL",
+    "⚡ STRONG SIGNAL",
+    "🔥 HIGH CONVICTION",
+)
+
+_SIGNAL_EMOJI = {"Bullish": "↗️", "Bearish": "↘️", "Neutral": "➡️"}
+_REASON_LIMIT = 200
+
 
 def format_price_context(etf_prices: Dict[str, Any]) -> str:
     """
@@ -25,14 +64,14 @@ def format_price_context(etf_prices: Dict[str, Any]) -> str:
 
     context_lines = []
     for symbol, data in etf_prices.items():
-        change_sign = "+" if data.get("change_pct", 0) >= 0 else ""
-        trend_emoji = (
-            "📈" if data.get("change_pct", 0) > 0 else "📉" if data.get("change_pct", 0) < 0 else "➖"
-        )
+        # Pull each field once per row
+        get = data.get
+        change_pct = get("change_pct", 0)
+        price = get("price", 0)
+        name = get("name", symbol)
 
-        price = data.get("price", 0)
-        change_pct = data.get("change_pct", 0)
-        name = data.get("name", symbol)
+        change_sign = "+" if change_pct >= 0 else ""
+        trend_emoji = "📈" if change_pct > 0 else "📉" if change_pct < 0 else "➖"
 
         context_lines.append(
             f"• {symbol} ({name}): ${price:.2f} ({change_sign}{change_pct:.2f}%) {trend_emoji}"
@@ -51,16 +90,8 @@ def format_volume_with_liquidity(volume: float) -> str:
     Returns:
         Formatted volume string with liquidity indicator
     """
-    if volume >= 1_000_000_000:  # 1B+
-        return f"${volume/1_000_000_000:.1f}B (High)"
-    elif volume >= 100_000_000:  # 100M+
-        return f"${volume/1_000_000:.0f}M (High)"
-    elif volume >= 10_000_000:  # 10M+
-        return f"${volume/1_000_000:.1f}M (Medium)"
-    elif volume >= 1_000_000:  # 1M+
-        return f"${volume/1_000_000:.2f}M (Medium)"
-    else:
-        return f"${volume:,.0f} (Low)"
+    fmt, divisor = _VOLUME_FORMATS[bisect_right(_VOLUME_THRESHOLDS, volume)]
+    return fmt.format(volume / divisor)
 
 
 def format_conviction_tier(confidence: float) -> str:
@@ -73,14 +104,7 @@ def format_conviction_tier(confidence: float) -> str:
     Returns:
         Formatted conviction tier string
     """
-    if confidence >= 9:
-        return "🔥 HIGH CONVICTION"
-    elif confidence >= 7:
-        return "⚡ STRONG SIGNAL"
-    elif confidence >= 5:
-        return "📊 MODERATE SIGNAL"
-    else:
-        return "⚠️ WEAK SIGNAL"
+    return _CONVICTION_TIERS[bisect_right(_CONVICTION_THRESHOLDS, confidence)]
 
 
 def format_signal_summary(signal: str, confidence: float, etfs: List[str], reasoning: str) -> str:
@@ -96,17 +120,17 @@ def format_signal_summary(signal: str, confidence: float, etfs: List[str], reaso
     Returns:
         Formatted signal summary
     """
-    signal_emoji = {"Bullish": "↗️", "Bearish": "↘️", "Neutral": "➡️"}.get(signal, "❓")
+    signal_emoji = _SIGNAL_EMOJI.get(signal, "❓")
 
     conviction = format_conviction_tier(confidence)
     etf_list = ", ".join(etfs[:5]) + ("..." if len(etfs) > 5 else "")
 
-    summary = f"{signal_emoji} {signal.upper()} Signal ({confidence}/10)\n"
-    summary += f"{conviction}\n\n"
-    summary += f"ETFs: {etf_list}\n\n"
-    summary += f"Reasoning: {reasoning[:200]}{'...' if len(reasoning) > 200 else ''}"
-
-    return summary
+    return (
+        f"{signal_emoji} {signal.upper()} Signal ({confidence}/10)\n"
+        f"{conviction}\n\n"
+        f"ETFs: {etf_list}\n\n"
+        f"Reasoning: {reasoning[:_REASON_LIMIT]}{'...' if len(reasoning) > _REASON_LIMIT else ''}"
+    )
 
 
 def format_percentage(value: float, decimal_places: int = 2) -> str:
@@ -134,12 +158,8 @@ def format_currency(value: float, currency: str = "$") -> str:
     Returns:
         Formatted currency string
     """
-    if abs(value) >= 1_000_000:
-        return f"{currency}{value/1_000_000:.1f}M"
-    elif abs(value) >= 1_000:
-        return f"{currency}{value/1_000:.1f}K"
-    else:
-        return f"{currency}{value:.2f}"
+    fmt, divisor = _CURRENCY_FORMATS[bisect_right(_CURRENCY_THRESHOLDS, abs(value))]
+    return fmt.format(currency, value / divisor)
 
 
 def format_timestamp(timestamp: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
@@ -156,7 +176,7 @@ def format_timestamp(timestamp: datetime, format_str: str = "%Y-%m-%d %H:%M:%S")
     return timestamp.strftime(format_str)
 
 
-def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
+def truncate_text(text: str, max_length: int, suffix: str = _DEFAULT_SUFFIX) -> str:
     """
     Truncate text to a maximum length.
 
@@ -168,8 +188,11 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     Returns:
         Truncated text
     """
+    # Short text (the common case) is returned untouched without any allocation
     if len(text) <= max_length:
         return text
+    if suffix is _DEFAULT_SUFFIX:
+        return text[: max_length - _DEFAULT_SUFFIX_LEN] + suffix
     return text[: max_length - len(suffix)] + suffix
 
 
@@ -187,20 +210,20 @@ def clean_text(text: str) -> str:
         return ""
 
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _WHITESPACE_RE.sub(" ", text.strip())
 
     # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _HTML_TAG_RE.sub("", text)
 
     return text
 
 
-def format_list(items: List[str], max_items: int = 5, separator: str = ", ") -> str:
+def format_list(items: Iterable[str], max_items: int = 5, separator: str = ", ") -> str:
     """
     Format a list of items with truncation.
 
     Args:
-        items: List of items
+        items: List (or any iterable) of items
         max_items: Maximum number of items to show
         separator: Separator between items
 
@@ -210,10 +233,17 @@ def format_list(items: List[str], max_items: int = 5, separator: str = ", ") ->
     if not items:
         return ""
 
-    if len(items) <= max_items:
-        return separator.join(items)
+    if isinstance(items, (list, tuple)):
+        if len(items) <= max_items:
+            return separator.join(items)
+        return separator.join(islice(items, max_items)) + "..."
 
-    return separator.join(items[:max_items]) + "..."
+    # Other iterables are consumed only far enough to know whether they overflow
+    head = list(islice(items, max_items + 1))
+    if len(head) <= max_items:
+        return separator.join(head)
+    del head[max_items:]
+    return separator.join(head) + "..."
 
 
 def format_table(data: List[Dict[str, Any]], headers: Optional[List[str]] = None) -> str:
@@ -233,34 +263,19 @@ def format_table(data: List[Dict[str, Any]], headers: Optional[List[str]] = None
     if not headers:
         headers = list(data[0].keys())
 
-    # Calculate column widths
-    col_widths = {}
-    for header in headers:
-        col_widths[header] = len(header)
-
-    for row in data:
-        for header in headers:
-            value = str(row.get(header, ""))
-            col_widths[header] = max(col_widths[header], len(value))
-
-    # Build table
-    lines = []
-
-    # Header
-    header_line = "| " + " | ".join(header.ljust(col_widths[header]) for header in headers) + " |"
-    lines.append(header_line)
-
-    # Separator
-    separator_line = "|" + "|".join("-" * (width + 2) for width in col_widths.values()) + "|"
-    lines.append(separator_line)
-
-    # Data rows
-    for row in data:
-        row_line = (
-            "| "
-            + " | ".join(str(row.get(header, "")).ljust(col_widths[header]) for header in headers)
-            + " |"
-        )
-        lines.append(row_line)
+    # Stringify every cell once, then size columns from the cached strings
+    cells = [[str(row.get(header, "")) for header in headers] for row in data]
+    col_widths = [
+        max(len(header), max((len(row[i]) for row in cells), default=0))
+        for i, header in enumerate(headers)
+    ]
+
+    # One row template for the whole table: each cell is left-aligned to its column width
+    row_format = "| " + " | ".join(f"{{:<{width}}}" for width in col_widths) + " |"
+
+    # Build table: header, separator, then data rows
+    lines = [row_format.format(*headers)]
+    lines.append("|" + "|".join("-" * (width + 2) for width in col_widths) + "|")
+    lines.extend(row_format.format(*row) for row in cells)
 
     return "\n".join(lines)
@@ -0,0 +1,82 @@
+"""
+HTTP utilities for MarketMan.
+
+This module contains the request helpers shared by the API integrations
+(Notion, Pushover): JSON body encoding and the session retry policy.
+"""
+
+import json
+
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+
+def _json_default(value):
+    """Convert numpy/pandas values (scalars and arrays) that the JSON encoders reject"""
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_body(payload) -> bytes:
+    """
+    Encode a request payload as compact JSON bytes, using orjson when it is installed.
+
+    numpy and pandas values (e.g. an np.float64 taken from a DataFrame) encode the same way
+    with or without orjson.
+
+    Args:
+        payload: JSON-serializable request payload
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+class _PostSafeRetry(Retry):
+    """Retry that resends a POST only when the API refused it with 429.
+
+    A 5xx or read timeout on POST may arrive after the API already created the resource, so
+    resending it could create a duplicate. Connection errors are still retried for every method
+    because the request never reached the server.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method and method.upper() == "POST":
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def api_retry(total: int = 5, backoff_factor: float = 0.5) -> Retry:
+    """
+    Build the retry policy for a JSON API session.
+
+    Rate limiting (honoring Retry-After) is retried for every method, transient server errors
+    only for idempotent ones. Once retries run out the last response is returned so callers
+    still see its status code.
+
+    Args:
+        total: Maximum number of retries
+        backoff_factor: Base delay for the exponential backoff between retries
+
+    Returns:
+        Retry instance to mount on an HTTPAdapter
+    """
+    return _PostSafeRetry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "PATCH"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
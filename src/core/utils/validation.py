@@ -5,9 +5,22 @@ This module contains common validation functions used across the codebase
 to ensure data integrity and proper input validation.
 """
 
+import json
 import re
 from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from datetime import date, datetime
+
+# Precompiled patterns for the hot validators
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+
+# Deletion table for characters that are invalid in filenames
+_FILENAME_STRIP = str.maketrans("", "", '<>:"/\\|?*')
+
+_ISO_DATE_FORMAT = "%Y-%m-%d"
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
 
 
 def validate_email(email: str) -> bool:
@@ -23,8 +36,18 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
+
+
+def _is_valid_symbol(symbol: Any) -> bool:
+    """Basic symbol validation: a string of 1-5 uppercase ASCII letters"""
+    return (
+        isinstance(symbol, str)
+        and 1 <= len(symbol) <= 5
+        and symbol.isascii()
+        and symbol.isalpha()
+        and symbol.isupper()
+    )
 
 
 def validate_symbol(symbol: str) -> bool:
@@ -37,12 +60,7 @@ def validate_symbol(symbol: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not symbol:
-        return False
-
-    # Basic symbol validation: 1-5 uppercase letters
-    pattern = r"^[A-Z]{1,5}$"
-    return bool(re.match(pattern, symbol))
+    return _is_valid_symbol(symbol)
 
 
 def validate_percentage(value: Union[int, float]) -> bool:
@@ -90,6 +108,15 @@ def validate_date_format(date_str: str, format_str: str = "%Y-%m-%d") -> bool:
     Returns:
         True if valid, False otherwise
     """
+    # Fast path for zero-padded ISO dates; anything it rejects still goes through strptime,
+    # which also accepts forms like "2024-1-5"
+    if format_str == _ISO_DATE_FORMAT and len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+        try:
+            date.fromisoformat(date_str)
+            return True
+        except ValueError:
+            pass
+
     try:
         datetime.strptime(date_str, format_str)
         return True
@@ -108,11 +135,9 @@ def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -
     Returns:
         List of missing field names (empty if all present)
     """
-    missing_fields = []
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            missing_fields.append(field)
-    return missing_fields
+    # One lookup per field covers both absent and None-valued keys
+    get = data.get
+    return [field for field in required_fields if get(field) is None]
 
 
 def validate_numeric_range(value: Union[int, float], min_val: float, max_val: float) -> bool:
@@ -174,8 +199,7 @@ def validate_url(url: str) -> bool:
         return False
 
     # Basic URL validation
-    pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def validate_json_string(json_str: str) -> bool:
@@ -188,13 +212,24 @@ def validate_json_string(json_str: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    try:
-        import json
+    if isinstance(json_str, (bytes, bytearray)):
+        try:
+            json_str = json_str.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+    if not isinstance(json_str, str):
+        return False
 
-        json.loads(json_str)
-        return True
-    except (ValueError, TypeError):
+    text = json_str.strip(_JSON_WHITESPACE)
+    if not text:
+        return False
+
+    try:
+        _, end = _JSON_DECODER.raw_decode(text)
+    except ValueError:
         return False
+    # Anything after the first complete value makes the document invalid
+    return end == len(text)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -207,17 +242,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', "", filename)
-
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(". ")
-
-    # Limit length
-    if len(filename) > 255:
-        filename = filename[:255]
-
-    return filename
+    # Remove invalid characters, then leading/trailing spaces and dots, then limit length
+    return filename.translate(_FILENAME_STRIP).strip(". ")[:255]
 
 
 def validate_config_section(
@@ -234,10 +260,7 @@ def validate_config_section(
     Returns:
         List of missing keys (empty if all present)
     """
-    if section not in config:
-        return required_keys
-
-    section_data = config[section]
+    section_data = config.get(section)
     if not isinstance(section_data, dict):
         return required_keys
 
@@ -279,9 +302,11 @@ def validate_signal_data(signal_data: Dict[str, Any]) -> List[str]:
         elif not validate_list_length(signal_data["etfs"], min_length=1):
             errors.append("ETFs list cannot be empty")
         else:
-            for etf in signal_data["etfs"]:
-                if not validate_symbol(etf):
-                    errors.append(f"Invalid ETF symbol: {etf}")
+            errors.extend(
+                f"Invalid ETF symbol: {etf}"
+                for etf in signal_data["etfs"]
+                if not _is_valid_symbol(etf)
+            )
 
     return errors
 
@@ -4,41 +4,48 @@ Integrations module for MarketMan.
 This module provides external service integrations including Notion, email, and broker APIs.
 """
 
-from .notion_reporter import NotionReporter
-from .gmail_organizer import GmailOrganizer
-from .gmail_poller import GmailPoller
-from .pushover_utils import send_energy_alert, send_system_alert
-from .pushover_client import PushoverNotifier, pushover_notifier, send_trading_signal, send_risk_warning, test_pushover
+import importlib
 
-# Phase 3 components
-from .fidelity_integration import FidelityIntegration, FidelityTrade, create_fidelity_integration, auto_import_fidelity_trades, setup_fidelity_email_monitoring
-
-# Phase 4 components
+# Phase 4 components - imported eagerly because the ``notion_journal`` singleton shares its
+# name with the submodule; importing the submodule later would otherwise shadow it
 from .notion_journal import NotionJournalIntegration, notion_journal
 
-__all__ = [
+# Everything else is resolved on first attribute access (PEP 562) so that importing one
+# integration does not pull in the SDKs of all the others
+_LAZY_IMPORTS = {
     # Existing components
-    "NotionReporter",
-    "GmailOrganizer",
-    "GmailPoller",
-    "send_energy_alert",
-    "send_system_alert",
-    
+    "NotionReporter": ".notion_reporter",
+    "GmailOrganizer": ".gmail_organizer",
+    "GmailPoller": ".gmail_poller",
+    "send_energy_alert": ".pushover_utils",
+    "send_system_alert": ".pushover_utils",
     # Enhanced Pushover components
-    "PushoverNotifier",
-    "pushover_notifier",
-    "send_trading_signal",
-    "send_risk_warning",
-    "test_pushover",
-    
+    "PushoverNotifier": ".pushover_client",
+    "pushover_notifier": ".pushover_client",
+    "send_trading_signal": ".pushover_client",
+    "send_trading_signals_batch": ".pushover_client",
+    "send_risk_warning": ".pushover_client",
+    "test_pushover": ".pushover_client",
     # Phase 3 components
-    "FidelityIntegration",
-    "FidelityTrade",
-    "create_fidelity_integration",
-    "auto_import_fidelity_trades",
-    "setup_fidelity_email_monitoring",
-    
-    # Phase 4 components
-    "NotionJournalIntegration",
-    "notion_journal"
-]
+    "FidelityIntegration": ".fidelity_integration",
+    "FidelityTrade": ".fidelity_integration",
+    "create_fidelity_integration": ".fidelity_integration",
+    "auto_import_fidelity_trades": ".fidelity_integration",
+    "setup_fidelity_email_monitoring": ".fidelity_integration",
+}
+
+# Single source of truth for the public surface: the lazy table plus the eager Phase 4 names
+__all__ = [*_LAZY_IMPORTS, "NotionJournalIntegration", "notion_journal"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
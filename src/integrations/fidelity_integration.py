@@ -5,21 +5,102 @@ Low-friction trade import automation using email parsing and CSV processing.
 """
 import os
 import csv
+import functools
+import itertools
 import re
 import json
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Set, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 import logging
+import mmap
 from pathlib import Path
 
 from src.core.journal.trade_journal import TradeJournal, TradeEntry, log_trade_from_dict
+from src.core.utils.compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Confirmation headings that start each trade section; bytes so it can scan an mmap directly
+_SECTION_HEADING_RE = re.compile(
+    rb'Order Executed|Trade Confirmation|Order Fill|Execution Report', re.IGNORECASE
+)
+# Upper bound on the bytes decoded and scanned per section, so oversized emails stay cheap
+_MAX_SECTION_BYTES = 4096
 
-@dataclass
+# All trade fields in one anchored match: each lookahead finds the first occurrence of its
+# field from the section start, and the date is optional
+_TRADE_FIELDS_RE = re.compile(
+    r'(?=.*?(?:Symbol|Ticker)[:\s]+(?P<symbol>[A-Z]{1,5}))'
+    r'(?=.*?(?P<action>Buy|Sell|Bought|Sold))'
+    r'(?=.*?(?:Quantity|Shares)[:\s]+(?P<qty>[\d,]+))'
+    r'(?=.*?(?:Price|Amount)[:\s]+\$?(?P<price>[\d,]+\.?\d*))'
+    r'(?=(?:.*?(?P<date>\d{1,2}/\d{1,2}/\d{2,4}))?)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Known Fidelity CSV layouts: header pattern -> (date, action, symbol, quantity, price) columns
+_CSV_FIELD_COLUMNS: Dict[Tuple[str, ...], Tuple[str, str, str, str, str]] = {
+    ('Run Date', 'Action', 'Symbol', 'Quantity', 'Price'):
+        ('Run Date', 'Action', 'Symbol', 'Quantity', 'Price'),
+    ('Trade Date', 'Action', 'Symbol', 'Quantity', 'Price'):
+        ('Trade Date', 'Action', 'Symbol', 'Quantity', 'Price'),
+    ('Date', 'Type', 'Symbol', 'Shares', 'Price'):
+        ('Date', 'Type', 'Symbol', 'Shares', 'Price'),
+    ('Execution Date', 'Side', 'Symbol', 'Quantity', 'Price'):
+        ('Execution Date', 'Side', 'Symbol', 'Quantity', 'Price'),
+}
+# Known layouts keyed by their distinct leading column ('Run Date', 'Trade Date', ...)
+_CSV_FIRST_COLUMN = {pattern[0]: pattern for pattern in _CSV_FIELD_COLUMNS}
+# Optional columns picked up when present in the export
+_CSV_OPTIONAL_COLUMNS = ('Commission', 'Fees', 'Account', 'Order ID')
+
+# Email count at which process_fidelity_emails parses files in a process pool
+_PARALLEL_EMAIL_MIN_FILES = 4
+
+# Deletion table for currency symbols and thousands separators in numeric CSV fields
+_NUM_STRIP_TABLE = str.maketrans('', '', '$,')
+
+# Lower-cased action values normalized to "Buy"; anything else is a "Sell"
+_BUY_ACTIONS = frozenset({'buy', 'bought', 'buy to open'})
+
+# Date layouts seen in Fidelity emails and exports: %m/%d/%y or %m/%d/%Y, %m-%d-%Y, %Y-%m-%d
+_DATE_FORMAT_RE = re.compile(
+    r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}|[0-9]{2})'
+    r'|([0-9]{1,2})-([0-9]{1,2})-([0-9]{4})'
+    r'|([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_date_cached(date_str: str) -> Optional[str]:
+    """Parse a Fidelity date string to an ISO date, or None if no known format matches"""
+    match = _DATE_FORMAT_RE.fullmatch(date_str)
+    if not match:
+        return None
+    
+    (slash_month, slash_day, slash_year,
+     dash_month, dash_day, dash_year,
+     iso_year, iso_month, iso_day) = match.groups()
+    if slash_year:
+        month, day, year = int(slash_month), int(slash_day), int(slash_year)
+        if len(slash_year) == 2:
+            # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+            year += 1900 if year >= 69 else 2000
+    elif dash_year:
+        month, day, year = int(dash_month), int(dash_day), int(dash_year)
+    else:
+        month, day, year = int(iso_month), int(iso_day), int(iso_year)
+    
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FidelityTrade:
     """Fidelity trade data structure"""
     trade_date: str
@@ -40,6 +121,80 @@ class FidelityTrade:
     time_in_force: str = ""
 
 
+def _parse_fidelity_email_file(email_file: Union[str, Path]) -> List[FidelityTrade]:
+    """Parse individual Fidelity email for trade data
+
+    Module level so worker processes can run it.
+    """
+    trades = []
+    
+    with open(email_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return trades
+        
+        # Map the file and decode only the bounded start of each section, so large
+        # attachments are never copied or decoded as a whole
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            starts = [0] + [match.start() for match in _SECTION_HEADING_RE.finditer(mm)]
+            ends = starts[1:] + [len(mm)]
+            trade_blocks = [
+                mm[start:min(end, start + _MAX_SECTION_BYTES)].decode('utf-8', 'ignore')
+                for start, end in zip(starts, ends)
+            ]
+    
+    # Extract trade information using regex patterns
+    # This is a simplified parser - you may need to adjust based on actual email format
+    
+    for block in trade_blocks:
+        try:
+            # Extract symbol, action, quantity, price and date in one pass
+            fields = _TRADE_FIELDS_RE.match(block)
+            if not fields:
+                continue
+            
+            symbol = fields.group('symbol')
+            action = "Buy" if fields.group('action').lower() in _BUY_ACTIONS else "Sell"
+            quantity = float(fields.group('qty').replace(',', ''))
+            price = float(fields.group('price').replace(',', ''))
+            trade_date = fields.group('date') or datetime.now().strftime('%m/%d/%y')
+            
+            if symbol and action and quantity and price:
+                trade_value = quantity * price
+                
+                trade = FidelityTrade(
+                    trade_date=trade_date,
+                    symbol=symbol,
+                    action=action,
+                    quantity=quantity,
+                    price=price,
+                    trade_value=trade_value
+                )
+                trades.append(trade)
+                
+        except Exception as e:
+            logger.warning(f"⚠️ Error parsing trade block: {e}")
+            continue
+    
+    return trades
+
+
+def _list_files(folder: Path, suffix: str) -> List[Tuple[str, str]]:
+    """List (path, name) pairs for non-hidden files ending in suffix, like glob('*' + suffix)"""
+    with os.scandir(folder) as entries:
+        return [
+            (entry.path, entry.name) for entry in entries
+            if entry.name.endswith(suffix) and not entry.name.startswith('.') and entry.is_file()
+        ]
+
+
+def _parse_fidelity_email_safe(email_file: str) -> Tuple[List[FidelityTrade], Optional[str]]:
+    """Parse an email, returning (trades, error message) instead of raising across processes"""
+    try:
+        return _parse_fidelity_email_file(email_file), None
+    except Exception as e:
+        return [], str(e)
+
+
 class FidelityIntegration:
     """Fidelity trade import automation"""
     
@@ -66,12 +221,7 @@ class FidelityIntegration:
                 r'Order Fill',
                 r'Execution Report'
             ],
-            'csv_headers': [
-                ['Run Date', 'Action', 'Symbol', 'Quantity', 'Price'],
-                ['Trade Date', 'Action', 'Symbol', 'Quantity', 'Price'],
-                ['Date', 'Type', 'Symbol', 'Shares', 'Price'],
-                ['Execution Date', 'Side', 'Symbol', 'Quantity', 'Price']
-            ]
+            'csv_headers': list(_CSV_FIELD_COLUMNS)
         }
     
     def process_fidelity_emails(self) -> List[FidelityTrade]:
@@ -79,215 +229,174 @@ class FidelityIntegration:
         trades = []
         
         # Look for email files in the email folder
-        for email_file in self.email_folder.glob("*.eml"):
+        email_files = _list_files(self.email_folder, ".eml")
+        email_paths = [path for path, _ in email_files]
+        processed_folder = str(self.processed_folder)
+        
+        # Parse in worker processes once there are enough files to outweigh pool startup
+        if len(email_files) >= _PARALLEL_EMAIL_MIN_FILES:
+            workers = min(len(email_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_parse_fidelity_email_safe, email_paths))
+        else:
+            results = map(_parse_fidelity_email_safe, email_paths)
+        
+        # Moves happen here in the main process, after each file has been parsed
+        for (email_path, email_name), (email_trades, error) in zip(email_files, results):
+            if error is not None:
+                logger.error(f"❌ Error processing email {email_name}: {error}")
+                continue
+            
             try:
-                email_trades = self._parse_fidelity_email(email_file)
                 trades.extend(email_trades)
                 
                 # Move to processed folder
-                processed_path = self.processed_folder / f"email_{email_file.name}"
-                email_file.rename(processed_path)
+                os.replace(email_path, os.path.join(processed_folder, f"email_{email_name}"))
                 
-                logger.info(f"📧 Processed email: {email_file.name} -> {len(email_trades)} trades")
+                logger.info(f"📧 Processed email: {email_name} -> {len(email_trades)} trades")
                 
             except Exception as e:
-                logger.error(f"❌ Error processing email {email_file.name}: {e}")
+                logger.error(f"❌ Error processing email {email_name}: {e}")
         
         return trades
     
-    def _parse_fidelity_email(self, email_file: Path) -> List[FidelityTrade]:
+    def _parse_fidelity_email(self, email_file: Union[str, Path]) -> List[FidelityTrade]:
         """Parse individual Fidelity email for trade data"""
-        trades = []
-        
-        with open(email_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract trade information using regex patterns
-        # This is a simplified parser - you may need to adjust based on actual email format
-        
-        # Look for trade confirmation patterns
-        trade_blocks = re.findall(
-            r'(?:Order|Trade|Execution).*?(?:Symbol|Ticker).*?(?:Quantity|Shares).*?(?:Price|Amount)',
-            content,
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        for block in trade_blocks:
-            try:
-                # Extract symbol
-                symbol_match = re.search(r'(?:Symbol|Ticker)[:\s]+([A-Z]{1,5})', block, re.IGNORECASE)
-                symbol = symbol_match.group(1) if symbol_match else None
-                
-                # Extract action (Buy/Sell)
-                action_match = re.search(r'(Buy|Sell|Bought|Sold)', block, re.IGNORECASE)
-                action = action_match.group(1) if action_match else None
-                if action:
-                    action = "Buy" if action.lower() in ['buy', 'bought'] else "Sell"
-                
-                # Extract quantity
-                qty_match = re.search(r'(?:Quantity|Shares)[:\s]+([\d,]+)', block, re.IGNORECASE)
-                quantity = float(qty_match.group(1).replace(',', '')) if qty_match else None
-                
-                # Extract price
-                price_match = re.search(r'(?:Price|Amount)[:\s]+\$?([\d,]+\.?\d*)', block, re.IGNORECASE)
-                price = float(price_match.group(1).replace(',', '')) if price_match else None
-                
-                # Extract date
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', block)
-                trade_date = date_match.group(1) if date_match else datetime.now().strftime('%m/%d/%y')
-                
-                if all([symbol, action, quantity, price]):
-                    trade_value = quantity * price
-                    
-                    trade = FidelityTrade(
-                        trade_date=trade_date,
-                        symbol=symbol,
-                        action=action,
-                        quantity=quantity,
-                        price=price,
-                        trade_value=trade_value
-                    )
-                    trades.append(trade)
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Error parsing trade block: {e}")
-                continue
-        
-        return trades
+        return _parse_fidelity_email_file(email_file)
     
-    def process_fidelity_csv(self, csv_file: Optional[Path] = None) -> List[FidelityTrade]:
-        """Process Fidelity CSV trade files"""
-        trades = []
-        
+    def process_fidelity_csv(self, csv_file: Optional[Path] = None) -> Iterator[FidelityTrade]:
+        """Process Fidelity CSV trade files, yielding trades as each file is streamed"""
         if csv_file:
-            csv_files = [csv_file]
+            csv_files = [(str(csv_file), os.path.basename(csv_file))]
         else:
-            csv_files = list(self.csv_folder.glob("*.csv"))
+            csv_files = _list_files(self.csv_folder, ".csv")
+        processed_folder = str(self.processed_folder)
         
-        for file_path in csv_files:
+        for file_path, file_name in csv_files:
             try:
-                file_trades = self._parse_fidelity_csv(file_path)
-                trades.extend(file_trades)
+                trade_count = 0
+                for trade in self._parse_fidelity_csv(file_path):
+                    trade_count += 1
+                    yield trade
                 
                 # Move to processed folder
-                processed_path = self.processed_folder / f"csv_{file_path.name}"
-                file_path.rename(processed_path)
+                os.replace(file_path, os.path.join(processed_folder, f"csv_{file_name}"))
                 
-                logger.info(f"📊 Processed CSV: {file_path.name} -> {len(file_trades)} trades")
+                logger.info(f"📊 Processed CSV: {file_name} -> {trade_count} trades")
                 
             except Exception as e:
-                logger.error(f"❌ Error processing CSV {file_path.name}: {e}")
-        
-        return trades
+                logger.error(f"❌ Error processing CSV {file_name}: {e}")
     
-    def _parse_fidelity_csv(self, csv_file: Path) -> List[FidelityTrade]:
-        """Parse Fidelity CSV file for trade data"""
-        trades = []
-        
+    def _parse_fidelity_csv(self, csv_file: Union[str, Path]) -> Iterator[FidelityTrade]:
+        """Parse Fidelity CSV file for trade data, one row at a time"""
         with open(csv_file, 'r', newline='', encoding='utf-8') as f:
-            # Try to detect the CSV format
-            sample = f.read(1024)
-            f.seek(0)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return
+            
+            # Detect the CSV format from the header row alone; the leading column identifies
+            # known layouts directly, with a scan of every pattern as the fallback
+            header_columns = set(header)
+            columns = None
+            header_pattern = _CSV_FIRST_COLUMN.get(header[0])
+            if header_pattern is not None and header_columns.issuperset(header_pattern):
+                columns = self._resolve_csv_columns(header, header_pattern)
+            if columns is None:
+                for header_pattern in self.trade_patterns['csv_headers']:
+                    if header_columns.issuperset(header_pattern):
+                        columns = self._resolve_csv_columns(header, header_pattern)
+                        if columns is not None:
+                            break
+                else:
+                    return
             
-            # Try different CSV formats
-            for header_pattern in self.trade_patterns['csv_headers']:
+            # Parse the remaining rows exactly once
+            for row in reader:
                 try:
-                    reader = csv.DictReader(f)
-                    
-                    # Check if headers match expected pattern
-                    if all(header in reader.fieldnames for header in header_pattern):
-                        for row in reader:
-                            try:
-                                trade = self._parse_csv_row(row, header_pattern)
-                                if trade:
-                                    trades.append(trade)
-                            except Exception as e:
-                                logger.warning(f"⚠️ Error parsing CSV row: {e}")
-                                continue
-                        
-                        break  # Found matching format
-                    
-                    f.seek(0)  # Reset file pointer for next attempt
-                    
-                except Exception:
-                    f.seek(0)  # Reset file pointer for next attempt
+                    trade = self._parse_csv_row(row, columns)
+                    if trade:
+                        yield trade
+                except Exception as e:
+                    logger.warning(f"⚠️ Error parsing CSV row: {e}")
                     continue
+    
+    def _resolve_csv_columns(self, header: List[str],
+                             header_pattern: Sequence[str]) -> Optional[Tuple[Optional[int], ...]]:
+        """Resolve the minimum row width, then positions for the pattern's fields and extras"""
+        columns = _CSV_FIELD_COLUMNS.get(tuple(header_pattern))
+        if columns is None:
+            return None
         
-        return trades
+        # Later duplicates win, matching csv.DictReader
+        positions = {name: i for i, name in enumerate(header)}
+        indices = (tuple(positions[name] for name in columns) +
+                   tuple(positions.get(name) for name in _CSV_OPTIONAL_COLUMNS))
+        row_width = max(i for i in indices if i is not None) + 1
+        return (row_width,) + indices
     
-    def _parse_csv_row(self, row: Dict[str, str], header_pattern: List[str]) -> Optional[FidelityTrade]:
-        """Parse individual CSV row based on header pattern"""
+    def _parse_csv_row(self, row: List[str],
+                       columns: Tuple[Optional[int], ...]) -> Optional[FidelityTrade]:
+        """Parse individual CSV row using positions from _resolve_csv_columns"""
+        (row_width, date_i, action_i, symbol_i, qty_i, price_i,
+         commission_i, fees_i, account_i, order_id_i) = columns
+        
+        # Short rows (blank lines, trailing disclaimers) are skipped without raising
+        if len(row) < row_width:
+            return None
+        
+        trade_date = row[date_i]
+        action = row[action_i]
+        symbol = row[symbol_i]
+        quantity_text = row[qty_i]
+        price_text = row[price_i]
+        
+        # Validate required fields before any numeric conversion
+        if not (trade_date and symbol and action and quantity_text and price_text):
+            return None
+        
+        # Extract additional fields if available; blank amounts count as zero
+        commission_text = row[commission_i] if commission_i is not None else ''
+        fees_text = row[fees_i] if fees_i is not None else ''
+        
         try:
-            # Map headers to expected fields
-            if header_pattern == ['Run Date', 'Action', 'Symbol', 'Quantity', 'Price']:
-                trade_date = row.get('Run Date', '')
-                action = row.get('Action', '')
-                symbol = row.get('Symbol', '')
-                quantity = float(row.get('Quantity', '0').replace(',', ''))
-                price = float(row.get('Price', '0').replace('$', '').replace(',', ''))
-                
-            elif header_pattern == ['Trade Date', 'Action', 'Symbol', 'Quantity', 'Price']:
-                trade_date = row.get('Trade Date', '')
-                action = row.get('Action', '')
-                symbol = row.get('Symbol', '')
-                quantity = float(row.get('Quantity', '0').replace(',', ''))
-                price = float(row.get('Price', '0').replace('$', '').replace(',', ''))
-                
-            elif header_pattern == ['Date', 'Type', 'Symbol', 'Shares', 'Price']:
-                trade_date = row.get('Date', '')
-                action = row.get('Type', '')
-                symbol = row.get('Symbol', '')
-                quantity = float(row.get('Shares', '0').replace(',', ''))
-                price = float(row.get('Price', '0').replace('$', '').replace(',', ''))
-                
-            elif header_pattern == ['Execution Date', 'Side', 'Symbol', 'Quantity', 'Price']:
-                trade_date = row.get('Execution Date', '')
-                action = row.get('Side', '')
-                symbol = row.get('Symbol', '')
-                quantity = float(row.get('Quantity', '0').replace(',', ''))
-                price = float(row.get('Price', '0').replace('$', '').replace(',', ''))
-                
-            else:
-                return None
-            
-            # Normalize action
-            if action:
-                action = "Buy" if action.lower() in ['buy', 'bought', 'buy to open'] else "Sell"
-            
-            # Validate required fields
-            if not all([trade_date, symbol, action, quantity, price]):
-                return None
-            
-            # Calculate trade value
-            trade_value = quantity * price
-            
-            # Extract additional fields if available
-            commission = float(row.get('Commission', '0').replace('$', '').replace(',', ''))
-            fees = float(row.get('Fees', '0').replace('$', '').replace(',', ''))
-            account = row.get('Account', '')
-            order_id = row.get('Order ID', '')
-            
-            return FidelityTrade(
-                trade_date=trade_date,
-                symbol=symbol,
-                action=action,
-                quantity=quantity,
-                price=price,
-                trade_value=trade_value,
-                commission=commission,
-                fees=fees,
-                account=account,
-                order_id=order_id
+            quantity = float(quantity_text.translate(_NUM_STRIP_TABLE))
+            price = float(price_text.translate(_NUM_STRIP_TABLE))
+            commission = (
+                float(commission_text.translate(_NUM_STRIP_TABLE)) if commission_text else 0.0
             )
-            
-        except Exception as e:
+            fees = float(fees_text.translate(_NUM_STRIP_TABLE)) if fees_text else 0.0
+        except ValueError as e:
             logger.warning(f"⚠️ Error parsing CSV row: {e}")
             return None
+        
+        if not (quantity and price):
+            return None
+        
+        # Normalize action
+        action = "Buy" if action.lower() in _BUY_ACTIONS else "Sell"
+        
+        return FidelityTrade(
+            trade_date=trade_date,
+            symbol=symbol,
+            action=action,
+            quantity=quantity,
+            price=price,
+            trade_value=quantity * price,
+            commission=commission,
+            fees=fees,
+            account=row[account_i] if account_i is not None else '',
+            order_id=row[order_id_i] if order_id_i is not None else ''
+        )
     
-    def import_trades_to_journal(self, trades: List[FidelityTrade]) -> int:
+    def import_trades_to_journal(self, trades: Iterable[FidelityTrade]) -> int:
         """Import Fidelity trades to trade journal"""
         imported_count = 0
         
+        # (symbol, timestamp) pairs already in the journal, loaded once per trade date
+        existing_keys: Set[Tuple[str, str]] = set()
+        loaded_dates: Set[str] = set()
+        
         for trade in trades:
             try:
                 # Convert to TradeEntry
@@ -304,14 +413,18 @@ class FidelityIntegration:
                 )
                 
                 # Check for duplicates
-                existing_trades = self.trade_journal.get_trades(
-                    symbol=trade.symbol,
-                    start_date=trade_entry.timestamp,
-                    end_date=trade_entry.timestamp
-                )
+                timestamp = trade_entry.timestamp
+                if timestamp not in loaded_dates:
+                    day_trades = self.trade_journal.get_trades(
+                        start_date=timestamp, end_date=timestamp
+                    )
+                    existing_keys.update((row['symbol'], timestamp) for row in day_trades)
+                    loaded_dates.add(timestamp)
                 
-                if not existing_trades:
-                    self.trade_journal.log_trade(trade_entry)
+                key = (trade.symbol, timestamp)
+                if key not in existing_keys:
+                    if self.trade_journal.log_trade(trade_entry):
+                        existing_keys.add(key)
                     imported_count += 1
                     logger.info(f"📝 Imported trade: {trade.symbol} {trade.action} {trade.quantity} @ {trade.price}")
                 else:
@@ -325,19 +438,12 @@ class FidelityIntegration:
     def _normalize_date(self, date_str: str) -> str:
         """Normalize date string to ISO format"""
         try:
-            # Try different date formats
-            for fmt in ['%m/%d/%y', '%m/%d/%Y', '%Y-%m-%d', '%m-%d-%Y']:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.date().isoformat()
-                except ValueError:
-                    continue
-            
-            # If no format matches, return current date
-            return datetime.now().date().isoformat()
-            
+            normalized = _normalize_date_cached(date_str)
         except Exception:
-            return datetime.now().date().isoformat()
+            normalized = None
+        
+        # If no format matches, return current date (not cached, so it follows the clock)
+        return normalized or datetime.now().date().isoformat()
     
     def auto_import_trades(self) -> Dict[str, Any]:
         """Automatically import all available Fidelity trades"""
@@ -353,18 +459,24 @@ class FidelityIntegration:
             email_trades = self.process_fidelity_emails()
             results['email_trades'] = len(email_trades)
             
-            # Process CSV files
-            csv_trades = self.process_fidelity_csv()
-            results['csv_trades'] = len(csv_trades)
+            # Process CSV files lazily, counting trades as they stream into the journal
+            def count_csv_trades(trades: Iterable[FidelityTrade]) -> Iterator[FidelityTrade]:
+                for trade in trades:
+                    results['csv_trades'] += 1
+                    yield trade
             
             # Combine all trades
-            all_trades = email_trades + csv_trades
+            all_trades = itertools.chain(
+                email_trades, count_csv_trades(self.process_fidelity_csv())
+            )
             
             # Import to journal
             imported_count = self.import_trades_to_journal(all_trades)
             results['imported_trades'] = imported_count
             
-            logger.info(f"✅ Auto-import completed: {imported_count} trades imported from {len(all_trades)} total")
+            total_trades = results['email_trades'] + results['csv_trades']
+            logger.info(f"✅ Auto-import completed: {imported_count} trades imported from "
+                        f"{total_trades} total")
             
         except Exception as e:
             error_msg = f"Auto-import failed: {e}"
@@ -390,8 +502,8 @@ class FidelityIntegration:
             config_file = Path('config/fidelity_email_config.json')
             config_file.parent.mkdir(exist_ok=True)
             
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Encode in one call and write once; json.dump issues a write per encoder chunk
+            config_file.write_text(json.dumps(config, indent=2))
             
             logger.info(f"✅ Email monitoring configured for {email_address}")
             return True
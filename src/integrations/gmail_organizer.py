@@ -3,16 +3,25 @@ Gmail Organizer for MarketMan
 Automatically moves read MarketMan alerts to a dedicated folder to keep inbox clean
 """
 
+import functools
+import json
 import os
 import pickle
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 
 # Add project root to path for imports
@@ -22,6 +31,69 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Name of the Gmail label/folder MarketMan files alerts under
+MARKETMAN_LABEL_NAME = "MarketMan"
+
+# Requests per Gmail batch call; the endpoint accepts up to 100, but Google advises
+# staying at 50 or below to avoid per-user rate limiting
+GMAIL_BATCH_SIZE = 50
+
+# Only the message fields the organizer reads (no payload, headers or body)
+GMAIL_MESSAGE_FIELDS = "id,threadId,labelIds,snippet"
+
+# Message IDs per users.messages.batchModify call (API maximum)
+GMAIL_BATCH_MODIFY_SIZE = 1000
+
+# Messages per users.messages.list page (API maximum)
+GMAIL_LIST_PAGE_SIZE = 500
+
+# Worker threads running batchModify chunks concurrently
+GMAIL_MODIFY_WORKERS = 4
+
+# Retries for rate-limited (429) or transiently failing Gmail calls; delays double from the
+# base with jitter, unless Gmail sends a Retry-After
+GMAIL_MAX_RETRIES = 5
+GMAIL_RETRY_BASE_DELAY = 0.1
+GMAIL_RETRY_MAX_DELAY = 10.0
+_RETRYABLE_STATUSES = frozenset({429, 500, 503})
+
+
+def _retry_delay(attempt: int, error: Optional[HttpError] = None) -> float:
+    """Seconds to wait before retry number attempt (0-based)"""
+    retry_after = error.resp.get("retry-after") if error is not None else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    delay = GMAIL_RETRY_BASE_DELAY * 2**attempt + random.uniform(0, GMAIL_RETRY_BASE_DELAY)
+    return min(delay, GMAIL_RETRY_MAX_DELAY)
+
+
+def _is_retryable(error) -> bool:
+    """Whether a Gmail error is worth retrying (rate limit or transient server error)"""
+    return isinstance(error, HttpError) and error.resp.status in _RETRYABLE_STATUSES
+
+
+def _execute_with_backoff(request, http=None):
+    """Execute a Gmail request, retrying 429/5xx responses with capped exponential backoff"""
+    for attempt in range(GMAIL_MAX_RETRIES + 1):
+        try:
+            return request.execute(http=http)
+        except HttpError as error:
+            if not _is_retryable(error) or attempt == GMAIL_MAX_RETRIES:
+                raise
+            delay = _retry_delay(attempt, error)
+            logger.warning(f"⚠️ Gmail returned {error.resp.status}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+
+@functools.lru_cache(maxsize=1)
+def _gmail_discovery_document() -> Optional[Dict]:
+    """Parsed Gmail discovery document bundled with googleapiclient (None if not bundled)"""
+    document = discovery_cache.get_static_doc("gmail", "v1")
+    return json.loads(document) if document else None
+
 
 class GmailOrganizer:
     """Organize Gmail messages for MarketMan"""
@@ -39,11 +111,21 @@ class GmailOrganizer:
             "config",
             "gmail_token.pickle",
         )
+        # MarketMan label ID is stable, so it is cached next to the token
+        self.label_cache_file = os.path.join(
+            os.path.dirname(self.token_file), "gmail_label_cache.json"
+        )
         self.service = None
+        self.credentials = None
         self.marketman_label_id = None
+        self._thread_local = threading.local()
 
     def authenticate(self):
         """Authenticate with Gmail API"""
+        # Reuse the existing service (and its keep-alive connection) while the token is valid
+        if self.service is not None and self.credentials is not None and self.credentials.valid:
+            return True
+
         creds = None
 
         # Load existing token
@@ -54,7 +136,11 @@ class GmailOrganizer:
         # If no valid credentials, get new ones
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
+                # Parse the discovery document while the refresh waits on the network
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    document_future = executor.submit(_gmail_discovery_document)
+                    creds.refresh(Request())
+                    document_future.result()
             else:
                 if not os.path.exists(self.credentials_file):
                     print(f"❌ Gmail credentials file not found: {self.credentials_file}")
@@ -72,27 +158,56 @@ class GmailOrganizer:
             with open(self.token_file, "wb") as token:
                 pickle.dump(creds, token)
 
-        self.service = build("gmail", "v1", credentials=creds)
+        self.credentials = creds
+        # Build from the bundled discovery document, parsed once per process, so neither
+        # a discovery fetch nor a re-parse happens on each authentication
+        document = _gmail_discovery_document()
+        if document is not None:
+            self.service = build_from_document(document, credentials=creds)
+        else:
+            self.service = build("gmail", "v1", credentials=creds)
         return True
 
+    def _thread_http(self):
+        """Authorized HTTP client for the calling thread (httplib2 is not thread-safe)"""
+        if self.credentials is None:
+            # Service was injected without credentials; fall back to its own client
+            return None
+
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
     def get_or_create_marketman_label(self) -> Optional[str]:
         """Get or create the MarketMan label/folder"""
         if not self.service:
             return None
 
+        if self.marketman_label_id:
+            return self.marketman_label_id
+
+        cached_label_id = self._load_cached_label_id()
+        if cached_label_id:
+            self.marketman_label_id = cached_label_id
+            logger.debug(f"Using cached MarketMan label: {cached_label_id}")
+            return cached_label_id
+
         try:
             # Check if MarketMan label exists
             labels = self.service.users().labels().list(userId="me").execute()
 
             for label in labels.get("labels", []):
-                if label["name"].lower() == "marketman":
+                if label["name"].lower() == MARKETMAN_LABEL_NAME.lower():
                     self.marketman_label_id = label["id"]
+                    self._save_cached_label_id(label["id"])
                     logger.info(f"Found existing MarketMan label: {label['id']}")
                     return label["id"]
 
             # Create MarketMan label
             label_object = {
-                "name": "MarketMan",
+                "name": MARKETMAN_LABEL_NAME,
                 "labelListVisibility": "labelShow",
                 "messageListVisibility": "show",
                 "color": {"textColor": "#ffffff", "backgroundColor": "#2da2bb"},  # Nice blue color
@@ -103,6 +218,7 @@ class GmailOrganizer:
             )
 
             self.marketman_label_id = created_label["id"]
+            self._save_cached_label_id(created_label["id"])
             logger.info(f"Created MarketMan label: {created_label['id']}")
             return created_label["id"]
 
@@ -110,8 +226,42 @@ class GmailOrganizer:
             logger.error(f"Error managing MarketMan label: {error}")
             return None
 
-    def find_marketman_messages(self, days_back: int = 7, read_only: bool = True) -> List[Dict]:
-        """Find MarketMan-related messages"""
+    def _load_cached_label_id(self) -> Optional[str]:
+        """Read the MarketMan label ID saved by a previous run"""
+        try:
+            with open(self.label_cache_file, "r") as f:
+                return json.load(f).get("marketman_label_id")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _save_cached_label_id(self, label_id: str):
+        """Persist the MarketMan label ID so later runs skip labels().list()"""
+        try:
+            with open(self.label_cache_file, "w") as f:
+                json.dump({"marketman_label_id": label_id}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache MarketMan label ID: {e}")
+
+    def _forget_marketman_label(self):
+        """Drop a label ID that Gmail no longer accepts; the next run looks it up again"""
+        self.marketman_label_id = None
+        try:
+            os.remove(self.label_cache_file)
+        except OSError:
+            pass
+
+    def find_marketman_messages(
+        self,
+        days_back: int = 7,
+        read_only: bool = True,
+        inbox_only: bool = False,
+        include_details: bool = True,
+    ) -> List[Dict]:
+        """Find MarketMan-related messages
+
+        inbox_only asks Gmail for inbox messages without the MarketMan label, and
+        include_details=False returns just the ids/threadIds from the search.
+        """
         if not self.service:
             return []
 
@@ -124,6 +274,12 @@ class GmailOrganizer:
             if read_only:
                 query_parts.append("is:read")
 
+            list_kwargs = {}
+            if inbox_only:
+                # Let Gmail drop already-organized messages instead of filtering locally
+                query_parts.append(f"-label:{MARKETMAN_LABEL_NAME}")
+                list_kwargs["labelIds"] = ["INBOX"]
+
             # Date filter
             date_filter = (datetime.now() - timedelta(days=days_back)).strftime("%Y/%m/%d")
             query_parts.append(f"after:{date_filter}")
@@ -134,34 +290,75 @@ class GmailOrganizer:
 
             # Search for messages
             results = (
-                self.service.users().messages().list(userId="me", q=query, maxResults=100).execute()
+                self.service.users()
+                .messages()
+                .list(userId="me", q=query, maxResults=100, **list_kwargs)
+                .execute()
             )
 
             messages = results.get("messages", [])
             logger.info(f"Found {len(messages)} Google Alerts messages")
 
-            # Get message details for all messages (not just first 50)
-            detailed_messages = []
-            for i, message in enumerate(messages):
-                try:
-                    if i > 0 and i % 10 == 0:  # Progress indicator
-                        logger.info(f"Processing message {i+1}/{len(messages)}")
-
-                    msg_detail = (
-                        self.service.users().messages().get(userId="me", id=message["id"]).execute()
-                    )
-                    detailed_messages.append(
-                        {
-                            "id": message["id"],
-                            "threadId": msg_detail.get("threadId"),
-                            "labels": msg_detail.get("labelIds", []),
-                            "snippet": msg_detail.get("snippet", ""),
-                            "payload": msg_detail.get("payload", {}),
-                        }
-                    )
-                except HttpError as error:
-                    logger.warning(f"Error getting message {message['id']}: {error}")
-                    continue
+            if not include_details:
+                return [
+                    {"id": message["id"], "threadId": message.get("threadId")}
+                    for message in messages
+                ]
+
+            # Get label/snippet metadata for all messages, one batched HTTP request per chunk
+            details = {}
+            retry_ids = []
+
+            def collect_detail(request_id, msg_detail, error):
+                if error is not None:
+                    if _is_retryable(error):
+                        retry_ids.append(request_id)
+                    else:
+                        logger.warning(f"Error getting message {request_id}: {error}")
+                    return
+                details[request_id] = {
+                    "id": request_id,
+                    "threadId": msg_detail.get("threadId"),
+                    "labels": msg_detail.get("labelIds", []),
+                    "snippet": msg_detail.get("snippet", ""),
+                }
+
+            messages_api = self.service.users().messages()
+            for start in range(0, len(messages), GMAIL_BATCH_SIZE):
+                if start > 0:  # Progress indicator
+                    logger.info(f"Processing message {start+1}/{len(messages)}")
+
+                pending_ids = [
+                    message["id"] for message in messages[start : start + GMAIL_BATCH_SIZE]
+                ]
+                for attempt in range(GMAIL_MAX_RETRIES + 1):
+                    batch = self.service.new_batch_http_request(callback=collect_detail)
+                    for msg_id in pending_ids:
+                        batch.add(
+                            messages_api.get(
+                                userId="me",
+                                id=msg_id,
+                                format="metadata",
+                                fields=GMAIL_MESSAGE_FIELDS,
+                            ),
+                            request_id=msg_id,
+                        )
+                    _execute_with_backoff(batch)
+
+                    # Re-send only the parts Gmail rate limited
+                    if not retry_ids:
+                        break
+                    pending_ids = retry_ids[:]
+                    retry_ids.clear()
+                    if attempt == GMAIL_MAX_RETRIES:
+                        logger.warning(f"Giving up on {len(pending_ids)} rate-limited messages")
+                        break
+                    time.sleep(_retry_delay(attempt))
+
+            # Batch callbacks can arrive in any order; keep the search order
+            detailed_messages = [
+                details[message["id"]] for message in messages if message["id"] in details
+            ]
 
             logger.info(f"Successfully processed {len(detailed_messages)} messages")
 
@@ -180,28 +377,92 @@ class GmailOrganizer:
         if not message_ids:
             return {}
 
+        # Add MarketMan label and remove INBOX label
+        results = self._batch_modify_labels(
+            message_ids, add_label_ids=[self.marketman_label_id], remove_label_ids=["INBOX"]
+        )
+
+        success_count = sum(1 for success in results.values() if success)
+        logger.info(
+            f"Successfully moved {success_count}/{len(message_ids)} messages to MarketMan folder"
+        )
+
+        return results
+
+    def _batch_modify_labels(
+        self, message_ids: List[str], add_label_ids: List[str], remove_label_ids: List[str]
+    ) -> Dict[str, bool]:
+        """Apply the same label change to many messages, one batchModify call per chunk"""
         results = {}
+        messages_api = self.service.users().messages()
 
-        for msg_id in message_ids:
+        for start in range(0, len(message_ids), GMAIL_BATCH_MODIFY_SIZE):
+            chunk = message_ids[start : start + GMAIL_BATCH_MODIFY_SIZE]
             try:
-                # Add MarketMan label and remove INBOX label
-                self.service.users().messages().modify(
+                request = messages_api.batchModify(
                     userId="me",
-                    id=msg_id,
-                    body={"addLabelIds": [self.marketman_label_id], "removeLabelIds": ["INBOX"]},
-                ).execute()
+                    body={
+                        "ids": chunk,
+                        "addLabelIds": add_label_ids,
+                        "removeLabelIds": remove_label_ids,
+                    },
+                )
+                _execute_with_backoff(request, http=self._thread_http())
+                success = True
+                logger.debug(f"Relabeled {len(chunk)} messages")
+            except HttpError as error:
+                logger.error(f"Error relabeling {len(chunk)} messages: {error}")
+                success = False
+                # The cached label may have been deleted in Gmail
+                if error.resp.status in (400, 404):
+                    self._forget_marketman_label()
 
-                results[msg_id] = True
-                logger.debug(f"Moved message {msg_id} to MarketMan folder")
+            for msg_id in chunk:
+                results[msg_id] = success
 
-            except HttpError as error:
-                logger.error(f"Error moving message {msg_id}: {error}")
-                results[msg_id] = False
+        return results
 
-        success_count = sum(1 for success in results.values() if success)
-        logger.info(
-            f"Successfully moved {success_count}/{len(message_ids)} messages to MarketMan folder"
-        )
+    def _relabel_listed_messages(
+        self, add_label_ids: List[str], remove_label_ids: List[str], **list_kwargs
+    ) -> Dict[str, bool]:
+        """Relabel every message matching a list() query
+
+        All pages are listed before anything is modified: relabeling can drop messages out of
+        the query (e.g. removing the label being listed), which would shift later pages under
+        the pageToken and skip messages. The batchModify chunks then run on worker threads.
+        """
+        messages_api = self.service.users().messages()
+        message_ids = []
+        page_token = None
+
+        while True:
+            page = _execute_with_backoff(
+                messages_api.list(
+                    userId="me",
+                    maxResults=GMAIL_LIST_PAGE_SIZE,
+                    pageToken=page_token,
+                    **list_kwargs,
+                )
+            )
+            message_ids.extend(message["id"] for message in page.get("messages", []))
+
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                break
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=GMAIL_MODIFY_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    self._batch_modify_labels,
+                    message_ids[start : start + GMAIL_BATCH_MODIFY_SIZE],
+                    add_label_ids,
+                    remove_label_ids,
+                )
+                for start in range(0, len(message_ids), GMAIL_BATCH_MODIFY_SIZE)
+            ]
+            for future in futures:
+                results.update(future.result())
 
         return results
 
@@ -215,22 +476,17 @@ class GmailOrganizer:
         if not self.get_or_create_marketman_label():
             return {"error": "Could not create/find MarketMan label"}
 
-        # Find Google Alerts messages
-        messages = self.find_marketman_messages(days_back=days_back, read_only=True)
-
-        # Filter out messages already in MarketMan folder
-        inbox_messages = [
-            msg
-            for msg in messages
-            if "INBOX" in msg.get("labels", [])
-            and self.marketman_label_id not in msg.get("labels", [])
-        ]
+        # Find read Google Alerts still in the inbox; Gmail filters out the MarketMan folder,
+        # and snippets are only fetched when a dry run needs to show them
+        inbox_messages = self.find_marketman_messages(
+            days_back=days_back, read_only=True, inbox_only=True, include_details=dry_run
+        )
 
         logger.info(f"Found {len(inbox_messages)} read Google Alerts messages in inbox to organize")
 
         if not inbox_messages:
             return {
-                "total_found": len(messages),
+                "total_found": len(inbox_messages),
                 "inbox_messages": len(inbox_messages),
                 "moved": 0,
                 "message": "No messages to organize",
@@ -244,7 +500,7 @@ class GmailOrganizer:
                 logger.info(f"  • ... and {len(inbox_messages)-5} more")
 
             return {
-                "total_found": len(messages),
+                "total_found": len(inbox_messages),
                 "inbox_messages": len(inbox_messages),
                 "moved": 0,
                 "dry_run": True,
@@ -258,7 +514,7 @@ class GmailOrganizer:
         success_count = sum(1 for success in move_results.values() if success)
 
         return {
-            "total_found": len(messages),
+            "total_found": len(inbox_messages),
             "inbox_messages": len(inbox_messages),
             "moved": success_count,
             "failed": len(move_results) - success_count,
@@ -276,40 +532,17 @@ class GmailOrganizer:
             return {"error": "Could not find MarketMan label"}
 
         try:
-            # Find all messages in MarketMan folder
-            results = (
-                self.service.users()
-                .messages()
-                .list(userId="me", labelIds=[self.marketman_label_id], maxResults=500)
-                .execute()
+            # Remove MarketMan label and add INBOX label for every page of the folder
+            move_results = self._relabel_listed_messages(
+                add_label_ids=["INBOX"],
+                remove_label_ids=[self.marketman_label_id],
+                labelIds=[self.marketman_label_id],
             )
+            logger.info(f"Found {len(move_results)} messages in MarketMan folder")
 
-            marketman_messages = results.get("messages", [])
-            logger.info(f"Found {len(marketman_messages)} messages in MarketMan folder")
-
-            if not marketman_messages:
+            if not move_results:
                 return {"moved": 0, "message": "No messages found in MarketMan folder"}
 
-            # Move messages back to inbox
-            move_results = {}
-            for message in marketman_messages:
-                try:
-                    # Remove MarketMan label and add INBOX label
-                    self.service.users().messages().modify(
-                        userId="me",
-                        id=message["id"],
-                        body={
-                            "removeLabelIds": [self.marketman_label_id],
-                            "addLabelIds": ["INBOX"],
-                        },
-                    ).execute()
-
-                    move_results[message["id"]] = True
-
-                except HttpError as error:
-                    logger.error(f"Error moving message {message['id']}: {error}")
-                    move_results[message["id"]] = False
-
             success_count = sum(1 for success in move_results.values() if success)
 
             return {
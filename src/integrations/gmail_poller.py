@@ -2,156 +2,392 @@
 Gmail Integration - Email parsing and Google Alerts processing
 """
 import os
+import base64
 import imaplib
 import email
+import itertools
+import quopri
 import re
 import html
 import urllib.parse
 import logging
+import time
 from datetime import datetime
+from typing import Optional
 from email.header import decode_header
 
+from lxml import etree
+from lxml import html as lxml_html
+
 logger = logging.getLogger(__name__)
 
+# Messages per IMAP FETCH command; one round trip per chunk instead of per message
+IMAP_FETCH_CHUNK_SIZE = 100
+
+# Tokens of an IMAP parenthesized list such as a BODYSTRUCTURE response
+_IMAP_LIST_TOKEN_RE = re.compile(rb'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()"]+')
+# Untagged FETCH lines: "<seq> (... BODYSTRUCTURE (...))" and the leading sequence number
+_FETCH_BODYSTRUCTURE_RE = re.compile(rb"^(\d+) \(.*?BODYSTRUCTURE (\(.*\))\)$", re.DOTALL)
+_FETCH_MSG_ID_RE = re.compile(rb"^(\d+) \(")
+
+# Search term in "Google Alert - YOUR_SEARCH_TERM" subjects
+_SUBJECT_TERM_RE = re.compile(r"Google Alert - (.+)")
+
+# Target of a google.com/url redirect: the first non-empty url= query parameter
+_REDIRECT_TARGET_RE = re.compile(r"[?&]url=([^&#]+)")
+
+# Google Alert structure: article titles live in the itemprop="name" span inside each
+# itemprop="url" link, followed by an itemprop="description" div
+_ARTICLE_LINKS_XPATH = etree.XPath('//a[@itemprop="url"][.//span[@itemprop="name"]]')
+_ARTICLE_NAME_XPATH = etree.XPath('.//span[@itemprop="name"]')
+_DESCRIPTIONS_XPATH = etree.XPath('//div[@itemprop="description"]')
+
+
+def _parse_imap_list(data: bytes) -> list:
+    """Parse an IMAP parenthesized list into nested Python lists (NIL becomes None)"""
+    stack = [[]]
+    for token in _IMAP_LIST_TOKEN_RE.findall(data):
+        if token == b"(":
+            stack.append([])
+        elif token == b")":
+            completed = stack.pop()
+            stack[-1].append(completed)
+        elif token[:1] == b'"':
+            value = token[1:-1].replace(b'\\"', b'"').replace(b"\\\\", b"\\")
+            stack[-1].append(value.decode("utf-8", "replace"))
+        elif token.upper() == b"NIL":
+            stack[-1].append(None)
+        else:
+            stack[-1].append(token.decode("ascii", "replace"))
+    if len(stack) != 1:
+        raise ValueError("unbalanced IMAP list")
+    return stack[0]
+
+
+def _find_html_part(structure: list, section: str = ""):
+    """Locate the text/html part in a BODYSTRUCTURE as (section, encoding, charset)"""
+    if structure and isinstance(structure[0], list):
+        # Multipart: child parts come first, then the subtype and extension data
+        children = itertools.takewhile(lambda part: isinstance(part, list), structure)
+        for index, child in enumerate(children, 1):
+            found = _find_html_part(child, f"{section}.{index}" if section else str(index))
+            if found:
+                return found
+        return None
+
+    if len(structure) < 6 or not structure[0] or not structure[1]:
+        return None
+    if structure[0].lower() != "text" or structure[1].lower() != "html":
+        return None
+
+    params = structure[2] or []
+    charset = None
+    for key, value in zip(params[::2], params[1::2]):
+        if isinstance(key, str) and key.lower() == "charset":
+            charset = value
+    # A single-part message's body is section 1
+    return section or "1", (structure[5] or "7bit").lower(), charset
+
+
+def _decode_part(payload: bytes, encoding: str, charset: Optional[str] = None) -> str:
+    """Undo the transfer encoding of a fetched body part and decode it to text"""
+    if encoding == "base64":
+        payload = base64.b64decode(payload)
+    elif encoding == "quoted-printable":
+        payload = quopri.decodestring(payload)
+    try:
+        return payload.decode(charset or "utf-8", "replace")
+    except LookupError:
+        return payload.decode("utf-8", "replace")
+
 
 class GmailPoller:
     def __init__(self):
         self.imap_server = "imap.gmail.com"
         self.email_user = os.getenv("GMAIL_USER")
         self.email_password = os.getenv("GMAIL_APP_PASSWORD")  # Use App Password for security
+        self._mail = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def connect_to_gmail(self):
-        """Connect to Gmail via IMAP"""
+        """Connect to Gmail via IMAP, reusing the open connection while it is alive"""
+        if self._mail is not None:
+            try:
+                status, _ = self._mail.noop()
+                if status == "OK":
+                    return self._mail
+            except (imaplib.IMAP4.error, OSError):
+                pass
+            logger.info("Gmail IMAP connection went stale, reconnecting")
+            self._drop_connection()
+
         try:
             mail = imaplib.IMAP4_SSL(self.imap_server)
             mail.login(self.email_user, self.email_password)
             logger.info("Successfully connected to Gmail")
+            self._mail = mail
             return mail
         except Exception as e:
             logger.error(f"Failed to connect to Gmail: {e}")
             return None
 
+    def close(self):
+        """Log out of the cached IMAP connection"""
+        if self._mail is None:
+            return
+        try:
+            self._mail.logout()
+        except Exception:
+            pass
+        self._mail = None
+
+    def _drop_connection(self):
+        """Forget a connection that errored so the next call opens a fresh one"""
+        try:
+            self._mail.shutdown()
+        except Exception:
+            pass
+        self._mail = None
+
     def get_google_alerts(self):
         """Fetch unread Google Alerts from Gmail"""
+        return list(self.iter_google_alerts())
+
+    def iter_google_alerts(self):
+        """Yield unread Google Alerts from Gmail one at a time as each FETCH chunk is parsed
+
+        Alerts are only yielded between chunks, so no IMAP command is left in flight while
+        the consumer analyzes them (or if it raises), and at most one chunk is held in memory.
+        """
         mail = self.connect_to_gmail()
         if not mail:
-            return []
+            return
 
+        # The connection stays open for the next cycle; call close() when done polling
         try:
             mail.select("inbox")
+            yield from self._iter_unread_alerts(mail)
+        except Exception as e:
+            logger.error(f"Error fetching Google Alerts: {e}")
+            self._drop_connection()
 
-            # Search for unread emails from Google Alerts
-            status, messages = mail.search(None, 'UNSEEN FROM "googlealerts-noreply@google.com"')
-
-            if status != "OK":
-                logger.error("Failed to search emails")
-                return []
+    def _iter_unread_alerts(self, mail):
+        """Search the selected mailbox for unread Google Alerts and yield them parsed"""
+        alert_count = 0
 
-            alerts = []
-            message_ids = messages[0].split()
+        # Search for unread emails from Google Alerts
+        status, messages = mail.search(None, 'UNSEEN FROM "googlealerts-noreply@google.com"')
 
-            for msg_id in message_ids:
-                try:
-                    status, msg_data = mail.fetch(msg_id, "(RFC822)")
-                    if status != "OK":
-                        continue
+        if status != "OK":
+            logger.error("Failed to search emails")
+            return
 
-                    # Parse email
-                    email_body = msg_data[0][1]
-                    email_message = email.message_from_bytes(email_body)
+        message_ids = messages[0].split()
 
-                    # Extract content
-                    alert_data = self.parse_google_alert(email_message)
+        for start in range(0, len(message_ids), IMAP_FETCH_CHUNK_SIZE):
+            # Fetch the whole chunk with one sequence set, e.g. b"1,5,9,12"
+            sequence_set = b",".join(message_ids[start : start + IMAP_FETCH_CHUNK_SIZE])
+            # Read the chunk's responses completely before handing any alert out; alerts
+            # parsed before an error are kept, since fetching has marked them read
+            chunk_alerts = []
+            try:
+                for alert_data in self._fetch_alerts(mail, sequence_set):
                     if alert_data:
-                        alerts.append(alert_data)
+                        chunk_alerts.append(alert_data)
+            except (imaplib.IMAP4.abort, OSError):
+                raise
+            except Exception as e:
+                logger.error(f"Error fetching emails {sequence_set!r}: {e}")
+
+            alert_count += len(chunk_alerts)
+            yield from chunk_alerts
+
+        logger.info(f"Found {alert_count} Google Alerts")
+
+    def _fetch_alerts(self, mail, sequence_set):
+        """Fetch only the subject and text/html part of each message and parse the alerts
+
+        BODYSTRUCTURE locates the HTML part so attachments and other alternatives are never
+        downloaded; messages whose structure cannot be used fall back to a full RFC822 fetch.
+        """
+        status, structure_data = mail.fetch(sequence_set, "(BODYSTRUCTURE)")
+        if status != "OK":
+            return
+
+        html_parts = {}
+        fallback_ids = []
+        for item in structure_data:
+            # Literals inside a BODYSTRUCTURE arrive as tuples; leave those to RFC822
+            header = item[0] if isinstance(item, tuple) else item
+            msg_id_match = _FETCH_MSG_ID_RE.match(header)
+            if not msg_id_match:
+                continue
+            msg_id = msg_id_match.group(1)
+
+            match = _FETCH_BODYSTRUCTURE_RE.match(item) if isinstance(item, bytes) else None
+            try:
+                html_part = match and _find_html_part(_parse_imap_list(match.group(2))[0])
+            except (ValueError, IndexError, TypeError):
+                html_part = None
+            if html_part:
+                html_parts[msg_id] = html_part
+            else:
+                fallback_ids.append(msg_id)
+
+        # Fetch commands take one section list, so group messages by HTML section
+        by_section = {}
+        for msg_id, (section, _, _) in html_parts.items():
+            by_section.setdefault(section, []).append(msg_id)
 
+        for section, msg_ids in by_section.items():
+            status, msg_data = mail.fetch(
+                b",".join(msg_ids), f"(BODY[HEADER.FIELDS (SUBJECT)] BODY[{section}])"
+            )
+            if status != "OK":
+                fallback_ids.extend(msg_ids)
+                continue
+
+            fetched = {}
+            msg_id = None
+            for item in msg_data:
+                if not isinstance(item, tuple):
+                    continue
+                msg_id_match = _FETCH_MSG_ID_RE.match(item[0])
+                if msg_id_match:
+                    msg_id = msg_id_match.group(1)
+                part = "subject" if b"HEADER.FIELDS" in item[0].upper() else "body"
+                fetched.setdefault(msg_id, {})[part] = item[1]
+
+            for msg_id in msg_ids:
+                parts = fetched.get(msg_id, {})
+                if "subject" not in parts or "body" not in parts:
+                    fallback_ids.append(msg_id)
+                    continue
+
+                _, encoding, charset = html_parts[msg_id]
+                try:
+                    subject = email.message_from_bytes(parts["subject"])["Subject"]
+                    body = _decode_part(parts["body"], encoding, charset)
+                    yield self._build_alert(subject, body)
                 except Exception as e:
-                    logger.error(f"Error processing email {msg_id}: {e}")
+                    logger.error(f"Error parsing Google Alert {msg_id}: {e}")
 
-            mail.close()
-            mail.logout()
-            logger.info(f"Found {len(alerts)} Google Alerts")
-            return alerts
+        if fallback_ids:
+            yield from self._fetch_full_alerts(mail, b",".join(fallback_ids))
 
-        except Exception as e:
-            logger.error(f"Error fetching Google Alerts: {e}")
-            return []
+    def _fetch_full_alerts(self, mail, sequence_set):
+        """Fetch complete RFC822 messages and parse the alerts"""
+        status, msg_data = mail.fetch(sequence_set, "(RFC822)")
+        if status != "OK":
+            return
+
+        # Each message arrives as a (header, body) tuple followed by a b")" terminator
+        for item in msg_data:
+            if not isinstance(item, tuple):
+                continue
+
+            msg_id = item[0].split()[0]
+            try:
+                # Parse email
+                email_message = email.message_from_bytes(item[1])
+
+                # Extract content
+                alert_data = self.parse_google_alert(email_message)
+            except Exception as e:
+                logger.error(f"Error processing email {msg_id}: {e}")
+                continue
+
+            yield alert_data
 
     def parse_google_alert(self, email_message):
         """Parse Google Alert email to extract title, summary, and article snippet"""
         try:
-            # Get subject
-            subject = decode_header(email_message["Subject"])[0][0]
-            if isinstance(subject, bytes):
-                subject = subject.decode()
-
-            # Extract the search term from subject (format: "Google Alert - YOUR_SEARCH_TERM")
-            search_term = re.search(r"Google Alert - (.+)", subject)
-            search_term = search_term.group(1) if search_term else "Unknown"
-
-            # Get email body
+            # Get email body; get_payload(decode=True) has already undone the transfer
+            # encoding, so only the declared charset is left to apply
             body = ""
+            html_part = None
             if email_message.is_multipart():
                 for part in email_message.walk():
                     if part.get_content_type() == "text/html":
-                        body = part.get_payload(decode=True).decode()
+                        html_part = part
                         break
             else:
-                body = email_message.get_payload(decode=True).decode()
+                html_part = email_message
+            if html_part is not None:
+                body = _decode_part(
+                    html_part.get_payload(decode=True) or b"",
+                    "8bit",
+                    html_part.get_content_charset(),
+                )
 
-            # Extract articles from HTML body
-            articles = self.extract_articles_from_html(body)
-
-            return {
-                "search_term": search_term,
-                "timestamp": datetime.now().isoformat(),
-                "articles": articles,
-            }
+            return self._build_alert(email_message["Subject"], body)
 
         except Exception as e:
             logger.error(f"Error parsing Google Alert: {e}")
             return None
 
+    def _build_alert(self, subject_header, html_body):
+        """Build the alert dict from a raw Subject header and the decoded HTML body"""
+        # Get subject
+        subject = decode_header(subject_header)[0][0]
+        if isinstance(subject, bytes):
+            subject = subject.decode()
+
+        # Extract the search term from subject (format: "Google Alert - YOUR_SEARCH_TERM")
+        search_term = _SUBJECT_TERM_RE.search(subject)
+        search_term = search_term.group(1) if search_term else "Unknown"
+
+        # Extract articles from HTML body; the extractor returns early for mail without
+        # article markup (confirmations and other plain mail from the alerts sender)
+        articles = self.extract_articles_from_html(html_body)
+
+        return {
+            "search_term": search_term,
+            "timestamp": datetime.now().isoformat(),
+            "articles": articles,
+        }
+
     def extract_articles_from_html(self, html_body):
         """Extract article titles, links, and snippets from Google Alert HTML"""
-        # Debug: Save the HTML to see what we're working with
-        logger.info("📧 DEBUG: Analyzing email HTML structure...")
+        logger.debug("📧 DEBUG: Analyzing email HTML structure...")
 
-        # Write HTML to file for debugging
-        with open("debug_email.html", "w", encoding="utf-8") as f:
-            f.write(html_body)
-        logger.info("📧 HTML saved to debug_email.html for inspection")
+        # Only dump the raw HTML when explicitly asked to, to keep disk I/O out of polling
+        if os.environ.get("GMAIL_DEBUG_DUMP"):
+            debug_file = f"debug_email_{int(time.time() * 1000)}.html"
+            with open(debug_file, "w", encoding="utf-8") as f:
+                f.write(html_body)
+            logger.debug(f"📧 HTML saved to {debug_file} for inspection")
 
         articles = []
 
-        # Updated regex patterns for current Google Alert structure
-        # Look for article titles in the itemprop="name" spans
-        title_link_pattern = (
-            r'<a href="([^"]*)" itemprop="url"[^>]*>.*?<span itemprop="name"[^>]*>(.*?)</span>'
-        )
-        description_pattern = r'<div itemprop="description"[^>]*>(.*?)</div>'
+        # Every article carries itemprop attributes, so bodies without any skip the parse
+        if not html_body or "itemprop" not in html_body:
+            logger.info("📧 No article markup in email body, nothing to extract")
+            return articles
 
-        # Find title links and descriptions
-        title_links = re.findall(title_link_pattern, html_body, re.DOTALL)
-        descriptions = re.findall(description_pattern, html_body, re.DOTALL)
+        # Parse once with libxml2; text_content() strips tags and decodes entities
+        tree = lxml_html.fromstring(html_body)
+        title_links = _ARTICLE_LINKS_XPATH(tree)
+        descriptions = _DESCRIPTIONS_XPATH(tree)
 
         logger.info(f"📧 Found {len(title_links)} articles with {len(descriptions)} descriptions")
 
         # Process the extracted articles
-        for i, (link, title_html) in enumerate(title_links):
-            # Clean up the title (remove HTML tags and decode)
-            title = re.sub(r"<[^>]+>", "", title_html).strip()
-
-            # Decode HTML entities properly
-            title = html.unescape(title)
+        for i, anchor in enumerate(title_links):
+            link = anchor.get("href", "")
+            title = _ARTICLE_NAME_XPATH(anchor)[0].text_content().strip()
 
             # Get corresponding description
             description = ""
             if i < len(descriptions):
-                description = re.sub(r"<[^>]+>", "", descriptions[i]).strip()
-                description = html.unescape(description)
+                description = descriptions[i].text_content().strip()
 
-            logger.info(f"📧 Extracted article: '{title}' -> {description[:100]}...")
+            logger.debug(f"📧 Extracted article: '{title}' -> {description[:100]}...")
 
             # Skip obvious UI elements
             if len(title) < 10 or "flag as irrelevant" in title.lower():
@@ -164,28 +400,25 @@ class GmailPoller:
             articles.append({"title": title, "link": cleaned_link, "snippet": description})
 
         logger.info(f"📧 Extracted {len(articles)} valid articles after filtering")
-        for i, article in enumerate(articles):
-            logger.info(f"📧 Article {i+1}: '{article['title'][:80]}...'")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, article in enumerate(articles):
+                logger.debug(f"📧 Article {i+1}: '{article['title'][:80]}...'")
 
         return articles
 
     def clean_google_redirect_url(self, url):
         """Extract the actual URL from Google's redirect URL"""
         if "google.com/url" in url:
-            try:
-                # First decode HTML entities like &amp;
+            # First decode HTML entities like &amp;
+            if "&" in url:
                 url = html.unescape(url)
 
-                # Parse the URL parameters
-                parsed = urllib.parse.urlparse(url)
-                params = urllib.parse.parse_qs(parsed.query)
-
-                # Extract the actual URL from the 'url' parameter
-                if "url" in params:
-                    actual_url = params["url"][0]
-                    logger.debug(f"🔗 Cleaned Google redirect: {actual_url[:100]}...")
-                    return actual_url
-            except Exception as e:
-                logger.warning(f"⚠️ Error cleaning Google URL: {e}")
+            # Read just the 'url' query parameter instead of parsing the whole query
+            query_start = url.find("?")
+            match = _REDIRECT_TARGET_RE.search(url, query_start) if query_start >= 0 else None
+            if match:
+                actual_url = urllib.parse.unquote_plus(match.group(1))
+                logger.debug(f"🔗 Cleaned Google redirect: {actual_url[:100]}...")
+                return actual_url
 
         return url
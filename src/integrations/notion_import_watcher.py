@@ -4,12 +4,31 @@ Notion Imports Watcher for MarketMan
 Watches a Notion 'Imports' database/page for new broker statement uploads, processes them, and auto-populates the TRADES and PERFORMANCE databases.
 """
 import os
+import sys
 import time
+import functools
+import hashlib
+import sqlite3
+import tempfile
+import threading
 import requests
 import csv
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+try:
+    from ..core.utils.compat import DATACLASS_SLOTS
+    from ..core.utils.http_utils import api_retry, json_body
+except ImportError:
+    # Fallback for direct execution
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.core.utils.compat import DATACLASS_SLOTS
+    from src.core.utils.http_utils import api_retry, json_body
 
 # --- CONFIG ---
 load_dotenv()
@@ -24,17 +43,104 @@ HEADERS = {
     "Notion-Version": NOTION_VERSION,
 }
 
+# Keep-alive session shared by every Notion call, sized for the insert workers; page-creating
+# POSTs are only retried on 429 so a late 5xx cannot insert the same trade twice
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=api_retry())
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Concurrent trade inserts, throttled to Notion's ~3 requests/second average
+IMPORT_WORKERS = 4
+NOTION_REQUESTS_PER_SECOND = 3
+
+# Seconds between Imports polls; doubles on each idle poll up to the maximum
+DEFAULT_MIN_POLL_INTERVAL = int(os.getenv("IMPORTS_POLL_MIN_INTERVAL", "60"))
+DEFAULT_MAX_POLL_INTERVAL = int(os.getenv("IMPORTS_POLL_MAX_INTERVAL", "600"))
+
+# Parsed trades held in memory at once while importing a statement
+IMPORT_CHUNK_ROWS = 50_000
+
+# Bytes per chunk when streaming uploaded statements to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Local index of trades already in Notion; checked against Notion's own rows on every import
+# and used on its own only when Notion cannot be queried
+IMPORTED_TRADES_DB = os.getenv("IMPORTED_TRADES_DB", "data/imported_trades.db")
+
+# Guards the shared duplicate-key set while insert workers reserve trades
+_existing_keys_lock = threading.Lock()
+
+
+@dataclass(**DATACLASS_SLOTS)
+class Trade:
+    """A validated broker statement row, with its duplicate-check key built once at parse time"""
+
+    trade_date: str
+    symbol: str
+    action: str
+    quantity: float
+    price: float
+    key: tuple
+    confidence: Optional[float] = None
+    reference: str = ""
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 # --- UTILS ---
-def get_new_imports():
-    """Query the Imports database for new (unprocessed) uploads"""
+def get_new_imports(edited_since=None):
+    """Query the Imports database for new (unprocessed) uploads
+
+    Results come oldest-edit first; with edited_since (a Notion last_edited_time) only rows
+    edited at or after it are returned, so idle polls skip everything already seen.
+    """
     url = f"https://api.notion.com/v1/databases/{IMPORTS_DATABASE_ID}/query"
-    payload = {"filter": {"property": "Status", "select": {"equals": "New"}}, "page_size": 10}
-    resp = requests.post(url, headers=HEADERS, json=payload)
+    status_filter = {"property": "Status", "select": {"equals": "New"}}
+    if edited_since:
+        query_filter = {
+            "and": [
+                status_filter,
+                {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": edited_since},
+                },
+            ]
+        }
+    else:
+        query_filter = status_filter
+    payload = {
+        "filter": query_filter,
+        "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+        "page_size": 10,
+    }
+    resp = SESSION.post(url, headers=HEADERS, data=json_body(payload))
     resp.raise_for_status()
     return resp.json().get("results", [])
 
 
+def next_sleep(
+    idle_streak, min_interval=DEFAULT_MIN_POLL_INTERVAL, max_interval=DEFAULT_MAX_POLL_INTERVAL
+):
+    """Poll interval after idle_streak consecutive empty polls: doubles from min to max"""
+    return min(min_interval * 2**idle_streak, max_interval)
+
+
 def download_file_from_notion(file_prop):
     """Download the file from Notion file property (assumes external file)"""
     files = file_prop.get("files", [])
@@ -43,10 +149,18 @@ def download_file_from_notion(file_prop):
     file_url = files[0].get("external", {}).get("url") or files[0].get("file", {}).get("url")
     if not file_url:
         return None
-    local_path = f"/tmp/{files[0]['name']}"
-    r = requests.get(file_url)
-    with open(local_path, "wb") as f:
-        f.write(r.content)
+    # Keep only the base name, so a crafted file name cannot escape the temp directory
+    safe_name = os.path.basename(files[0].get("name", "")) or "import.csv"
+    fd, local_path = tempfile.mkstemp(prefix="marketman_import_", suffix=f"_{safe_name}")
+    try:
+        with os.fdopen(fd, "wb") as f, SESSION.get(file_url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+    except (requests.RequestException, OSError) as e:
+        print(f"[WARN] Download failed for {safe_name}: {e}")
+        os.remove(local_path)
+        return None
     return local_path
 
 
@@ -59,7 +173,7 @@ def mark_import_processed(page_id, filename=None, error_message=None, debug=Fals
         properties["Notes/Error Message"] = {"rich_text": [{"text": {"content": error_message}}]}
     properties["Processed Date"] = {"date": {"start": datetime.now().isoformat()}}
     payload = {"properties": properties}
-    resp = requests.patch(url, headers=HEADERS, json=payload)
+    resp = SESSION.patch(url, headers=HEADERS, data=json_body(payload))
     if debug:
         print(f"[DEBUG] mark_import_processed response: {resp.status_code} {resp.text}")
     return resp.status_code == 200
@@ -70,15 +184,15 @@ def trade_exists_in_notion(trade, debug=False):
     url = f"https://api.notion.com/v1/databases/{TRADES_DATABASE_ID}/query"
     filter_obj = {
         "and": [
-            {"property": "Ticker", "title": {"equals": trade["Symbol"]}},
-            {"property": "Action", "select": {"equals": trade["Action"]}},
-            {"property": "Quantity", "number": {"equals": float(trade["Quantity"])}},
-            {"property": "Price", "number": {"equals": float(trade["Price"])}},
-            {"property": "Trade Date", "date": {"equals": trade["Run Date"]}},
+            {"property": "Ticker", "title": {"equals": trade.symbol}},
+            {"property": "Action", "select": {"equals": trade.action}},
+            {"property": "Quantity", "number": {"equals": trade.quantity}},
+            {"property": "Price", "number": {"equals": trade.price}},
+            {"property": "Trade Date", "date": {"equals": trade.trade_date}},
         ]
     }
     payload = {"filter": filter_obj, "page_size": 1}
-    resp = requests.post(url, headers=HEADERS, json=payload)
+    resp = SESSION.post(url, headers=HEADERS, data=json_body(payload))
     if debug:
         print(f"[DEBUG] trade_exists_in_notion response: {resp.status_code} {resp.text}")
     if resp.status_code == 200:
@@ -87,150 +201,405 @@ def trade_exists_in_notion(trade, debug=False):
     return False
 
 
-def add_trade_to_notion(trade, debug=False):
-    """Add a single trade to the Notion TRADES database, skipping if duplicate."""
-    if trade_exists_in_notion(trade, debug=debug):
+def _trade_key(symbol, action, quantity, price, trade_date):
+    """Identity of a trade for duplicate checks: (Symbol, Action, Quantity, Price, Trade Date)"""
+    return (symbol, action, round(float(quantity), 6), round(float(price), 6), trade_date)
+
+
+def _trade_hash(key):
+    """Stable digest of a _trade_key tuple for the local imported-trades index"""
+    return hashlib.blake2b("|".join(map(str, key)).encode(), digest_size=16).hexdigest()
+
+
+def open_trade_index(db_path=IMPORTED_TRADES_DB):
+    """Open (creating if needed) the local SQLite index of imported trade hashes"""
+    try:
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE IF NOT EXISTS imported_trades (hash TEXT PRIMARY KEY)")
+        return conn
+    except sqlite3.Error as e:
+        print(f"[WARN] Imported-trades index unavailable, using Notion only: {e}")
+        return None
+
+
+def record_imported_trades(conn, keys):
+    """Remember trade keys known to be in Notion"""
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO imported_trades (hash) VALUES (?)",
+            ((_trade_hash(key),) for key in keys),
+        )
+
+
+def forget_imported_trades(conn, keys):
+    """Drop trade keys that are no longer in Notion, so those trades are imported again"""
+    with conn:
+        conn.executemany(
+            "DELETE FROM imported_trades WHERE hash = ?",
+            ((_trade_hash(key),) for key in keys),
+        )
+
+
+def is_trade_imported(conn, key):
+    """Whether the local index already has this trade"""
+    row = conn.execute(
+        "SELECT 1 FROM imported_trades WHERE hash = ?", (_trade_hash(key),)
+    ).fetchone()
+    return row is not None
+
+
+def prefetch_existing_trades(min_date, max_date, debug=False):
+    """Fetch the keys of all TRADES rows dated min_date..max_date, one paginated query.
+
+    Returns None if the query fails, so callers can fall back to per-trade checks.
+    """
+    url = f"https://api.notion.com/v1/databases/{TRADES_DATABASE_ID}/query"
+    payload = {
+        "filter": {
+            "and": [
+                {"property": "Trade Date", "date": {"on_or_after": min_date}},
+                {"property": "Trade Date", "date": {"on_or_before": max_date}},
+            ]
+        },
+        "page_size": 100,
+    }
+    existing = set()
+    while True:
+        resp = SESSION.post(url, headers=HEADERS, data=json_body(payload))
+        if debug:
+            print(f"[DEBUG] prefetch_existing_trades response: {resp.status_code}")
+        if resp.status_code != 200:
+            print(f"[NOTION] Failed to prefetch trades: {resp.text}")
+            return None
+        data = resp.json()
+        for page in data.get("results", []):
+            props = page.get("properties", {})
+            try:
+                ticker = "".join(t["plain_text"] for t in props["Ticker"]["title"])
+                action = (props["Action"]["select"] or {}).get("name")
+                trade_date = props["Trade Date"]["date"]["start"][:10]
+                existing.add(
+                    _trade_key(
+                        ticker,
+                        action,
+                        props["Quantity"]["number"],
+                        props["Price"]["number"],
+                        trade_date,
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        if not data.get("has_more"):
+            return existing
+        payload["start_cursor"] = data.get("next_cursor")
+
+
+def build_trade_payload(trade):
+    """Notion page-create payload for a Trade in the TRADES database"""
+    properties = {
+        "Ticker": {"title": [{"text": {"content": trade.symbol}}]},
+        "Action": {"select": {"name": trade.action}},
+        "Quantity": {"number": trade.quantity},
+        "Price": {"number": trade.price},
+        "Trade Date": {"date": {"start": trade.trade_date}},
+        "Trade Value": {"number": trade.quantity * trade.price},
+    }
+    if trade.confidence is not None:
+        properties["Signal Confidence"] = {"number": trade.confidence}
+    if trade.reference:
+        properties["Signal Reference"] = {"rich_text": [{"text": {"content": trade.reference}}]}
+    return {"parent": {"database_id": TRADES_DATABASE_ID}, "properties": properties}
+
+
+def add_trade_to_notion(trade, debug=False, existing_keys=None):
+    """Add a single trade to the Notion TRADES database, skipping if duplicate.
+
+    existing_keys, from prefetch_existing_trades, replaces the per-trade Notion query;
+    the trade's key stays in it unless the insert fails.
+    """
+    if existing_keys is not None:
+        key = trade.key
+        # Reserve the key up front so concurrent workers never insert the same trade twice
+        with _existing_keys_lock:
+            is_duplicate = key in existing_keys
+            existing_keys.add(key)
+    else:
+        is_duplicate = trade_exists_in_notion(trade, debug=debug)
+    if is_duplicate:
         if debug:
             print(
-                f"[SKIP] Duplicate trade found, skipping: {trade['Symbol']} {trade['Action']} {trade['Quantity']} @ {trade['Price']} {trade['Run Date']}"
+                f"[SKIP] Duplicate trade found, skipping: {trade.symbol} {trade.action} "
+                f"{trade.quantity} @ {trade.price} {trade.trade_date}"
             )
         return False
     if debug:
         print(f"[DEBUG] Trade fields: {trade}")
-    payload = {
-        "parent": {"database_id": TRADES_DATABASE_ID},
-        "properties": {
-            "Ticker": {"title": [{"text": {"content": trade["Symbol"]}}]},
-            "Action": {"select": {"name": trade["Action"]}},
-            "Quantity": {"number": float(trade["Quantity"])},
-            "Price": {"number": float(trade["Price"])},
-            "Trade Date": {"date": {"start": trade["Run Date"]}},
-        },
-    }
-    try:
-        trade_value = float(trade["Quantity"]) * float(trade["Price"])
-        payload["properties"]["Trade Value"] = {"number": trade_value}
-    except Exception:
-        pass
-    if "Signal Confidence" in trade and trade["Signal Confidence"]:
-        payload["properties"]["Signal Confidence"] = {"number": float(trade["Signal Confidence"])}
-    if "Signal Reference" in trade and trade["Signal Reference"]:
-        payload["properties"]["Signal Reference"] = {
-            "rich_text": [{"text": {"content": str(trade["Signal Reference"])}}]
-        }
+    payload = build_trade_payload(trade)
     if debug:
         print(f"[DEBUG] Trade payload: {payload}")
-    resp = requests.post("https://api.notion.com/v1/pages", headers=HEADERS, json=payload)
+    resp = SESSION.post("https://api.notion.com/v1/pages", headers=HEADERS, data=json_body(payload))
     if debug:
         print(f"[DEBUG] add_trade_to_notion response: {resp.status_code} {resp.text}")
     if resp.status_code == 200:
         if debug:
             print(
-                f"[NOTION] Added trade: {trade['Symbol']} {trade['Action']} {trade['Quantity']} @ {trade['Price']}"
+                f"[NOTION] Added trade: {trade.symbol} {trade.action} "
+                f"{trade.quantity} @ {trade.price}"
             )
         return True
     else:
         print(f"[NOTION] Failed to add trade: {resp.text}")
+        if existing_keys is not None:
+            with _existing_keys_lock:
+                existing_keys.discard(key)
         return False
 
 
+# CSV columns every imported row must fill in
+IMPORT_ESSENTIALS = ("Run Date", "Action", "Symbol", "Quantity", "Price")
+
+# Broker action keywords mapped to the Notion Action select
+_ACTION_MAP = {"BOUGHT": "Buy", "SOLD": "Sell"}
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_run_date(run_date):
+    """Broker MM/DD/YY run date as an ISO date; statements repeat a handful of dates"""
+    return datetime.strptime(run_date, "%m/%d/%y").date().isoformat()
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_action(action_text):
+    """Map a broker action like 'YOU BOUGHT ...' to Buy/Sell, passing others through"""
+    action_upper = action_text.upper()
+    return next(
+        (action for keyword, action in _ACTION_MAP.items() if keyword in action_upper),
+        action_text,
+    )
+
+
+def _parse_trade_row(row, essential_idx, confidence_idx, reference_idx):
+    """Build a Trade from a CSV row; raises ValueError for missing or malformed fields"""
+    width = len(row)
+    values = [row[i].strip() if 0 <= i < width else "" for i in essential_idx]
+    if not all(values):
+        missing = [name for name, value in zip(IMPORT_ESSENTIALS, values) if not value]
+        raise ValueError(f"missing fields: {missing}")
+    run_date, action_text, symbol, quantity, price = values
+    quantity = float(quantity)
+    price = float(price)
+    trade_date = _parse_run_date(run_date)
+    action = _normalize_action(action_text)
+    confidence = row[confidence_idx].strip() if 0 <= confidence_idx < width else ""
+    try:
+        confidence = float(confidence) if confidence else None
+    except ValueError:
+        # An unreadable optional annotation should not cost the trade itself
+        confidence = None
+    return Trade(
+        trade_date=trade_date,
+        symbol=symbol,
+        action=action,
+        quantity=quantity,
+        price=price,
+        key=_trade_key(symbol, action, quantity, price, trade_date),
+        confidence=confidence,
+        reference=row[reference_idx].strip() if 0 <= reference_idx < width else "",
+    )
+
+
 # --- MAIN WORKFLOW ---
-def process_import(file_path, debug=False):
-    """Parse the broker file and add trades to Notion (essentials only)"""
-    print(f"[IMPORT] Processing {file_path} ... (CSV parse and import)")
+def _iter_trade_chunks(file_path, chunk_size=IMPORT_CHUNK_ROWS, debug=False):
+    """Stream the broker CSV, yielding lists of at most chunk_size valid Trades"""
+    chunk = []
     with open(file_path, newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
+        header = [name.lstrip("\ufeff").strip() for name in next(reader, [])]
         if debug:
-            print(f"[DEBUG] CSV Header: {reader.fieldnames}")
+            print(f"[DEBUG] CSV Header: {header}")
+        # Resolve column positions once; absent columns read as empty
+        idx = {name: i for i, name in enumerate(header)}
+        essential_idx = [idx.get(name, -1) for name in IMPORT_ESSENTIALS]
+        confidence_idx = idx.get("Signal Confidence", -1)
+        reference_idx = idx.get("Signal Reference", -1)
         row_count = 0
-        imported_count = 0
         for row in reader:
+            if not row:
+                continue
             row_count += 1
-            row = {
-                k.lstrip("\ufeff").strip(): (v.strip() if isinstance(v, str) else v)
-                for k, v in row.items()
-            }
             if debug:
                 print(f"[DEBUG] Raw CSV row {row_count}: {row}")
-            essentials = ["Run Date", "Action", "Symbol", "Quantity", "Price"]
-            missing = [f for f in essentials if not row.get(f)]
-            if missing:
+            try:
+                trade = _parse_trade_row(row, essential_idx, confidence_idx, reference_idx)
+            except ValueError as e:
                 if debug:
-                    print(f"[WARN] Skipping row {row_count} due to missing fields: {missing}")
+                    print(f"[WARN] Skipping row {row_count} due to {e}")
                 continue
-            action = (
-                "Buy"
-                if "BOUGHT" in row["Action"].upper()
-                else "Sell"
-                if "SOLD" in row["Action"].upper()
-                else row["Action"]
-            )
-            trade = {
-                "Run Date": datetime.strptime(row["Run Date"], "%m/%d/%y").date().isoformat(),
-                "Action": action,
-                "Symbol": row["Symbol"],
-                "Quantity": row["Quantity"],
-                "Price": row["Price"],
-                "Signal Confidence": row.get("Signal Confidence", ""),
-                "Signal Reference": row.get("Signal Reference", ""),
-            }
             if debug:
                 print(f"[DEBUG] Parsed trade row: {trade}")
-            add_trade_to_notion(trade, debug=debug)
-            imported_count += 1
+            chunk.append(trade)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if debug:
+        print(f"[DEBUG] Total rows: {row_count}")
+    if chunk:
+        yield chunk
+
+
+def _import_trades(trades, index, limiter, debug=False):
+    """Dedupe a chunk of trades against Notion (or the local index), insert the rest.
+
+    Returns the number of trades added to Notion.
+    """
+    # One paginated query for the chunk's date range instead of one duplicate check per row
+    trade_dates = [trade.trade_date for trade in trades]
+    existing_keys = prefetch_existing_trades(min(trade_dates), max(trade_dates), debug=debug)
+    if existing_keys is not None:
+        # Notion is authoritative: index entries for trades deleted there since are dropped
+        # so those trades are imported again
+        if index is not None:
+            forget_imported_trades(
+                index, (trade.key for trade in trades if trade.key not in existing_keys)
+            )
+            record_imported_trades(index, existing_keys)
+        # Drop known duplicates here so they never wait on the rate limiter
+        trades = [trade for trade in trades if trade.key not in existing_keys]
+        if debug:
+            print(f"[DEBUG] {len(trades)} trades not already in Notion")
+    elif index is not None:
+        # Notion could not be queried; skip trades the local index knows were imported
+        # before falling back to per-trade checks
+        trades = [trade for trade in trades if not is_trade_imported(index, trade.key)]
         if debug:
-            print(f"[DEBUG] Total rows: {row_count}, Imported: {imported_count}")
+            print(f"[DEBUG] {len(trades)} trades not in the local index")
+    if not trades:
+        return 0
+
+    # Insert concurrently over the shared session, paced to Notion's rate limit
+    def import_trade(trade):
+        limiter.wait()
+        return add_trade_to_notion(trade, debug=debug, existing_keys=existing_keys)
+
+    with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as executor:
+        results = list(executor.map(import_trade, trades))
+
+    if index is not None:
+        record_imported_trades(index, (trade.key for trade, added in zip(trades, results) if added))
+    return sum(results)
+
+
+def process_import(file_path, debug=False):
+    """Parse the broker file and add trades to Notion (essentials only)
+
+    The file is streamed in chunks of IMPORT_CHUNK_ROWS trades; each chunk is deduped and
+    inserted before the next is read, so memory stays bounded for very large exports.
+    """
+    print(f"[IMPORT] Processing {file_path} ... (CSV parse and import)")
+    index = open_trade_index()
+    limiter = _RateLimiter(NOTION_REQUESTS_PER_SECOND)
+    imported_count = 0
+    try:
+        for trades in _iter_trade_chunks(file_path, debug=debug):
+            imported_count += _import_trades(trades, index, limiter, debug=debug)
+    finally:
+        if index is not None:
+            index.close()
+    if debug:
+        print(f"[DEBUG] Imported: {imported_count}")
     return True
 
 
+def _download_entry(entry, debug=False):
+    """Download an Imports entry's file, marking the entry failed if there is none.
+
+    Returns (page_id, filename, local file path or None).
+    """
+    page_id = entry["id"]
+    file_prop = entry["properties"].get("File")
+    filename = file_prop["files"][0]["name"] if file_prop and file_prop.get("files") else None
+    if not file_prop:
+        print(f"[WARN] No file found in import entry {page_id}")
+        mark_import_processed(page_id, filename, error_message="No file found", debug=debug)
+        return page_id, filename, None
+    file_path = download_file_from_notion(file_prop)
+    if not file_path:
+        print(f"[WARN] Could not download file for entry {page_id}")
+        mark_import_processed(
+            page_id, filename, error_message="Could not download file", debug=debug
+        )
+    return page_id, filename, file_path
+
+
+def _process_entry(page_id, filename, file_path, debug=False):
+    """Import a downloaded file, record the outcome on its entry and delete the temp file"""
+    try:
+        if process_import(file_path, debug=debug):
+            print(f"[SUCCESS] Processed {file_path}")
+            mark_import_processed(page_id, filename, debug=debug)
+        else:
+            print(f"[FAIL] Failed to process {file_path}")
+            mark_import_processed(
+                page_id, filename, error_message="Failed to process file", debug=debug
+            )
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        mark_import_processed(page_id, filename, error_message=str(e), debug=debug)
+    finally:
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+
 def main():
     parser = argparse.ArgumentParser(description="MarketMan Notion Imports Watcher")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--min-interval",
+        type=int,
+        default=DEFAULT_MIN_POLL_INTERVAL,
+        help="Seconds between polls while imports are arriving",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=int,
+        default=DEFAULT_MAX_POLL_INTERVAL,
+        help="Longest wait between polls after repeated idle polls",
+    )
     args = parser.parse_args()
     debug = args.debug
     print("🚀 MarketMan Notion Imports Watcher started.")
+    idle_streak = 0
+    edited_since = None
     while True:
         try:
-            imports = get_new_imports()
+            imports = get_new_imports(edited_since)
             if not imports:
-                print(f"[{datetime.now()}] No new imports. Sleeping...")
-                time.sleep(60)
+                sleep_for = next_sleep(idle_streak, args.min_interval, args.max_interval)
+                idle_streak += 1
+                print(f"[{datetime.now()}] No new imports. Sleeping {sleep_for}s...")
+                time.sleep(sleep_for)
                 continue
-            for entry in imports:
-                page_id = entry["id"]
-                props = entry["properties"]
-                file_prop = props.get("File")
-                filename = (
-                    file_prop["files"][0]["name"] if file_prop and file_prop.get("files") else None
-                )
-                if not file_prop:
-                    print(f"[WARN] No file found in import entry {page_id}")
-                    mark_import_processed(
-                        page_id, filename, error_message="No file found", debug=debug
-                    )
-                    continue
-                file_path = download_file_from_notion(file_prop)
-                if not file_path:
-                    print(f"[WARN] Could not download file for entry {page_id}")
-                    mark_import_processed(
-                        page_id, filename, error_message="Could not download file", debug=debug
-                    )
-                    continue
-                try:
-                    if process_import(file_path, debug=debug):
-                        print(f"[SUCCESS] Processed {file_path}")
-                        mark_import_processed(page_id, filename, debug=debug)
-                    else:
-                        print(f"[FAIL] Failed to process {file_path}")
-                        mark_import_processed(
-                            page_id, filename, error_message="Failed to process file", debug=debug
-                        )
-                except Exception as e:
-                    print(f"[ERROR] {e}")
-                    mark_import_processed(page_id, filename, error_message=str(e), debug=debug)
+            idle_streak = 0
+            # Download every new file concurrently, but import them one at a time in upload
+            # order: inserts already saturate Notion's rate limit, and each file's duplicate
+            # check has to see the trades the previous file added
+            with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as executor:
+                downloads = [executor.submit(_download_entry, entry, debug) for entry in imports]
+                for future in downloads:
+                    page_id, filename, file_path = future.result()
+                    if file_path:
+                        _process_entry(page_id, filename, file_path, debug=debug)
+            # Rows come oldest-edit first, so the last one bounds the next query. The cursor
+            # only moves once the whole batch is done; a failed batch is queried again.
+            edited_since = imports[-1].get("last_edited_time", edited_since)
         except Exception as e:
             print(f"[ERROR] {e}")
-        time.sleep(60)
+        time.sleep(next_sleep(idle_streak, args.min_interval, args.max_interval))
 
 
 if __name__ == "__main__":
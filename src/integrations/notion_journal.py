@@ -7,25 +7,158 @@ focusing on manual trade tracking and signal review capabilities.
 """
 
 import os
+import sys
+import time
+import functools
+import threading
 import requests
-import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Set
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
-load_dotenv()
+try:
+    from ..core.utils.http_utils import api_retry, json_body
+except ImportError:
+    # Fallback for direct execution
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.core.utils.http_utils import api_retry, json_body
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _env():
+    """Parse .env once, on first use, and return (token, trades, signals, performance DB IDs)"""
+    load_dotenv()
+    return (
+        os.getenv("NOTION_TOKEN"),
+        os.getenv("TRADES_DATABASE_ID"),
+        os.getenv("SIGNALS_DATABASE_ID"),
+        os.getenv("PERFORMANCE_DATABASE_ID"),
+    )
+
+
+# Keep-alive session shared by all instances, so repeated journal writes reuse one TLS connection
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the shared Notion session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # Page-creating POSTs are only retried on 429, so a late 5xx cannot log a row twice
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=api_retry())
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+# Notion returns at most 100 results per query page
+NOTION_MAX_PAGE_SIZE = 100
+
+# Bulk logging: requests start no faster than Notion's ~3/second average, with a few in flight
+NOTION_REQUESTS_PER_SECOND = 3
+NOTION_BULK_WORKERS = 3
+
+_TRADES_SORTS = [{"property": "Trade Date", "direction": "descending"}]
+_SIGNALS_SORTS = [{"property": "Timestamp", "direction": "descending"}]
+
+
+@functools.lru_cache(maxsize=8)
+def _cutoff_for_bucket(days, minute):
+    return (datetime.now() - timedelta(days=days)).isoformat()
+
+
+def _cutoff(days):
+    """ISO timestamp `days` ago, recomputed at most once a minute per `days` value"""
+    return _cutoff_for_bucket(days, int(time.time()) // 60)
+
+
+# Stand-in for properties missing from a page; never mutated
+_NO_PROPERTY = {}
+
+
+def _safe_select(prop):
+    """Name of a select property's option, or None when unset"""
+    option = prop.get("select")
+    return option["name"] if option else None
+
+
+def _first_title(prop):
+    items = prop.get("title")
+    return items[0]["plain_text"] if items else None
+
+
+def _first_rich_text(prop):
+    items = prop.get("rich_text")
+    return items[0]["plain_text"] if items else None
+
+
+def _number_or_zero(prop):
+    return prop.get("number") or 0
+
+
+def _date_start(prop):
+    value = prop.get("date")
+    return value["start"] if value else None
+
+
+def _multi_select_names(prop):
+    return [option["name"] for option in prop.get("multi_select") or ()]
+
+
+# Output key -> (Notion property, extractor); each extractor does one lookup on the property
+_TRADE_FIELDS = {
+    "ticker": ("Ticker", _first_title),
+    "action": ("Action", _safe_select),
+    "quantity": ("Quantity", _number_or_zero),
+    "price": ("Price", _number_or_zero),
+    "trade_date": ("Trade Date", _date_start),
+    "status": ("Status", _safe_select),
+    "notes": ("Notes", _first_rich_text),
+}
+
+_SIGNAL_FIELDS = {
+    "title": ("Title", _first_title),
+    "signal": ("Signal", _safe_select),
+    "confidence": ("Confidence", _number_or_zero),
+    "etfs": ("ETFs", _multi_select_names),
+    "sector": ("Sector", _safe_select),
+    "timestamp": ("Timestamp", _date_start),
+    "reasoning": ("Reasoning", _first_rich_text),
+    "status": ("Status", _safe_select),
+    "journal_notes": ("Journal Notes", _first_rich_text),
+}
+
+
+def _project_pages(pages, spec, fields=None):
+    """Flatten Notion pages to dicts holding "id" plus the requested spec keys (all by default)"""
+    selected = spec if fields is None else {key: spec[key] for key in spec if key in fields}
+    wanted = [(key, name, extract) for key, (name, extract) in selected.items()]
+    for page in pages:
+        props = page["properties"]
+        record = {"id": page["id"]}
+        for key, name, extract in wanted:
+            record[key] = extract(props.get(name, _NO_PROPERTY))
+        yield record
+
+
 class NotionJournalIntegration:
     """Notion integration for trade journaling and signal management"""
     
     def __init__(self):
-        self.notion_token = os.getenv("NOTION_TOKEN")
-        self.trades_db_id = os.getenv("TRADES_DATABASE_ID")
-        self.signals_db_id = os.getenv("SIGNALS_DATABASE_ID")
-        self.performance_db_id = os.getenv("PERFORMANCE_DATABASE_ID")
+        (
+            self.notion_token,
+            self.trades_db_id,
+            self.signals_db_id,
+            self.performance_db_id,
+        ) = _env()
         
         if not self.notion_token:
             logger.warning("NOTION_TOKEN not configured - Notion integration disabled")
@@ -36,8 +169,9 @@ class NotionJournalIntegration:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28",
         }
+        self.session = _get_session()
     
-    def log_trade(self, trade_data: Dict[str, Any]) -> bool:
+    def log_trade(self, trade_data: Dict[str, Any], now_iso: Optional[str] = None) -> bool:
         """
         Log a trade to the Phase 4 Trades database
         
@@ -50,6 +184,8 @@ class NotionJournalIntegration:
                 - trade_date (str): Trade date (ISO format)
                 - notes (str): Optional trade notes
                 - status (str): Trade status (Open, Closed, Review)
+            now_iso: Timestamp for a missing trade_date; callers logging in bulk can pass
+                one value for the whole batch (defaults to now)
         
         Returns:
             bool: True if successfully logged, False otherwise
@@ -61,6 +197,7 @@ class NotionJournalIntegration:
         try:
             # Calculate trade value
             trade_value = trade_data.get("quantity", 0) * trade_data.get("price", 0)
+            trade_date = trade_data.get("trade_date") or now_iso or datetime.now().isoformat()
             
             # Build properties
             properties = {
@@ -68,7 +205,7 @@ class NotionJournalIntegration:
                 "Action": {"select": {"name": trade_data.get("action", "BUY")}},
                 "Quantity": {"number": trade_data.get("quantity", 0)},
                 "Price": {"number": trade_data.get("price", 0.0)},
-                "Trade Date": {"date": {"start": trade_data.get("trade_date", datetime.now().isoformat())}},
+                "Trade Date": {"date": {"start": trade_date}},
                 "Trade Value": {"number": trade_value},
                 "Status": {"select": {"name": trade_data.get("status", "Open")}},
             }
@@ -82,10 +219,10 @@ class NotionJournalIntegration:
                 "properties": properties
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.notion.com/v1/pages",
                 headers=self.headers,
-                json=payload,
+                data=json_body(payload),
                 timeout=30
             )
             
@@ -100,7 +237,7 @@ class NotionJournalIntegration:
             logger.error(f"❌ Error logging trade: {e}")
             return False
     
-    def log_signal(self, signal_data: Dict[str, Any]) -> bool:
+    def log_signal(self, signal_data: Dict[str, Any], now_iso: Optional[str] = None) -> bool:
         """
         Log a signal to the Notion Signals database (v3 schema only)
         
@@ -118,6 +255,8 @@ class NotionJournalIntegration:
                 - uncertainty_metric (str): Confidence with context
                 - price_anchors (Dict): ETF price context
                 - position_risk_bracket (str): Position sizing guidance
+            now_iso: Timestamp for a missing timestamp field; callers logging in bulk can pass
+                one value for the whole batch (defaults to now)
         
         Returns:
             bool: True if successfully logged, False otherwise
@@ -127,13 +266,15 @@ class NotionJournalIntegration:
             return False
         
         try:
+            timestamp = signal_data.get("timestamp") or now_iso or datetime.now().isoformat()
+
             # Build core properties
             properties = {
                 "Title": {"title": [{"text": {"content": signal_data.get("title", "Signal")}}]},
                 "Signal": {"select": {"name": signal_data.get("signal", "Neutral")}},
                 "Confidence": {"number": signal_data.get("confidence", 5.0)},
                 "Sector": {"select": {"name": signal_data.get("sector", "Mixed")}},
-                "Timestamp": {"date": {"start": signal_data.get("timestamp", datetime.now().isoformat())}},
+                "Timestamp": {"date": {"start": timestamp}},
                 "Reasoning": {"rich_text": [{"text": {"content": self._format_reasoning(signal_data.get("reasoning", ""))}}]},
                 "Status": {"select": {"name": "New"}},
             }
@@ -180,10 +321,10 @@ class NotionJournalIntegration:
                 "properties": properties
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.notion.com/v1/pages",
                 headers=self.headers,
-                json=payload,
+                data=json_body(payload),
                 timeout=30
             )
             
@@ -247,10 +388,10 @@ class NotionJournalIntegration:
             
             payload = {"properties": properties}
             
-            response = requests.patch(
+            response = self.session.patch(
                 f"https://api.notion.com/v1/pages/{signal_id}",
                 headers=self.headers,
-                json=payload,
+                data=json_body(payload),
                 timeout=30
             )
             
@@ -287,10 +428,10 @@ class NotionJournalIntegration:
             
             payload = {"properties": properties}
             
-            response = requests.patch(
+            response = self.session.patch(
                 f"https://api.notion.com/v1/pages/{trade_id}",
                 headers=self.headers,
-                json=payload,
+                data=json_body(payload),
                 timeout=30
             )
             
@@ -305,12 +446,62 @@ class NotionJournalIntegration:
             logger.error(f"❌ Error updating trade: {e}")
             return False
     
-    def get_recent_trades(self, days: int = 30) -> List[Dict[str, Any]]:
+    def _paginate(
+        self, db_id: str, payload: Dict[str, Any], limit: Optional[int] = None, label: str = "pages"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield database query results, following start_cursor across pages
+        
+        Args:
+            db_id (str): Notion database ID
+            payload (Dict): Query body (filter, sorts)
+            limit (int): Stop after this many results (None for all)
+            label (str): What is being fetched, for error logs
+        
+        Yields:
+            Dict: Raw Notion page objects
+        """
+        payload = dict(payload)
+        remaining = limit
+        while remaining is None or remaining > 0:
+            payload["page_size"] = (
+                NOTION_MAX_PAGE_SIZE if remaining is None else min(remaining, NOTION_MAX_PAGE_SIZE)
+            )
+            response = self.session.post(
+                f"https://api.notion.com/v1/databases/{db_id}/query",
+                headers=self.headers,
+                data=json_body(payload),
+                timeout=30
+            )
+            if response.status_code != 200:
+                logger.error(f"❌ Failed to get {label}: {response.status_code} - {response.text}")
+                return
+            
+            data = response.json()
+            results = data.get("results", [])
+            if remaining is not None:
+                results = results[:remaining]
+                remaining -= len(results)
+            yield from results
+            
+            if not data.get("has_more"):
+                return
+            if remaining == 0:
+                # The cap is deliberate but should not be silent
+                logger.debug(f"More {label} match than limit={limit}; stopping early")
+                return
+            payload["start_cursor"] = data.get("next_cursor")
+    
+    def get_recent_trades(
+        self, days: int = 30, fields: Optional[Set[str]] = None, limit: Optional[int] = 100
+    ) -> List[Dict[str, Any]]:
         """
         Get recent trades from Notion
         
         Args:
             days (int): Number of days to look back
+            fields (Set[str]): Trade keys to include besides "id" (None for all)
+            limit (int): Maximum number of trades, newest first (None for all)
         
         Returns:
             List[Dict]: List of trade data
@@ -320,9 +511,7 @@ class NotionJournalIntegration:
             return []
         
         try:
-            # Calculate date filter
-            from datetime import timedelta
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            cutoff_date = _cutoff(days)
             
             filter_obj = {
                 "property": "Trade Date",
@@ -333,51 +522,29 @@ class NotionJournalIntegration:
             
             payload = {
                 "filter": filter_obj,
-                "sorts": [{"property": "Trade Date", "direction": "descending"}],
-                "page_size": 100
+                "sorts": _TRADES_SORTS,
             }
             
-            response = requests.post(
-                f"https://api.notion.com/v1/databases/{self.trades_db_id}/query",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            pages = self._paginate(self.trades_db_id, payload, limit=limit, label="trades")
+            trades = list(_project_pages(pages, _TRADE_FIELDS, fields))
             
-            if response.status_code == 200:
-                data = response.json()
-                trades = []
-                
-                for result in data.get("results", []):
-                    props = result["properties"]
-                    trade = {
-                        "id": result["id"],
-                        "ticker": props["Ticker"]["title"][0]["plain_text"] if props["Ticker"]["title"] else None,
-                        "action": props["Action"]["select"]["name"] if props["Action"]["select"] else None,
-                        "quantity": props["Quantity"]["number"] if props["Quantity"]["number"] else 0,
-                        "price": props["Price"]["number"] if props["Price"]["number"] else 0,
-                        "trade_date": props["Trade Date"]["date"]["start"] if props["Trade Date"]["date"] else None,
-                        "status": props["Status"]["select"]["name"] if props["Status"]["select"] else None,
-                        "notes": props["Notes"]["rich_text"][0]["plain_text"] if props["Notes"]["rich_text"] else None,
-                    }
-                    trades.append(trade)
-                
-                logger.info(f"📊 Retrieved {len(trades)} recent trades from Notion")
-                return trades
-            else:
-                logger.error(f"❌ Failed to get trades: {response.status_code} - {response.text}")
-                return []
+            logger.info(f"📊 Retrieved {len(trades)} recent trades from Notion")
+            return trades
                 
         except Exception as e:
             logger.error(f"❌ Error getting trades: {e}")
             return []
     
-    def get_recent_signals(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_recent_signals(
+        self, days: int = 30, fields: Optional[Set[str]] = None, limit: Optional[int] = 100
+    ) -> List[Dict[str, Any]]:
         """
         Get recent signals from Notion
         
         Args:
             days (int): Number of days to look back
+            fields (Set[str]): Signal keys to include besides "id" (None for all)
+            limit (int): Maximum number of signals, newest first (None for all)
         
         Returns:
             List[Dict]: List of signal data
@@ -387,9 +554,7 @@ class NotionJournalIntegration:
             return []
         
         try:
-            # Calculate date filter
-            from datetime import timedelta
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+            cutoff_date = _cutoff(days)
             
             filter_obj = {
                 "property": "Timestamp",
@@ -400,53 +565,56 @@ class NotionJournalIntegration:
             
             payload = {
                 "filter": filter_obj,
-                "sorts": [{"property": "Timestamp", "direction": "descending"}],
-                "page_size": 100
+                "sorts": _SIGNALS_SORTS,
             }
             
-            response = requests.post(
-                f"https://api.notion.com/v1/databases/{self.signals_db_id}/query",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            pages = self._paginate(self.signals_db_id, payload, limit=limit, label="signals")
+            signals = list(_project_pages(pages, _SIGNAL_FIELDS, fields))
             
-            if response.status_code == 200:
-                data = response.json()
-                signals = []
-                
-                for result in data.get("results", []):
-                    props = result["properties"]
-                    
-                    # Extract ETFs
-                    etfs = []
-                    if "ETFs" in props and props["ETFs"]["multi_select"]:
-                        etfs = [etf["name"] for etf in props["ETFs"]["multi_select"]]
-                    
-                    signal = {
-                        "id": result["id"],
-                        "title": props["Title"]["title"][0]["plain_text"] if props["Title"]["title"] else None,
-                        "signal": props["Signal"]["select"]["name"] if props["Signal"]["select"] else None,
-                        "confidence": props["Confidence"]["number"] if props["Confidence"]["number"] else 0,
-                        "etfs": etfs,
-                        "sector": props["Sector"]["select"]["name"] if props["Sector"]["select"] else None,
-                        "timestamp": props["Timestamp"]["date"]["start"] if props["Timestamp"]["date"] else None,
-                        "reasoning": props["Reasoning"]["rich_text"][0]["plain_text"] if props["Reasoning"]["rich_text"] else None,
-                        "status": props["Status"]["select"]["name"] if props["Status"]["select"] else None,
-                        "journal_notes": props["Journal Notes"]["rich_text"][0]["plain_text"] if props["Journal Notes"]["rich_text"] else None,
-                    }
-                    signals.append(signal)
-                
-                logger.info(f"📊 Retrieved {len(signals)} recent signals from Notion")
-                return signals
-            else:
-                logger.error(f"❌ Failed to get signals: {response.status_code} - {response.text}")
-                return []
+            logger.info(f"📊 Retrieved {len(signals)} recent signals from Notion")
+            return signals
                 
         except Exception as e:
             logger.error(f"❌ Error getting signals: {e}")
             return []
     
+    def _log_paced(
+        self, log_one, items: List[Dict[str, Any]], now_iso: Optional[str]
+    ) -> List[bool]:
+        """Run log_one over items concurrently, starting one request per rate-limit interval"""
+        interval = 1.0 / NOTION_REQUESTS_PER_SECOND
+        futures = []
+        with ThreadPoolExecutor(max_workers=NOTION_BULK_WORKERS) as executor:
+            for i, item in enumerate(items):
+                if i:
+                    time.sleep(interval)
+                futures.append(executor.submit(log_one, item, now_iso))
+        return [future.result() for future in futures]
+    
+    def log_trades_bulk(self, trades: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Log several trades, overlapping their round trips within Notion's rate limit
+        
+        Args:
+            trades: Trade dictionaries as accepted by log_trade
+        
+        Returns:
+            List[bool]: Per-trade results, in input order
+        """
+        return self._log_paced(self.log_trade, trades, datetime.now().isoformat())
+    
+    def log_signals_bulk(self, signals: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Log several signals, overlapping their round trips within Notion's rate limit
+        
+        Args:
+            signals: Signal dictionaries as accepted by log_signal
+        
+        Returns:
+            List[bool]: Per-signal results, in input order
+        """
+        return self._log_paced(self.log_signal, signals, datetime.now().isoformat())
+    
     def log_performance_summary(self, performance_data: Dict[str, Any]) -> bool:
         """
         Log performance summary to the Performance database (optional)
@@ -482,10 +650,10 @@ class NotionJournalIntegration:
                 "properties": properties
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.notion.com/v1/pages",
                 headers=self.headers,
-                json=payload,
+                data=json_body(payload),
                 timeout=30
             )
             
@@ -2,10 +2,21 @@
 Notion Reporter - Handles Notion API integration and report formatting
 """
 import os
+import sys
+import functools
 import requests
 import re
 import logging
+import threading
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+
+try:
+    from ..core.utils.http_utils import api_retry, json_body
+except ImportError:
+    # Fallback for direct execution
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.core.utils.http_utils import api_retry, json_body
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +24,65 @@ logger = logging.getLogger(__name__)
 trades_db_id = os.getenv("TRADES_DATABASE_ID")
 perf_db_id = os.getenv("PERFORMANCE_DATABASE_ID")
 
+# Shared HTTP session so TLS connections are reused across reports and cycles
+_session = None
+_session_lock = threading.Lock()
+
+# Methods safe to send again after a dropped connection; a POST may already have created its page
+_RESEND_METHODS = frozenset({"GET", "HEAD"})
+
+
+def get_http_session():
+    """Return the process-wide pooled requests session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # Page-creating POSTs are only retried on 429, so a late 5xx cannot add a page twice
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=api_retry(total=3, backoff_factor=0.3),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def reset_http_session():
+    """Drop the pooled session so the next request opens fresh connections"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _request(method, url, **kwargs):
+    """Issue a request on the pooled session, reopening it on connection errors
+
+    Only GET/HEAD are sent again on the fresh session; other methods re-raise after the reset.
+    """
+    try:
+        return get_http_session().request(method, url, **kwargs)
+    except requests.exceptions.ConnectionError:
+        logger.warning("⚠️ Pooled HTTP connection failed, reopening session")
+        reset_http_session()
+        if method.upper() not in _RESEND_METHODS:
+            raise
+        return get_http_session().request(method, url, **kwargs)
+
+
+@functools.lru_cache(maxsize=4)
+def _notion_headers(token):
+    """Notion request headers for a token, built once and shared (never mutate the result)"""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Notion-Version": "2022-06-28",
+    }
+
 
 def get_microlink_image(url):
     """Fetch article preview image using Microlink API with enhanced fallback logic"""
@@ -26,7 +96,7 @@ def get_microlink_image(url):
             "video": "false",
         }
 
-        response = requests.get("https://api.microlink.io", params=params, timeout=10)
+        response = _request("GET", "https://api.microlink.io", params=params, timeout=10)
         if response.status_code == 200:
             try:
                 json_data = response.json()
@@ -63,7 +133,7 @@ def get_microlink_image(url):
             for source_type, image_url in image_sources:
                 try:
                     # Quick HEAD request to verify image is accessible
-                    img_response = requests.head(image_url, timeout=5)
+                    img_response = _request("HEAD", image_url, timeout=5)
                     if img_response.status_code == 200:
                         content_type = img_response.headers.get("content-type", "")
                         if content_type.startswith("image/"):
@@ -107,11 +177,7 @@ class NotionReporter:
             return False
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.notion_token}",
-                "Content-Type": "application/json",
-                "Notion-Version": "2022-06-28",
-            }
+            headers = _notion_headers(self.notion_token)
 
             # Create comprehensive title
             title = f"📊 {report_data.get('title', 'Signal Report')}"
@@ -219,7 +285,9 @@ class NotionReporter:
             )
             data["children"] = children
 
-            response = requests.post("https://api.notion.com/v1/pages", headers=headers, json=data)
+            response = _request(
+                "POST", "https://api.notion.com/v1/pages", headers=headers, data=json_body(data)
+            )
 
             if response.status_code == 200:
                 result = response.json()
@@ -832,11 +900,7 @@ class NotionReporter:
             return False
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.notion_token}",
-                "Content-Type": "application/json",
-                "Notion-Version": "2022-06-28",
-            }
+            headers = _notion_headers(self.notion_token)
 
             # Build trade record properties
             properties = {
@@ -876,8 +940,12 @@ class NotionReporter:
 
             payload = {"parent": {"database_id": self.trades_database_id}, "properties": properties}
 
-            response = requests.post(
-                "https://api.notion.com/v1/pages", headers=headers, json=payload, timeout=30
+            response = _request(
+                "POST",
+                "https://api.notion.com/v1/pages",
+                headers=headers,
+                data=json_body(payload),
+                timeout=30,
             )
 
             if response.status_code == 200:
@@ -930,13 +998,13 @@ class NotionReporter:
                 "Win?": {"checkbox": win},
             },
         }
-        headers = {
-            "Authorization": f"Bearer {os.getenv('NOTION_TOKEN')}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28",
-        }
-        resp = requests.post(
-            "https://api.notion.com/v1/pages", json=payload, headers=headers, timeout=30
+        headers = _notion_headers(os.getenv("NOTION_TOKEN"))
+        resp = _request(
+            "POST",
+            "https://api.notion.com/v1/pages",
+            data=json_body(payload),
+            headers=headers,
+            timeout=30,
         )
         return resp.json()
 
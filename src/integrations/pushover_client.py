@@ -7,11 +7,17 @@ risk warnings, and rate limiting for trading signals.
 
 import os
 import time
+import atexit
+import threading
 import requests
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from typing import Deque, Dict, Any, Optional, List, Union
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from ..core.utils.config_loader import get_config
@@ -23,6 +29,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Window for rate_limit_per_hour, in seconds
+RATE_LIMIT_WINDOW = 3600
+
+# Notifications sent in parallel by the batch helpers; each waits mostly on network RTT
+PUSHOVER_BATCH_WORKERS = 4
+
 
 @dataclass
 class PushoverMessage:
@@ -38,6 +50,14 @@ class PushoverMessage:
 class PushoverNotifier:
     """Enhanced Pushover notification client with rate limiting and configurable thresholds"""
 
+    # Read-only lookup tables shared by every instance
+    _SIGNAL_INDICATORS = MappingProxyType({
+        "Bullish": "↗ BULLISH",
+        "Bearish": "↘ BEARISH",
+        "Neutral": "→ NEUTRAL",
+    })
+    _STATUS_EMOJI = MappingProxyType({"UP": "✅", "DOWN": "❌", "WARNING": "⚠️"})
+
     def __init__(self):
         """Initialize the Pushover notifier with configuration"""
         self.config = get_config()
@@ -50,31 +70,73 @@ class PushoverNotifier:
         
         # Priority settings
         self.priority_settings = self.config.get_setting("integrations.pushover.priority_settings", {})
+        self._priority_table = self._build_priority_table()
+        self._risk_priority = self.priority_settings.get("risk_warnings", 1)
+        self._system_priority = self.priority_settings.get("system_alerts", 1)
         
-        # Rate limiting
-        self._notification_history: List[datetime] = []
-        self._last_cleanup = datetime.now()
+        # Rate limiting: monotonic send times, oldest first
+        self._notification_history: Deque[float] = deque()
+        self._rate_lock = threading.Lock()
+
+        # Keep-alive session so bursts of notifications skip the TCP/TLS handshake
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+
+        # Background sender for fire-and-forget notifications; drained at interpreter exit
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pushover")
+        atexit.register(self._executor.shutdown, wait=True)
         
         if not self.enabled:
             logger.warning("Pushover notifications are disabled in configuration")
         elif not self.api_token or not self.user_token:
             logger.warning("Pushover API token or user token not configured")
 
-    def _is_rate_limited(self) -> bool:
-        """Check if we're currently rate limited"""
-        now = datetime.now()
-        
-        # Clean up old entries (older than 1 hour)
-        if (now - self._last_cleanup).seconds > 3600:
-            cutoff = now - timedelta(hours=1)
-            self._notification_history = [t for t in self._notification_history if t > cutoff]
-            self._last_cleanup = now
-        
-        return len(self._notification_history) >= self.rate_limit_per_hour
-
-    def _record_notification(self) -> None:
-        """Record a notification for rate limiting"""
-        self._notification_history.append(datetime.now())
+    def _build_priority_table(self) -> tuple:
+        """(priority, alert level) for each whole confidence score 0-10"""
+        low = (self.priority_settings.get("low_confidence", -1), "LOW")
+        medium = self.priority_settings.get("medium_confidence", 0)
+        critical = (self.priority_settings.get("high_confidence", 0), "CRITICAL")
+        return (low,) * 7 + ((medium, "STANDARD"), (medium, "HIGH")) + (critical,) * 2
+
+    def _count_recent(self, now: float) -> int:
+        """Expire old sends and return how many remain in the window; caller holds _rate_lock"""
+        cutoff = now - RATE_LIMIT_WINDOW
+        history = self._notification_history
+        while history and history[0] <= cutoff:
+            history.popleft()
+        return len(history)
+
+    def _reserve_notification(self) -> Optional[float]:
+        """Check the rate limit and record a send in one critical section, returning its time.
+
+        Returns None when the hourly limit is reached, so concurrent sends cannot overshoot it.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            if self._count_recent(now) >= self.rate_limit_per_hour:
+                return None
+            self._notification_history.append(now)
+            return now
+
+    def _release_notification(self, sent_at: float) -> None:
+        """Give back a slot claimed for a notification that was not delivered"""
+        with self._rate_lock:
+            try:
+                self._notification_history.remove(sent_at)
+            except ValueError:
+                pass
 
     def send_notification(self, message: str, title: str, priority: int = 0, 
                          url: Optional[str] = None, url_title: Optional[str] = None) -> bool:
@@ -99,7 +161,8 @@ class PushoverNotifier:
             logger.error("Pushover credentials not configured")
             return False
             
-        if self._is_rate_limited():
+        sent_at = self._reserve_notification()
+        if sent_at is None:
             logger.warning("Rate limit exceeded for Pushover notifications")
             return False
 
@@ -117,18 +180,29 @@ class PushoverNotifier:
             data["url_title"] = url_title
 
         try:
-            response = requests.post("https://api.pushover.net/1/messages.json", data=data, timeout=10)
+            response = self._session.post(
+                "https://api.pushover.net/1/messages.json", data=data, timeout=10
+            )
             if response.status_code == 200:
-                self._record_notification()
-                logger.info(f"✅ Pushover notification sent: {title}")
+                logger.info("✅ Pushover notification sent: %s", title)
                 return True
             else:
-                logger.error(f"❌ Pushover API error: {response.status_code} - {response.text}")
+                logger.error("❌ Pushover API error: %s - %s", response.status_code, response.text)
+                self._release_notification(sent_at)
                 return False
         except Exception as e:
-            logger.error(f"🔥 Error sending Pushover notification: {e}")
+            logger.error("🔥 Error sending Pushover notification: %s", e)
+            self._release_notification(sent_at)
             return False
 
+    def send_notification_async(self, message: str, title: str, priority: int = 0,
+                                url: Optional[str] = None,
+                                url_title: Optional[str] = None) -> "Future[bool]":
+        """Queue send_notification on the background sender and return its Future immediately"""
+        return self._executor.submit(
+            self.send_notification, message, title, priority, url, url_title
+        )
+
     def send_trading_signal(self, signal: str, confidence: int, title: str, 
                            reasoning: str, etfs: Optional[List[str]] = None,
                            article_url: Optional[str] = None, 
@@ -149,48 +223,39 @@ class PushoverNotifier:
             True if sent successfully, False otherwise
         """
         if confidence < self.confidence_threshold:
-            logger.debug(f"Signal confidence {confidence} below threshold {self.confidence_threshold}")
+            logger.debug(
+                "Signal confidence %s below threshold %s", confidence, self.confidence_threshold
+            )
             return False
 
         # Determine priority based on confidence
-        if confidence >= 9:
-            priority = self.priority_settings.get("high_confidence", 0)
-            alert_level = "CRITICAL"
-        elif confidence >= 8:
-            priority = self.priority_settings.get("medium_confidence", 0)
-            alert_level = "HIGH"
-        elif confidence >= 7:
-            priority = self.priority_settings.get("medium_confidence", 0)
-            alert_level = "STANDARD"
-        else:
-            priority = self.priority_settings.get("low_confidence", -1)
-            alert_level = "LOW"
-
-        # Build message
-        signal_indicator = {
-            "Bullish": "↗ BULLISH", 
-            "Bearish": "↘ BEARISH", 
-            "Neutral": "→ NEUTRAL"
-        }.get(signal, "? UNKNOWN")
-
-        message = f"""{signal_indicator} Signal ({confidence}/10)
-
-{title[:80]}{'...' if len(title) > 80 else ''}
-
-Reason: {reasoning}"""
+        priority, alert_level = self._priority_table[min(max(int(confidence), 0), 10)]
+
+        # Build message as lines joined once at the end
+        signal_indicator = self._SIGNAL_INDICATORS.get(signal, "? UNKNOWN")
+        parts = [
+            f"{signal_indicator} Signal ({confidence}/10)",
+            "",
+            f"{title[:80]}{'...' if len(title) > 80 else ''}",
+            "",
+            f"Reason: {reasoning}",
+        ]
 
         # Add affected ETFs
-        if etfs and len(etfs) > 0:
-            etf_list = ", ".join(etfs[:4])
-            if len(etfs) > 4:
-                etf_list += f" +{len(etfs)-4} more"
-            message += f"\n\nETFs: {etf_list}"
+        if etfs:
+            n = len(etfs)
+            head = ", ".join(etfs[:4])
+            etf_list = head if n <= 4 else f"{head} +{n - 4} more"
+            parts += ("", f"ETFs: {etf_list}")
 
         # Add risk warnings if enabled
         if self.risk_warnings_enabled and risk_factors:
-            message += f"\n\n⚠️ Risk Factors:\n"
-            for risk in risk_factors[:3]:  # Limit to 3 risk factors
-                message += f"• {risk}\n"
+            parts += ("", "⚠️ Risk Factors:")
+            parts.extend(f"• {risk}" for risk in risk_factors[:3])  # Limit to 3 risk factors
+
+        # The joined text has no trailing newline after the last risk factor; the message is
+        # strip()ped before sending either way, so the notification text is unchanged
+        message = "\n".join(parts)
 
         alert_title = f"MarketMan {alert_level}"
 
@@ -202,6 +267,21 @@ Reason: {reasoning}"""
             url_title="Full Analysis" if article_url else None,
         )
 
+    def send_trading_signals_batch(self, signals: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send several trading signal notifications concurrently
+        
+        Args:
+            signals: Keyword arguments for send_trading_signal, one dict per signal
+            
+        Returns:
+            Per-signal results, in input order
+        """
+        if len(signals) <= 1:
+            return [self.send_trading_signal(**signal) for signal in signals]
+        with ThreadPoolExecutor(max_workers=PUSHOVER_BATCH_WORKERS) as executor:
+            return list(executor.map(lambda signal: self.send_trading_signal(**signal), signals))
+
     def send_risk_warning(self, warning_type: str, message: str, 
                          affected_symbols: Optional[List[str]] = None,
                          severity: str = "medium") -> bool:
@@ -221,17 +301,19 @@ Reason: {reasoning}"""
             logger.debug("Risk warnings disabled")
             return False
 
-        priority = self.priority_settings.get("risk_warnings", 1)
+        priority = self._risk_priority
         
         title = f"Risk Warning: {warning_type}"
         
-        full_message = f"⚠️ {message}"
+        parts = [f"⚠️ {message}"]
         
         if affected_symbols:
-            symbols_str = ", ".join(affected_symbols[:5])
-            if len(affected_symbols) > 5:
-                symbols_str += f" +{len(affected_symbols)-5} more"
-            full_message += f"\n\nAffected: {symbols_str}"
+            n = len(affected_symbols)
+            head = ", ".join(affected_symbols[:5])
+            symbols_str = head if n <= 5 else f"{head} +{n - 5} more"
+            parts += ("", f"Affected: {symbols_str}")
+
+        full_message = "\n".join(parts)
 
         return self.send_notification(
             message=full_message,
@@ -252,13 +334,14 @@ Reason: {reasoning}"""
         Returns:
             True if sent successfully, False otherwise
         """
-        priority = self.priority_settings.get("system_alerts", 1)
+        priority = self._system_priority
         
-        status_emoji = {"UP": "✅", "DOWN": "❌", "WARNING": "⚠️"}.get(status, "❓")
+        status_emoji = self._STATUS_EMOJI.get(status, "❓")
         
-        message = f"{status_emoji} {service_name} is {status}"
+        parts = [f"{status_emoji} {service_name} is {status}"]
         if details:
-            message += f"\n\n{details}"
+            parts += ("", details)
+        message = "\n".join(parts)
 
         return self.send_notification(
             message=message,
@@ -276,48 +359,79 @@ Reason: {reasoning}"""
 
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Get current rate limit status"""
-        now = datetime.now()
-        cutoff = now - timedelta(hours=1)
-        recent_notifications = [t for t in self._notification_history if t > cutoff]
+        with self._rate_lock:
+            notifications_this_hour = self._count_recent(time.monotonic())
+            rate_limited = notifications_this_hour >= self.rate_limit_per_hour
         
         return {
             "enabled": self.enabled,
             "configured": bool(self.api_token and self.user_token),
-            "notifications_this_hour": len(recent_notifications),
+            "notifications_this_hour": notifications_this_hour,
             "rate_limit": self.rate_limit_per_hour,
-            "rate_limited": self._is_rate_limited(),
+            "rate_limited": rate_limited,
             "confidence_threshold": self.confidence_threshold,
             "risk_warnings_enabled": self.risk_warnings_enabled
         }
 
 
-# Global instance
-pushover_notifier = PushoverNotifier()
+# Global instance, created on first use so importing this module does not load config
+_notifier: Optional[PushoverNotifier] = None
+_notifier_lock = threading.Lock()
+
+
+def _get_notifier() -> PushoverNotifier:
+    """Return the shared PushoverNotifier, creating it on first call"""
+    global _notifier
+    if _notifier is None:
+        with _notifier_lock:
+            if _notifier is None:
+                _notifier = PushoverNotifier()
+    return _notifier
+
+
+def __getattr__(name):
+    # Keep ``pushover_notifier`` importable as a module attribute without building it at import
+    if name == "pushover_notifier":
+        return _get_notifier()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def send_trading_signal(signal: str, confidence: int, title: str, reasoning: str,
                        etfs: Optional[List[str]] = None, article_url: Optional[str] = None,
-                       risk_factors: Optional[List[str]] = None) -> bool:
-    """Convenience function to send trading signals"""
-    return pushover_notifier.send_trading_signal(
-        signal, confidence, title, reasoning, etfs, article_url, risk_factors
-    )
+                       risk_factors: Optional[List[str]] = None,
+                       blocking: bool = True) -> Union[bool, "Future[bool]"]:
+    """Convenience function to send trading signals; blocking=False returns a Future at once"""
+    args = (signal, confidence, title, reasoning, etfs, article_url, risk_factors)
+    if not blocking:
+        return _get_notifier()._executor.submit(_get_notifier().send_trading_signal, *args)
+    return _get_notifier().send_trading_signal(*args)
+
+
+def send_trading_signals_batch(signals: List[Dict[str, Any]]) -> List[bool]:
+    """Convenience function to send several trading signals concurrently"""
+    return _get_notifier().send_trading_signals_batch(signals)
 
 
 def send_risk_warning(warning_type: str, message: str, 
                      affected_symbols: Optional[List[str]] = None,
-                     severity: str = "medium") -> bool:
-    """Convenience function to send risk warnings"""
-    return pushover_notifier.send_risk_warning(
-        warning_type, message, affected_symbols, severity
-    )
+                     severity: str = "medium",
+                     blocking: bool = True) -> Union[bool, "Future[bool]"]:
+    """Convenience function to send risk warnings; blocking=False returns a Future at once"""
+    args = (warning_type, message, affected_symbols, severity)
+    if not blocking:
+        return _get_notifier()._executor.submit(_get_notifier().send_risk_warning, *args)
+    return _get_notifier().send_risk_warning(*args)
 
 
-def send_system_alert(service_name: str, status: str, details: Optional[str] = None) -> bool:
-    """Convenience function to send system alerts"""
-    return pushover_notifier.send_system_alert(service_name, status, details)
+def send_system_alert(service_name: str, status: str, details: Optional[str] = None,
+                      blocking: bool = True) -> Union[bool, "Future[bool]"]:
+    """Convenience function to send system alerts; blocking=False returns a Future at once"""
+    args = (service_name, status, details)
+    if not blocking:
+        return _get_notifier()._executor.submit(_get_notifier().send_system_alert, *args)
+    return _get_notifier().send_system_alert(*args)
 
 
 def test_pushover() -> bool:
     """Convenience function to test Pushover connectivity"""
-    return pushover_notifier.test_connection() 
\ No newline at end of file
+    return _get_notifier().test_connection() 
\ No newline at end of file
@@ -2,17 +2,245 @@
 Reusable Pushover Utility
 Matches the pattern from server_monitor.py for consistent notification handling
 """
+import atexit
+import bisect
+import functools
+import logging
+import random
+import threading
+import time
 import requests
 import os
+import sys
+from collections import deque
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-load_dotenv()
+try:
+    from ..core.utils.http_utils import json_body
+except ImportError:
+    # Fallback for direct execution
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.core.utils.http_utils import json_body
 
-PUSHOVER_USER_KEY = os.getenv("PUSHOVER_USER")
-PUSHOVER_API_TOKEN = os.getenv("PUSHOVER_TOKEN")
+logger = logging.getLogger(__name__)
 
+PUSHOVER_MESSAGES_URL = "https://api.pushover.net/1/messages.json"
+PUSHOVER_BACKOFF_MAX = 30.0
 
-def send_pushover_notification(message, title="Alert", priority=0, url=None, url_title=None):
+# Pushover rejects longer fields outright, which retrying cannot fix
+PUSHOVER_MESSAGE_LIMIT = 1024
+PUSHOVER_TITLE_LIMIT = 250
+
+# Seconds throttled alerts wait to be sent together as a digest
+PUSHOVER_DIGEST_DELAY = 30.0
+
+# Returned instead of True when an alert was throttled into the digest rather than sent
+QUEUED = "queued"
+
+# Text indicators instead of emojis for better compatibility
+_SIGNAL_INDICATORS = {"Bullish": "↗ BULLISH", "Bearish": "↘ BEARISH", "Neutral": "→ NEUTRAL"}
+
+# Minimum confidence for each energy alert tier; anything below the first is not sent
+_ALERT_TIER_FLOORS = (7, 8, 9)
+_ALERT_TIERS = ("STANDARD", "HIGH", "CRITICAL")
+
+
+@functools.lru_cache(maxsize=1)
+def _env():
+    """Parse .env once, on first use, and return (user key, API token)"""
+    load_dotenv()
+    return os.getenv("PUSHOVER_USER"), os.getenv("PUSHOVER_TOKEN")
+
+
+class _JitteredRetry(Retry):
+    """Retry with a capped exponential backoff plus up to 0.5s of jitter between attempts"""
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(backoff + random.uniform(0, 0.5), PUSHOVER_BACKOFF_MAX)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Shared session so consecutive alerts reuse the TLS connection to api.pushover.net.
+
+    429/5xx responses are retried with backoff, waiting for Retry-After when Pushover sends it.
+    """
+    _env()
+    session = requests.Session()
+    # Messages are posted as JSON bodies rather than form-encoded fields
+    session.headers["Content-Type"] = "application/json"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=_JitteredRetry(
+                total=int(os.getenv("PUSHOVER_MAX_RETRIES", "3")),
+                backoff_factor=1.0,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    atexit.register(session.close)
+    # Registered after close so the digest goes out first (atexit is LIFO)
+    atexit.register(_flush_deferred_at_exit)
+    return session
+
+
+class _TokenBucket:
+    """Adaptive token bucket: refill speeds up after successful sends and halves on 429"""
+
+    def __init__(self, capacity=10, rate=1 / 6):
+        self.capacity = capacity
+        self.rate = rate
+        self._base_rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Take one token, returning False when the bucket is empty"""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def on_success(self):
+        with self._lock:
+            self._refill()
+            self.rate = min(self._base_rate * 2, self.rate + self._base_rate / 10)
+
+    def on_throttled(self):
+        with self._lock:
+            self._refill()
+            self.rate = max(self._base_rate / 8, self.rate / 2)
+
+
+_BUCKET = _TokenBucket()
+
+# Normal/quiet alerts refused by the bucket, as (title, message, url); sent as a digest by
+# a timer once the bucket has a token again, and at exit
+_DEFERRED = deque()
+_deferred_lock = threading.Lock()
+_flush_timer = None
+
+
+def _truncate(data, field, limit):
+    """Cut an over-long field to fit Pushover's limit, ending it with '...'"""
+    text = data[field]
+    if len(text) > limit:
+        logger.warning("Pushover %s truncated from %d to %d characters", field, len(text), limit)
+        data[field] = text[: limit - 3] + "..."
+
+
+def _deliver(data):
+    """POST one message to Pushover and feed the outcome back into the token bucket"""
+    _truncate(data, "message", PUSHOVER_MESSAGE_LIMIT)
+    _truncate(data, "title", PUSHOVER_TITLE_LIMIT)
+    title = data["title"]
+    try:
+        response = _get_session().post(
+            PUSHOVER_MESSAGES_URL, data=json_body(data), timeout=(3.05, 10)
+        )
+        if response.status_code == 200:
+            _BUCKET.on_success()
+            logger.info("Pushover sent: %s", title)
+            return True
+        else:
+            if response.status_code == 429:
+                _BUCKET.on_throttled()
+            logger.error("Pushover failed: %s", response.text)
+            return False
+    except Exception as e:
+        logger.error("Error sending Pushover notification: %s", e)
+        return False
+
+
+def _schedule_flush():
+    """Start the digest timer unless one is already pending; caller holds _deferred_lock"""
+    global _flush_timer
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(PUSHOVER_DIGEST_DELAY, _flush_deferred)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _digest_messages(alerts):
+    """Pack deferred alerts into as few messages as fit Pushover's length limit"""
+    messages = []
+    current = ""
+    for title, text, url in alerts:
+        entry = f"{title}: {text}\n{url}" if url else f"{title}: {text}"
+        if current and len(current) + 2 + len(entry) > PUSHOVER_MESSAGE_LIMIT:
+            messages.append(current)
+            current = entry
+        else:
+            current = f"{current}\n\n{entry}" if current else entry
+    if current:
+        messages.append(current)
+    return messages
+
+
+def _flush_deferred(force=False):
+    """Send the deferred alerts as digest notifications, split to fit the message limit.
+
+    The timer waits for a token before sending and tries again later if the bucket is still
+    empty; the exit flush (force=True) sends regardless.
+    """
+    global _flush_timer
+    with _deferred_lock:
+        _flush_timer = None
+        if not _DEFERRED:
+            return
+        if not force and not _BUCKET.acquire():
+            _schedule_flush()
+            return
+        alerts = list(_DEFERRED)
+        _DEFERRED.clear()
+
+    user_key, api_token = _env()
+    parts = _digest_messages(alerts)
+    for number, message in enumerate(parts, 1):
+        title = f"MarketMan digest ({len(alerts)} alerts)"
+        if len(parts) > 1:
+            title = f"MarketMan digest {number}/{len(parts)} ({len(alerts)} alerts)"
+        data = {
+            "token": api_token,
+            "user": user_key,
+            "message": message,
+            "title": title,
+            "priority": -1,
+        }
+        if not _deliver(data):
+            logger.error("Pushover digest part %d/%d could not be sent", number, len(parts))
+
+
+def _flush_deferred_at_exit():
+    """Cancel the digest timer and send whatever is still deferred"""
+    with _deferred_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+    _flush_deferred(force=True)
+
+
+def send_pushover_notification(
+    message, title="Alert", priority=0, url=None, url_title=None, queue_if_throttled=True
+):
     """
     Send notification via Pushover (text only - images are for Notion)
 
@@ -22,17 +250,30 @@ def send_pushover_notification(message, title="Alert", priority=0, url=None, url
         priority (int): -2 (silent), -1 (quiet), 0 (normal), 1 (high), 2 (emergency)
         url (str): Optional URL to include
         url_title (str): Optional title for the URL
+        queue_if_throttled (bool): Put a throttled alert in the digest instead of failing
 
     Returns:
-        bool: True if successful, False otherwise
+        True if sent, QUEUED if throttled into the digest, False otherwise
     """
-    if not PUSHOVER_USER_KEY or not PUSHOVER_API_TOKEN:
-        print("⚠️  Pushover credentials not set.")
+    user_key, api_token = _env()
+    if not user_key or not api_token:
+        logger.warning("Pushover credentials not set.")
         return False
 
+    # High and emergency alerts always go out; the rest wait for a token or join the digest
+    if priority <= 0 and not _BUCKET.acquire():
+        if not queue_if_throttled:
+            logger.warning("Pushover throttled: %s", title)
+            return False
+        with _deferred_lock:
+            _DEFERRED.append((title, message, url))
+            _schedule_flush()
+        logger.info("Pushover deferred to digest: %s", title)
+        return QUEUED
+
     data = {
-        "token": PUSHOVER_API_TOKEN,
-        "user": PUSHOVER_USER_KEY,
+        "token": api_token,
+        "user": user_key,
         "message": message,
         "title": title,
         "priority": priority,
@@ -44,17 +285,7 @@ def send_pushover_notification(message, title="Alert", priority=0, url=None, url
     if url_title:
         data["url_title"] = url_title
 
-    try:
-        response = requests.post("https://api.pushover.net/1/messages.json", data=data)
-        if response.status_code == 200:
-            print(f"✅ Pushover sent: {title}")
-            return True
-        else:
-            print(f"❌ Pushover failed: {response.text}")
-            return False
-    except Exception as e:
-        print(f"🔥 Error sending Pushover notification: {e}")
-        return False
+    return _deliver(data)
 
 
 def send_energy_alert(
@@ -73,44 +304,39 @@ def send_energy_alert(
         analysis (dict): Full analysis (not used in alert to keep it concise)
 
     Returns:
-        bool: True if sent successfully
+        True if sent, QUEUED if throttled into the digest, False otherwise
     """
-    # Determine priority based on confidence - keep it professional, not alarming
-    if confidence >= 9:
-        priority = 0  # Normal priority (even for 9/10)
-        alert_level = "CRITICAL"
-    elif confidence >= 8:
-        priority = 0  # Normal priority
-        alert_level = "HIGH"
-    elif confidence >= 7:
-        priority = 0  # Normal priority
-        alert_level = "STANDARD"
-    else:
+    if confidence < _ALERT_TIER_FLOORS[0]:
         return False  # Don't send low confidence alerts
 
-    # Use text indicators instead of emojis for better compatibility
-    signal_indicator = {"Bullish": "↗ BULLISH", "Bearish": "↘ BEARISH", "Neutral": "→ NEUTRAL"}.get(
-        signal, "? UNKNOWN"
-    )
-
-    # Build concise message - keep it short and actionable
-    message = f"""{signal_indicator} Signal ({confidence}/10)
+    # Determine alert tier based on confidence
+    alert_level = _ALERT_TIERS[bisect.bisect_right(_ALERT_TIER_FLOORS, confidence) - 1]
+    # Keep it professional, not alarming: normal priority for every tier (even 9/10)
+    priority = 0
 
-{title[:80]}{'...' if len(title) > 80 else ''}
+    signal_indicator = _SIGNAL_INDICATORS.get(signal, "? UNKNOWN")
 
-Reason: {reasoning}"""
-
-    # Add affected ETFs if available - use simple text formatting
-    if etfs and len(etfs) > 0:
-        etf_list = ", ".join(etfs[:4])  # Show max 4 ETFs
-        if len(etfs) > 4:
-            etf_list += f" +{len(etfs)-4} more"
-        message += f"\n\nETFs: {etf_list}"
+    # Build concise message - keep it short and actionable
+    short_title = title if len(title) <= 80 else f"{title[:80]}..."
+    parts = [
+        f"{signal_indicator} Signal ({confidence}/10)",
+        "",
+        short_title,
+        "",
+        f"Reason: {reasoning}",
+    ]
+
+    # Add affected ETFs if available - use simple text formatting (max 4 shown)
+    if etfs:
+        n = len(etfs)
+        head = ", ".join(etfs[:4])
+        parts += ("", f"ETFs: {head}" if n <= 4 else f"ETFs: {head} +{n - 4} more")
 
     alert_title = f"MarketMan {alert_level}"
 
     return send_pushover_notification(
-        message=message.strip(),
+        # Trailing whitespace from the reasoning or ETF names is still trimmed
+        message="\n".join(parts).rstrip(),
         title=alert_title,
         priority=priority,
         url=article_url,
@@ -176,6 +402,8 @@ def test_coaching_alert():
 if __name__ == "__main__":
     import sys
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
     if len(sys.argv) > 1 and sys.argv[1] == "coaching":
         # Test the enhanced coaching alert
         print("🧪 Testing enhanced coaching-style alert...")
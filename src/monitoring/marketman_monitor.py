@@ -11,14 +11,19 @@ import time
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from datetime import datetime
 
+try:
+    import icmplib
+except ImportError:  # optional: unprivileged in-process ICMP instead of spawning ping
+    icmplib = None
+
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from integrations.pushover_utils import send_system_alert, send_pushover_notification
-from core.signals.news_gpt_analyzer import NewsAnalyzer
-from integrations.gmail_organizer import GmailOrganizer
 import logging
 
 # Set up logging
@@ -35,15 +40,26 @@ class SystemMonitor:
             "8.8.8.8",  # Google DNS as backup
             "1.1.1.1",  # Cloudflare DNS as backup
         ]
+        self._use_icmplib = icmplib is not None
 
     def ping_host(self, host, timeout=5):
         """Ping a host and return True if reachable"""
+        if self._use_icmplib:
+            try:
+                return icmplib.ping(host, count=1, timeout=timeout, privileged=False).is_alive
+            except icmplib.SocketPermissionError as e:
+                # Unprivileged ICMP is off (net.ipv4.ping_group_range); use the ping command
+                logger.warning(f"Unprivileged ICMP not permitted ({e}); falling back to ping")
+                self._use_icmplib = False
+            except (icmplib.ICMPLibError, OSError) as e:
+                logger.debug(f"icmplib could not ping {host} ({e}); falling back to ping")
+
         try:
-            # Use ping command (works on Linux)
+            # Use ping command (works on Linux); only the exit status matters
             result = subprocess.run(
                 ["ping", "-c", "1", "-W", str(timeout), host],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=timeout + 2,
             )
             return result.returncode == 0
@@ -53,20 +69,31 @@ class SystemMonitor:
 
     def check_all_hosts(self):
         """Check all hosts and return status"""
-        results = {}
-        for host in self.hosts:
-            is_up = self.ping_host(host)
-            results[host] = is_up
+        # Pings are pure I/O wait, so run them together; the check takes as long as the slowest
+        # A host listed twice is only pinged once per check
+        hosts = list(dict.fromkeys(self.hosts))
+        with ThreadPoolExecutor(max_workers=max(1, len(hosts))) as pool:
+            results = dict(zip(hosts, pool.map(self.ping_host, hosts)))
 
+        for host, is_up in results.items():
             status = "UP" if is_up else "DOWN"
             logger.info(f"{host}: {status}")
 
-            # Send alert for down hosts
-            if not is_up:
+        # One alert for every down host rather than a notification per host
+        down = [host for host, is_up in results.items() if not is_up]
+        if down:
+            checked_at = datetime.now().strftime("%H:%M:%S")
+            if len(down) == 1:
+                send_system_alert(
+                    service_name=down[0],
+                    status="DOWN",
+                    details=f"Host unreachable at {checked_at}",
+                )
+            else:
                 send_system_alert(
-                    service_name=host,
+                    service_name="Infrastructure",
                     status="DOWN",
-                    details=f"Host unreachable at {datetime.now().strftime('%H:%M:%S')}",
+                    details="\n".join(f"{host} unreachable at {checked_at}" for host in down),
                 )
 
         return results
@@ -77,15 +104,38 @@ class MarketManMonitor:
 
     def __init__(self):
         self.system_monitor = SystemMonitor()
-        self.news_analyzer = NewsAnalyzer()
-        self.gmail_organizer = GmailOrganizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Only log out of Gmail if a news check actually built the analyzer
+        news_analyzer = self.__dict__.get("news_analyzer")
+        if news_analyzer is not None:
+            news_analyzer.__exit__(exc_type, exc_value, traceback)
+
+    # The news and Gmail clients pull in heavy API libraries, so they are only imported and
+    # built when a check actually needs them (not for --system-only or --test runs)
+    @cached_property
+    def news_analyzer(self):
+        from core.signals.news_gpt_analyzer import NewsAnalyzer
+
+        # Entered here and exited with the monitor, so the IMAP connection is reused
+        # across --loop runs
+        return NewsAnalyzer().__enter__()
+
+    @cached_property
+    def gmail_organizer(self):
+        from integrations.gmail_organizer import GmailOrganizer
+
+        return GmailOrganizer()
 
     def run_system_check(self):
         """Run system monitoring check"""
         logger.info("🖥️  Running system check...")
         try:
             results = self.system_monitor.check_all_hosts()
-            up_count = sum(1 for status in results.values() if status)
+            up_count = sum(results.values())  # ping results are bools
             total_count = len(results)
 
             logger.info(f"System check complete: {up_count}/{total_count} hosts up")
@@ -126,17 +176,18 @@ class MarketManMonitor:
         """Run both system and news checks"""
         logger.info("🚀 Starting MarketMan full check...")
 
-        # System monitoring
-        system_results = self.run_system_check()
-
-        # Gmail cleanup (every few runs to avoid rate limits)
-        gmail_result = self.run_gmail_cleanup()
-
-        # News analysis
-        self.run_news_check()
+        # System monitoring, Gmail cleanup and news analysis are independent I/O-bound checks,
+        # so run them side by side; only the summary below needs all three results
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="marketman-check") as pool:
+            system_future = pool.submit(self.run_system_check)
+            gmail_future = pool.submit(self.run_gmail_cleanup)
+            news_future = pool.submit(self.run_news_check)
+            system_results = system_future.result()
+            gmail_result = gmail_future.result()
+            news_future.result()
 
         # Summary notification for successful run
-        up_hosts = sum(1 for status in system_results.values() if status)
+        up_hosts = sum(system_results.values())
         total_hosts = len(system_results)
 
         gmail_msg = ""
@@ -165,47 +216,57 @@ def main():
 
     args = parser.parse_args()
 
-    monitor = MarketManMonitor()
-
-    if args.test:
-        print("🧪 Testing Pushover connectivity...")
-        from pushover_utils import test_pushover
-
-        success = test_pushover()
-        sys.exit(0 if success else 1)
-
-    if args.loop:
-        logger.info(f"🔄 Starting continuous monitoring (every {args.loop} minutes)")
-        while True:
-            try:
-                if args.system_only:
-                    monitor.run_system_check()
-                elif args.news_only:
-                    monitor.run_news_check()
-                elif args.gmail_only:
-                    monitor.run_gmail_cleanup()
-                else:
-                    monitor.run_full_check()
-
-                logger.info(f"💤 Sleeping for {args.loop} minutes...")
-                time.sleep(args.loop * 60)
-
-            except KeyboardInterrupt:
-                logger.info("👋 Stopping monitor...")
-                break
-            except Exception as e:
-                logger.error(f"Monitor error: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
-    else:
-        # Single run
-        if args.system_only:
-            monitor.run_system_check()
-        elif args.news_only:
-            monitor.run_news_check()
-        elif args.gmail_only:
-            monitor.run_gmail_cleanup()
+    with MarketManMonitor() as monitor:
+        if args.test:
+            print("🧪 Testing Pushover connectivity...")
+            from pushover_utils import test_pushover
+
+            success = test_pushover()
+            sys.exit(0 if success else 1)
+
+        if args.loop:
+            logger.info(f"🔄 Starting continuous monitoring (every {args.loop} minutes)")
+            interval = args.loop * 60
+            # Runs start on a fixed cadence from here rather than drifting by each check's
+            # duration
+            next_run = time.monotonic()
+            while True:
+                try:
+                    if args.system_only:
+                        monitor.run_system_check()
+                    elif args.news_only:
+                        monitor.run_news_check()
+                    elif args.gmail_only:
+                        monitor.run_gmail_cleanup()
+                    else:
+                        monitor.run_full_check()
+
+                    next_run += interval
+                    now = time.monotonic()
+                    if next_run < now:
+                        # The check overran its slot; start over from now instead of bursting
+                        next_run = now
+                    wait = next_run - now
+                    logger.info(f"💤 Sleeping for {wait / 60:.1f} minutes...")
+                    time.sleep(wait)
+
+                except KeyboardInterrupt:
+                    logger.info("👋 Stopping monitor...")
+                    break
+                except Exception as e:
+                    logger.error(f"Monitor error: {e}")
+                    time.sleep(60)  # Wait 1 minute before retrying
+                    next_run = time.monotonic()
         else:
-            monitor.run_full_check()
+            # Single run
+            if args.system_only:
+                monitor.run_system_check()
+            elif args.news_only:
+                monitor.run_news_check()
+            elif args.gmail_only:
+                monitor.run_gmail_cleanup()
+            else:
+                monitor.run_full_check()
 
 
 if __name__ == "__main__":
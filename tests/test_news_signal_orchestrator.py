@@ -0,0 +1,161 @@
+"""
+Tests for the news signal orchestrator filtering and reporting helpers
+"""
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(PROJECT_ROOT), str(PROJECT_ROOT / "src")]
+
+# The orchestrator builds an OpenAI client at import time
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from core.signals.etf_signal_engine import generate_tactical_explanation
+from core.signals.news_signal_orchestrator import (
+    check_technical_support,
+    filter_high_conviction_etfs,
+    precompute_support_mask,
+)
+from core.journal.report_consolidator import create_consolidated_signal_report
+
+
+@pytest.mark.skipif(
+    os.getenv("OPENAI_API_KEY") == "test-key", reason="requires a real OpenAI API key"
+)
+def test_tactical_explanation():
+    """Test the tactical explanation generation"""
+    test_analysis = {
+        "signal": "Bullish",
+        "confidence": 8,
+        "affected_etfs": ["QQQ", "TQQQ", "VTI"],
+        "reasoning": "Strong earnings beats from tech giants driving sector momentum",
+        "sector": "Technology",
+    }
+
+    test_title = "Tech Giants Report Blowout Earnings, AI Revenue Surges"
+
+    explanation = generate_tactical_explanation(test_analysis, test_title)
+
+    assert explanation is not None
+
+
+def test_consolidated_reporting():
+    """Test the consolidated reporting with multiple mock analyses"""
+    mock_analyses = [
+        {
+            "signal": "Bullish",
+            "confidence": 9,
+            "affected_etfs": ["BOTZ", "ROBO", "ARKQ"],
+            "reasoning": "Strong AI sector momentum with institutional inflows",
+            "sector": "AI",
+            "market_snapshot": {
+                "BOTZ": {"price": 31.42, "volume": 359773},
+                "ROBO": {"price": 57.93, "volume": 32891},
+                "ARKQ": {"price": 85.74, "volume": 103217},
+            },
+            "source_article": {"title": "AI ETFs See Record Inflows", "search_term": "AI ETF"},
+        },
+        {
+            "signal": "Bullish",
+            "confidence": 8,
+            "affected_etfs": ["ITA", "XAR", "DFEN"],
+            "reasoning": "Defense spending increases drive sector optimism",
+            "sector": "Defense",
+            "market_snapshot": {
+                "ITA": {"price": 181.76, "volume": 726277},
+                "XAR": {"price": 200.79, "volume": 111597},
+                "DFEN": {"price": 46.63, "volume": 528594},
+            },
+            "source_article": {"title": "Defense Budget Increases", "search_term": "defense ETF"},
+        },
+    ]
+
+    consolidated_report = create_consolidated_signal_report(
+        mock_analyses, datetime.now().isoformat()
+    )
+
+    assert consolidated_report
+    assert consolidated_report["executive_summary"]
+    assert consolidated_report["market_sentiment"]
+    assert consolidated_report["conviction_level"] == "High"
+
+
+def test_etf_filtering():
+    """Test the ETF filtering and ranking system"""
+    mock_analyses = [
+        {
+            "confidence": 8,
+            "signal": "Bullish",
+            "affected_etfs": ["BOTZ", "XLK"],  # BOTZ is specialized, XLK is broad
+            "sector": "AI",
+        },
+        {
+            "confidence": 7,
+            "signal": "Bullish",
+            "affected_etfs": ["BOTZ", "ROBO"],  # BOTZ mentioned again (frequency)
+            "sector": "AI",
+        },
+        {
+            "confidence": 6,
+            "signal": "Bullish",
+            "affected_etfs": ["BOTZ"],  # BOTZ mentioned third time
+            "sector": "AI",
+        },
+        {
+            "confidence": 8,
+            "signal": "Bullish",
+            "affected_etfs": ["XLK"],  # XLK mentioned second time but still broad
+            "sector": "Technology",
+        },
+    ]
+
+    filtered_etfs = filter_high_conviction_etfs(mock_analyses, min_mentions=2)
+
+    # BOTZ (specialized, 3 mentions) qualifies; XLK (broad) and ROBO (1 mention) do not
+    assert [etf for etf, _ in filtered_etfs] == ["BOTZ"]
+    botz = filtered_etfs[0][1]
+    assert botz["mentions"] == 3
+    assert botz["cumulative_confidence"] == 21
+    assert botz["avg_confidence"] == 7
+    assert len(botz["analyses"]) == 3
+
+
+def test_etf_filtering_falls_back_to_broad_market():
+    """Broad-market funds are only used when no specialized ETF qualifies"""
+    mock_analyses = [
+        {"confidence": 8, "affected_etfs": ["XLK", "BOTZ"]},
+        {"confidence": 6, "affected_etfs": ["XLK"]},
+    ]
+
+    filtered_etfs = filter_high_conviction_etfs(mock_analyses, min_mentions=2)
+
+    assert [etf for etf, _ in filtered_etfs] == ["XLK"]
+    assert filter_high_conviction_etfs([], min_mentions=2) == []
+
+
+def test_technical_filtering():
+    """Test technical support filtering"""
+    mock_market_data = {
+        "GOOD_ETF": {"price": 100.0, "change_pct": 1.0},  # ~2% support gap - acceptable
+        "BAD_ETF": {"price": 100.0, "change_pct": 5.0},  # ~11% support gap - overextended
+        "NO_DATA": {},  # No price data - allowed through
+    }
+
+    results = {
+        etf: check_technical_support(etf, {etf: data}) for etf, data in mock_market_data.items()
+    }
+
+    assert results["GOOD_ETF"][0] is True
+    assert results["BAD_ETF"][0] is False
+    assert results["NO_DATA"] == (True, 0.0)
+    assert check_technical_support("MISSING", mock_market_data) == (True, 0.0)
+
+    # The vectorized mask must agree with the scalar check
+    mask = precompute_support_mask(mock_market_data)
+    for etf, (acceptable, gap) in results.items():
+        assert mask[etf][0] == acceptable
+        assert mask[etf][1] == pytest.approx(gap)